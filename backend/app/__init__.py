@@ -1,34 +1,69 @@
 from flask import Flask
+import click
 from flask_cors import CORS
 from flask_sqlalchemy import SQLAlchemy
 from flask_jwt_extended import JWTManager
 from config import config
+from app.utils.cache import ResponseCache
+from app.utils.passwords import PasswordHasher
+from app.utils.identity import IdentityCache
+from app.utils.events import EventBroker
 import os
+import sys
 
 db = SQLAlchemy()
 jwt = JWTManager()
+cache = ResponseCache()
+password_hasher = PasswordHasher()
+identity_cache = IdentityCache()
+events = EventBroker()
+
+
+def init_migrations(app):
+    """Registra o Flask-Migrate na aplicação (comandos `flask db`, upgrade())"""
+    from flask_migrate import Migrate
+    Migrate(app, db, render_as_batch=True)
+
 
 def create_app(config_name='development'):
     """Factory para criar a aplicação Flask"""
+    from app.utils.database import prepare_engine_options, configure_engine, check_schema_version
+    from app.utils.instrumentation import init_instrumentation
+    
     app = Flask(__name__)
     app.config.from_object(config[config_name])
     
     # Inicializar extensões
+    prepare_engine_options(app)
     db.init_app(app)
+    configure_engine(app)
+    with app.app_context():
+        init_instrumentation(app, db.engine)
+    # O Flask-Migrate importa o Alembic (~150 ms a mais na partida): só é
+    # registrado na CLI do Flask (comandos `flask db`) e em scripts que já
+    # importaram flask_migrate; servidores WSGI não precisam dele
+    if click.get_current_context(silent=True) is not None or 'flask_migrate' in sys.modules:
+        init_migrations(app)
     jwt.init_app(app)
-    CORS(app, resources={r"/api/*": {"origins": app.config['CORS_ORIGINS']}})
+    identity_cache.init_app(app, jwt, events)
+    cache.init_app(app)
+    password_hasher.init_app(app)
+    events.init_app(app)
+    # Retry-After: o frontend (outra origem) repete o login recusado com 503
+    CORS(app, resources={r"/api/*": {"origins": app.config['CORS_ORIGINS']}}, expose_headers=['Retry-After'])
     
     # Registrar blueprints
-    from app.routes import main_bp
+    from app.routes import main_bp, metrics_bp
     app.register_blueprint(main_bp)
+    app.register_blueprint(metrics_bp)
     
     # Criar diretório instance se não existir
     instance_path = app.instance_path
     if not os.path.exists(instance_path):
         os.makedirs(instance_path)
     
-    # Criar tabelas do banco
-    with app.app_context():
-        db.create_all()
+    # O schema é criado e atualizado pelas migrations (flask db upgrade);
+    # aqui se confere a revisão do banco (ou se aplicam as pendentes)
+    check_schema_version(app)
     
-    return app
\ No newline at end of file
+    return app
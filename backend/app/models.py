@@ -1,5 +1,8 @@
 from datetime import datetime
-from app import db
+from sqlalchemy import event
+from app import db, password_hasher
+from app.utils.search import install_search
+from app.utils.changes import install_change_log
 
 
 class Projeto(db.Model):
@@ -16,11 +19,21 @@ class Projeto(db.Model):
     tipos_processamento = db.Column(db.String(200))
     observacao = db.Column(db.Text)
     created_at = db.Column(db.DateTime, default=datetime.utcnow)
+    updated_at = db.Column(db.DateTime, default=datetime.utcnow, onupdate=datetime.utcnow, index=True)
     
     # Relacionamentos
     squads = db.relationship('Squad', secondary='projeto_squad', back_populates='projetos')
     atividades = db.relationship('Atividade', back_populates='projeto', cascade='all, delete-orphan')
     
+    # Contagem preenchida pelas consultas agregadas (ver app/utils/queries.py)
+    total_atividades = db.query_expression()
+    
+    def contar_atividades(self):
+        """Conta as atividades sem carregar a coleção inteira"""
+        if self.total_atividades is not None:
+            return self.total_atividades
+        return Atividade.query.filter_by(projeto_id=self.id).count()
+    
     def to_dict(self):
         return {
             'id': self.id,
@@ -34,8 +47,9 @@ class Projeto(db.Model):
             'tipos_processamento': self.tipos_processamento,
             'observacao': self.observacao,
             'squads': [{'id': s.id, 'nome': s.nome} for s in self.squads],
-            'total_atividades': len(self.atividades),
-            'created_at': self.created_at.isoformat() if self.created_at else None
+            'total_atividades': self.contar_atividades(),
+            'created_at': self.created_at.isoformat() if self.created_at else None,
+            'updated_at': self.updated_at.isoformat() if self.updated_at else None
         }
 
 
@@ -43,34 +57,63 @@ class Squad(db.Model):
     __tablename__ = 'squads'
     
     id = db.Column(db.Integer, primary_key=True)
-    nome = db.Column(db.String(100), nullable=False)
+    nome = db.Column(db.String(100), nullable=False, index=True)
     descricao = db.Column(db.Text)
     created_at = db.Column(db.DateTime, default=datetime.utcnow)
+    updated_at = db.Column(db.DateTime, default=datetime.utcnow, onupdate=datetime.utcnow, index=True)
     
     # Relacionamentos
     projetos = db.relationship('Projeto', secondary='projeto_squad', back_populates='squads')
     atividades = db.relationship('Atividade', back_populates='squad')
     
+    # Contagens preenchidas pelas consultas agregadas (ver app/utils/queries.py)
+    total_projetos = db.query_expression()
+    total_atividades = db.query_expression()
+    
+    def contar_projetos(self):
+        """Conta os projetos sem carregar a coleção inteira"""
+        if self.total_projetos is not None:
+            return self.total_projetos
+        return db.session.query(projeto_squad).filter_by(squad_id=self.id).count()
+    
+    def contar_atividades(self):
+        """Conta as atividades sem carregar a coleção inteira"""
+        if self.total_atividades is not None:
+            return self.total_atividades
+        return Atividade.query.filter_by(squad_id=self.id).count()
+    
     def to_dict(self):
         return {
             'id': self.id,
             'nome': self.nome,
             'descricao': self.descricao,
-            'total_projetos': len(self.projetos),
-            'total_atividades': len(self.atividades),
-            'created_at': self.created_at.isoformat() if self.created_at else None
+            'total_projetos': self.contar_projetos(),
+            'total_atividades': self.contar_atividades(),
+            'created_at': self.created_at.isoformat() if self.created_at else None,
+            'updated_at': self.updated_at.isoformat() if self.updated_at else None
         }
 
 
 # Tabela associativa muitos-para-muitos
 projeto_squad = db.Table('projeto_squad',
     db.Column('projeto_id', db.Integer, db.ForeignKey('projetos.id'), primary_key=True),
-    db.Column('squad_id', db.Integer, db.ForeignKey('squads.id'), primary_key=True)
+    db.Column('squad_id', db.Integer, db.ForeignKey('squads.id'), primary_key=True),
+    # A chave primária começa por projeto_id; consultas por squad usam este índice
+    db.Index('ix_projeto_squad_squad_id', 'squad_id')
 )
 
 
 class Atividade(db.Model):
     __tablename__ = 'atividades'
+    __table_args__ = (
+        # Filtros da listagem + ordenação por created_at desc
+        db.Index('ix_atividades_projeto_id_created_at', 'projeto_id', 'created_at'),
+        db.Index('ix_atividades_squad_id_created_at', 'squad_id', 'created_at'),
+        db.Index('ix_atividades_status_prioridade_created_at', 'status', 'prioridade', 'created_at'),
+        db.Index('ix_atividades_created_at', 'created_at'),
+        # Janela de datas da timeline (ver routes/timeline.py)
+        db.Index('ix_atividades_fim_programado_inicio_programado', 'fim_programado', 'inicio_programado'),
+    )
     
     id = db.Column(db.Integer, primary_key=True)
     titulo = db.Column(db.String(200), nullable=False)
@@ -84,6 +127,7 @@ class Atividade(db.Model):
     projeto_id = db.Column(db.Integer, db.ForeignKey('projetos.id'), nullable=False)
     squad_id = db.Column(db.Integer, db.ForeignKey('squads.id'), nullable=False)
     created_at = db.Column(db.DateTime, default=datetime.utcnow)
+    updated_at = db.Column(db.DateTime, default=datetime.utcnow, onupdate=datetime.utcnow, index=True)
     
     # Relacionamentos
     projeto = db.relationship('Projeto', back_populates='atividades')
@@ -102,7 +146,8 @@ class Atividade(db.Model):
             'status': self.status,
             'projeto': {'id': self.projeto.id, 'nome': self.projeto.nome},
             'squad': {'id': self.squad.id, 'nome': self.squad.nome},
-            'created_at': self.created_at.isoformat() if self.created_at else None
+            'created_at': self.created_at.isoformat() if self.created_at else None,
+            'updated_at': self.updated_at.isoformat() if self.updated_at else None
         }
 
 
@@ -110,22 +155,25 @@ class Usuario(db.Model):
     __tablename__ = 'usuarios'
     
     id = db.Column(db.Integer, primary_key=True)
-    nome = db.Column(db.String(100), nullable=False)
+    nome = db.Column(db.String(100), nullable=False, index=True)
     login = db.Column(db.String(50), unique=True, nullable=False)
     senha_hash = db.Column(db.String(255), nullable=False)
     role = db.Column(db.String(20), nullable=False, default='analista')  # 'admin' ou 'analista'
     ativo = db.Column(db.Boolean, default=True)
     created_at = db.Column(db.DateTime, default=datetime.utcnow)
+    updated_at = db.Column(db.DateTime, default=datetime.utcnow, onupdate=datetime.utcnow, index=True)
     
     def set_senha(self, senha):
-        """Criptografa e salva a senha"""
-        import bcrypt
-        self.senha_hash = bcrypt.hashpw(senha.encode('utf-8'), bcrypt.gensalt()).decode('utf-8')
+        """Criptografa e salva a senha (bcrypt no pool de app/utils/passwords.py)"""
+        self.senha_hash = password_hasher.hash(senha)
     
     def check_senha(self, senha):
         """Verifica se a senha está correta"""
-        import bcrypt
-        return bcrypt.checkpw(senha.encode('utf-8'), self.senha_hash.encode('utf-8'))
+        return password_hasher.verify(senha, self.senha_hash)
+    
+    def senha_precisa_rehash(self):
+        """True se o hash foi gerado com um BCRYPT_ROUNDS diferente do atual"""
+        return password_hasher.needs_rehash(self.senha_hash)
     
     def to_dict(self):
         return {
@@ -134,5 +182,46 @@ class Usuario(db.Model):
             'login': self.login,
             'role': self.role,
             'ativo': self.ativo,
-            'created_at': self.created_at.isoformat() if self.created_at else None
-        }
\ No newline at end of file
+            'created_at': self.created_at.isoformat() if self.created_at else None,
+            'updated_at': self.updated_at.isoformat() if self.updated_at else None
+        }
+
+
+class Alteracao(db.Model):
+    """
+    Registro de alterações lido por /api/sync, preenchido só por triggers
+
+    Uma linha por registro (a mais recente): cada escrita dá ao registro um
+    seq maior que todos os anteriores. Remoções ficam como lápides
+    (op='delete'). Ver app/utils/changes.py.
+    """
+    __tablename__ = 'alteracoes'
+    
+    entidade = db.Column(db.String(20), primary_key=True)  # projeto, squad, atividade
+    registro_id = db.Column(db.Integer, primary_key=True, autoincrement=False)
+    seq = db.Column(db.BigInteger, nullable=False, unique=True, index=True)
+    op = db.Column(db.String(10), nullable=False)  # upsert, delete
+
+
+class TokenRevogado(db.Model):
+    """
+    Token JWT revogado pelo logout (jti), até o vencimento do token
+
+    Compartilhado pelos processos e mantido entre reinícios; o
+    IdentityCache guarda uma cópia em memória. expira_em nulo: o token não
+    vence (JWT_ACCESS_TOKEN_EXPIRES = False).
+    """
+    __tablename__ = 'tokens_revogados'
+    
+    jti = db.Column(db.String(36), primary_key=True)
+    expira_em = db.Column(db.DateTime)
+    revogado_em = db.Column(db.DateTime, default=datetime.utcnow)
+
+
+# O índice de busca textual (FTS5 / tsvector) e os triggers de alteracoes são
+# criados por SQL próprio de cada banco; em bancos criados por create_all,
+# são instalados logo após as tabelas
+@event.listens_for(db.metadata, 'after_create')
+def _criar_indice_busca(target, connection, **kw):
+    install_search(connection)
+    install_change_log(connection)
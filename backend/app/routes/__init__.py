@@ -1,15 +1,87 @@
-from flask import Blueprint
+from flask import Blueprint, Response
+from app import db, cache, password_hasher, events
+from app.utils.database import pool_stats
+from app.utils.metrics import request_metrics, start_timer, record_response
 from app.routes.projetos import bp as projetos_bp
 from app.routes.squads import bp as squads_bp
 from app.routes.atividades import bp as atividades_bp
 from app.routes.auth import auth_bp
 from app.routes.usuarios import usuarios_bp
+from app.routes.sistema import sistema_bp
+from app.routes.importacao import importacao_bp
+from app.routes.busca import busca_bp
+from app.routes.timeline import timeline_bp
+from app.routes.eventos import eventos_bp
+from app.routes.sincronizacao import sync_bp
 
 main_bp = Blueprint('main', __name__)
+# /metrics fica fora de /api: é lido pelo Prometheus, não pelo frontend
+metrics_bp = Blueprint('metrics', __name__)
 
 # Registrar sub-blueprints
 main_bp.register_blueprint(projetos_bp)
 main_bp.register_blueprint(squads_bp)
 main_bp.register_blueprint(atividades_bp)
 main_bp.register_blueprint(auth_bp)
-main_bp.register_blueprint(usuarios_bp)
\ No newline at end of file
+main_bp.register_blueprint(usuarios_bp)
+main_bp.register_blueprint(sistema_bp)
+main_bp.register_blueprint(importacao_bp)
+main_bp.register_blueprint(busca_bp)
+main_bp.register_blueprint(timeline_bp)
+main_bp.register_blueprint(eventos_bp)
+main_bp.register_blueprint(sync_bp)
+
+
+@main_bp.route('/')
+def index():
+    """Rota inicial para verificar se a API está funcionando"""
+    return {
+        'message': 'API de Acompanhamento de Atividades',
+        'version': '1.0',
+        'endpoints': {
+            'projetos': '/api/projetos',
+            'squads': '/api/squads',
+            'atividades': '/api/atividades',
+            'auth': '/api/auth/login',
+            'usuarios': '/api/usuarios',
+            'busca': '/api/busca?q=',
+            'timeline': '/api/timeline?from=&to=',
+            'eventos': '/api/eventos',
+            'sync': '/api/sync?since='
+        }
+    }
+
+
+# Métricas de todas as requisições da aplicação
+metrics_bp.before_app_request(start_timer)
+metrics_bp.after_app_request(record_response)
+
+
+@metrics_bp.route('/metrics')
+def metrics():
+    """Métricas no formato de exposição do Prometheus"""
+    pool = pool_stats.snapshot(db.engine.pool)
+    cache_stats = cache.stats()
+    senhas = password_hasher.stats()
+    eventos = events.stats()
+    gauges = [
+        ('monitorop_db_pool_size', 'Conexões mantidas pelo pool', 'gauge', pool.get('pool_size')),
+        ('monitorop_db_pool_checked_out', 'Conexões em uso', 'gauge', pool.get('checked_out')),
+        ('monitorop_db_pool_overflow', 'Conexões acima de pool_size', 'gauge', pool.get('overflow')),
+        ('monitorop_db_pool_checkouts_total', 'Checkouts de conexão', 'counter', pool['checkouts']),
+        ('monitorop_db_pool_slow_waits_total', 'Checkouts acima de DB_POOL_WAIT_WARN_MS', 'counter', pool['slow_waits']),
+        ('monitorop_db_pool_wait_max_seconds', 'Maior espera por conexão', 'gauge', pool['wait_max_ms'] / 1000),
+        ('monitorop_cache_hits_total', 'Respostas servidas pelo cache', 'counter', cache_stats['hits']),
+        ('monitorop_cache_misses_total', 'Respostas calculadas pela view', 'counter', cache_stats['misses']),
+        ('monitorop_cache_invalidations_total', 'Invalidações por tag', 'counter', cache_stats['invalidations']),
+        ('monitorop_cache_entries', 'Entradas no cache em memória', 'gauge', cache_stats.get('entries')),
+        ('monitorop_cache_evictions_total', 'Entradas removidas pelo LRU', 'counter', cache_stats.get('evictions')),
+        ('monitorop_password_hash_in_flight', 'Hashes bcrypt em execução ou na fila', 'gauge', senhas['in_flight']),
+        ('monitorop_password_hash_total', 'Hashes bcrypt concluídos', 'counter', senhas['completed']),
+        ('monitorop_password_hash_rejected_total', 'Hashes recusados por fila cheia ou espera esgotada', 'counter', senhas['rejected']),
+        ('monitorop_events_clients', 'Conexões abertas em /api/eventos', 'gauge', eventos['clients']),
+        ('monitorop_events_published_total', 'Eventos de alteração publicados', 'counter', eventos['published']),
+        ('monitorop_events_dropped_total', 'Conexões encerradas por não acompanhar os eventos', 'counter', eventos['dropped']),
+        ('monitorop_events_rejected_total', 'Conexões recusadas pelo limite EVENTS_MAX_CLIENTS', 'counter', eventos['rejected']),
+    ]
+    return Response(request_metrics.render(gauges), mimetype='text/plain; version=0.0.4')
@@ -1,36 +1,59 @@
 from flask import Blueprint, request, jsonify
-from app import db
+from app import db, cache, events
 from app.models import Atividade, Projeto, Squad
-from app.utils.pagination import paginate_query
-from datetime import datetime
+from app.utils.pagination import paginate_query, paginate_keyset
+from app.utils.streaming import stream_json_list
+from app.utils.export import stream_csv, xlsx_response, ExportTooLarge
+from app.utils.http_cache import conditional
+from app.utils.dates import parse_date
+from app.utils.queries import atividades_query
+from sqlalchemy import func, case, and_, insert, update, delete, select
+from datetime import datetime, date
+import time
 
 bp = Blueprint('atividades', __name__, url_prefix='/api/atividades')
 
+STATUS = ['pendente', 'em_andamento', 'concluida']
+PRIORIDADES = ['baixa', 'media', 'alta']
+
+
+def _filtrar(query):
+    """Aplica os filtros opcionais da listagem (projeto_id, squad_id, status, prioridade)"""
+    projeto_id = request.args.get('projeto_id', type=int)
+    squad_id = request.args.get('squad_id', type=int)
+    status = request.args.get('status')
+    prioridade = request.args.get('prioridade')
+    
+    if projeto_id:
+        query = query.filter(Atividade.projeto_id == projeto_id)
+    if squad_id:
+        query = query.filter(Atividade.squad_id == squad_id)
+    if status:
+        query = query.filter(Atividade.status == status)
+    if prioridade:
+        query = query.filter(Atividade.prioridade == prioridade)
+    return query
+
 
 @bp.route('', methods=['GET'])
+@conditional(Atividade, Projeto, Squad)
+@cache.cached('atividades', 'projetos', 'squads')
 def listar_atividades():
     """Lista todas as atividades com filtros opcionais e paginação"""
     try:
-        query = Atividade.query
-        
-        # Filtros opcionais via query params
-        projeto_id = request.args.get('projeto_id', type=int)
-        squad_id = request.args.get('squad_id', type=int)
-        status = request.args.get('status')
-        prioridade = request.args.get('prioridade')
-        
-        if projeto_id:
-            query = query.filter_by(projeto_id=projeto_id)
-        if squad_id:
-            query = query.filter_by(squad_id=squad_id)
-        if status:
-            query = query.filter_by(status=status)
-        if prioridade:
-            query = query.filter_by(prioridade=prioridade)
+        query = _filtrar(atividades_query())
         
         # Ordenar por data de criação (mais recentes primeiro)
         query = query.order_by(Atividade.created_at.desc())
         
+        # Paginação por cursor (opt-in): custo constante em páginas profundas
+        if 'cursor' in request.args:
+            result = paginate_keyset(query, [(Atividade.created_at, True), (Atividade.id, True)], default_per_page=5)
+            return jsonify({
+                'items': [atividade.to_dict() for atividade in result['items']],
+                'pagination': result['pagination']
+            }), 200
+        
         # Verificar se a paginação foi solicitada
         if request.args.get('page'):
             # Com paginação
@@ -40,18 +63,79 @@ def listar_atividades():
                 'pagination': result['pagination']
             }), 200
         else:
-            # Sem paginação (compatibilidade com código antigo)
-            atividades = query.all()
-            return jsonify([atividade.to_dict() for atividade in atividades]), 200
+            # Sem paginação (compatibilidade com código antigo), enviada em lotes
+            return stream_json_list(query), 200
+    except ValueError as e:
+        return jsonify({'error': str(e)}), 400
+    except Exception as e:
+        return jsonify({'error': str(e)}), 500
+
+
+# Colunas da exportação: (cabeçalho, expressão)
+COLUNAS_EXPORTACAO = [
+    ('ID', Atividade.id),
+    ('Título', Atividade.titulo),
+    ('Projeto', Projeto.nome),
+    ('Ordem de produção', Projeto.ordem_producao),
+    ('Squad', Squad.nome),
+    ('Status', Atividade.status),
+    ('Prioridade', Atividade.prioridade),
+    ('Início programado', Atividade.inicio_programado),
+    ('Início realizado', Atividade.inicio_realizado),
+    ('Fim programado', Atividade.fim_programado),
+    ('Fim realizado', Atividade.fim_realizado),
+    ('Observação', Atividade.observacao),
+    ('Criada em', Atividade.created_at),
+    ('Atualizada em', Atividade.updated_at),
+]
+
+
+@bp.route('/export', methods=['GET'])
+def exportar_atividades():
+    """
+    Exporta as atividades em CSV ou XLSX (format=csv|xlsx)
+    
+    Aceita os mesmos filtros da listagem. As linhas vêm do banco em lotes
+    (yield_per) como tuplas, sem montar objetos ORM, e são escritas no
+    arquivo à medida que chegam.
+    """
+    try:
+        formato = request.args.get('format', 'csv').lower()
+        if formato not in ('csv', 'xlsx'):
+            return jsonify({'error': 'Formato inválido. Use csv ou xlsx'}), 400
+        separador = request.args.get('sep', ';')
+        if len(separador) != 1:
+            return jsonify({'error': 'sep deve ser um único caractere'}), 400
+        
+        query = _filtrar(
+            select(*[coluna for _, coluna in COLUNAS_EXPORTACAO])
+            .join(Projeto, Atividade.projeto_id == Projeto.id)
+            .join(Squad, Atividade.squad_id == Squad.id)
+        ).order_by(Atividade.created_at.desc(), Atividade.id.desc())
+        linhas = db.session.execute(query.execution_options(yield_per=1000))
+        
+        cabecalho = [nome for nome, _ in COLUNAS_EXPORTACAO]
+        nome_arquivo = f"atividades-{datetime.now().strftime('%Y%m%d-%H%M')}.{formato}"
+        
+        if formato == 'csv':
+            return stream_csv(cabecalho, linhas, nome_arquivo, delimitador=separador)
+        
+        try:
+            return xlsx_response(cabecalho, linhas, nome_arquivo, nome_planilha='Atividades')
+        except ImportError:
+            return jsonify({'error': 'Exportação XLSX indisponível (instale XlsxWriter)'}), 501
+    except ExportTooLarge as e:
+        return jsonify({'error': str(e)}), 400
     except Exception as e:
         return jsonify({'error': str(e)}), 500
 
 
 @bp.route('/<int:id>', methods=['GET'])
+@conditional(Atividade, Projeto, Squad)
 def buscar_atividade(id):
     """Busca uma atividade por ID"""
     try:
-        atividade = Atividade.query.get_or_404(id)
+        atividade = atividades_query().filter_by(id=id).first_or_404()
         return jsonify(atividade.to_dict()), 200
     except Exception as e:
         return jsonify({'error': str(e)}), 404
@@ -92,16 +176,18 @@ def criar_atividade():
         
         # Datas opcionais
         if data.get('inicio_programado'):
-            atividade.inicio_programado = datetime.strptime(data['inicio_programado'], '%Y-%m-%d').date()
+            atividade.inicio_programado = parse_date(data['inicio_programado'], 'inicio_programado')
         if data.get('inicio_realizado'):
-            atividade.inicio_realizado = datetime.strptime(data['inicio_realizado'], '%Y-%m-%d').date()
+            atividade.inicio_realizado = parse_date(data['inicio_realizado'], 'inicio_realizado')
         if data.get('fim_programado'):
-            atividade.fim_programado = datetime.strptime(data['fim_programado'], '%Y-%m-%d').date()
+            atividade.fim_programado = parse_date(data['fim_programado'], 'fim_programado')
         if data.get('fim_realizado'):
-            atividade.fim_realizado = datetime.strptime(data['fim_realizado'], '%Y-%m-%d').date()
+            atividade.fim_realizado = parse_date(data['fim_realizado'], 'fim_realizado')
         
         db.session.add(atividade)
         db.session.commit()
+        cache.invalidate('atividades')
+        events.publish('atividade', atividade.id, 'create')
         
         return jsonify(atividade.to_dict()), 201
     except Exception as e:
@@ -130,13 +216,13 @@ def atualizar_atividade(id):
                 return jsonify({'error': 'Status inválido. Use: pendente, em_andamento ou concluida'}), 400
             atividade.status = data['status']
         if 'inicio_programado' in data:
-            atividade.inicio_programado = datetime.strptime(data['inicio_programado'], '%Y-%m-%d').date() if data['inicio_programado'] else None
+            atividade.inicio_programado = parse_date(data['inicio_programado'], 'inicio_programado')
         if 'inicio_realizado' in data:
-            atividade.inicio_realizado = datetime.strptime(data['inicio_realizado'], '%Y-%m-%d').date() if data['inicio_realizado'] else None
+            atividade.inicio_realizado = parse_date(data['inicio_realizado'], 'inicio_realizado')
         if 'fim_programado' in data:
-            atividade.fim_programado = datetime.strptime(data['fim_programado'], '%Y-%m-%d').date() if data['fim_programado'] else None
+            atividade.fim_programado = parse_date(data['fim_programado'], 'fim_programado')
         if 'fim_realizado' in data:
-            atividade.fim_realizado = datetime.strptime(data['fim_realizado'], '%Y-%m-%d').date() if data['fim_realizado'] else None
+            atividade.fim_realizado = parse_date(data['fim_realizado'], 'fim_realizado')
         if 'projeto_id' in data:
             projeto = Projeto.query.get(data['projeto_id'])
             if not projeto:
@@ -149,6 +235,8 @@ def atualizar_atividade(id):
             atividade.squad_id = data['squad_id']
         
         db.session.commit()
+        cache.invalidate('atividades')
+        events.publish('atividade', id, 'update')
         
         return jsonify(atividade.to_dict()), 200
     except Exception as e:
@@ -163,6 +251,8 @@ def deletar_atividade(id):
         atividade = Atividade.query.get_or_404(id)
         db.session.delete(atividade)
         db.session.commit()
+        cache.invalidate('atividades')
+        events.publish('atividade', id, 'delete')
         
         return jsonify({'message': 'Atividade deletada com sucesso'}), 200
     except Exception as e:
@@ -170,29 +260,265 @@ def deletar_atividade(id):
         return jsonify({'error': str(e)}), 500
 
 
+# Limite de itens (somando criar, atualizar e deletar) por requisição em lote
+MAX_ITENS_LOTE = 20000
+
+CAMPOS_DATA = ['inicio_programado', 'inicio_realizado', 'fim_programado', 'fim_realizado']
+
+
+def _validar_campos_lote(item, projetos_validos, squads_validas):
+    """
+    Valida e converte os campos de um item do lote
+    
+    Returns:
+        dict: Campos prontos para INSERT/UPDATE
+    
+    Raises:
+        ValueError: Com a mensagem de erro do item
+    """
+    campos = {}
+    
+    if 'titulo' in item:
+        if not item['titulo']:
+            raise ValueError('Título é obrigatório')
+        campos['titulo'] = item['titulo']
+    if 'observacao' in item:
+        campos['observacao'] = item['observacao']
+    if 'prioridade' in item:
+        if item['prioridade'] not in PRIORIDADES:
+            raise ValueError('Prioridade inválida. Use: baixa, media ou alta')
+        campos['prioridade'] = item['prioridade']
+    if 'status' in item:
+        if item['status'] not in STATUS:
+            raise ValueError('Status inválido. Use: pendente, em_andamento ou concluida')
+        campos['status'] = item['status']
+    if 'projeto_id' in item:
+        if not _inteiro(item['projeto_id']) or item['projeto_id'] not in projetos_validos:
+            raise ValueError('Projeto não encontrado')
+        campos['projeto_id'] = item['projeto_id']
+    if 'squad_id' in item:
+        if not _inteiro(item['squad_id']) or item['squad_id'] not in squads_validas:
+            raise ValueError('Squad não encontrada')
+        campos['squad_id'] = item['squad_id']
+    
+    for campo in CAMPOS_DATA:
+        if campo in item:
+            campos[campo] = parse_date(item[campo], campo)
+    
+    return campos
+
+
+def _inteiro(valor):
+    """Id inteiro do JSON; bool é subclasse de int e true viraria o id 1"""
+    return isinstance(valor, int) and not isinstance(valor, bool)
+
+
+def _ids_existentes(coluna, ids):
+    """Retorna quais dos ids informados existem (uma consulta IN)"""
+    ids = {i for i in ids if _inteiro(i)}
+    if not ids:
+        return set()
+    return {linha[0] for linha in db.session.query(coluna).filter(coluna.in_(ids))}
+
+
+@bp.route('/bulk', methods=['POST'])
+def lote_atividades():
+    """
+    Cria, atualiza e deleta atividades em lote, em uma única transação
+    
+    Corpo: {"criar": [{...}], "atualizar": [{"id": 1, ...}], "deletar": [1, 2]}
+    Itens inválidos são ignorados e listados em "erros"; os demais são aplicados.
+    """
+    try:
+        inicio = time.perf_counter()
+        data = request.get_json(silent=True)
+        if not isinstance(data, dict):
+            return jsonify({'error': 'Corpo JSON inválido'}), 400
+        
+        criar = data.get('criar') or []
+        atualizar = data.get('atualizar') or []
+        deletar = data.get('deletar') or []
+        if not all(isinstance(lista, list) for lista in (criar, atualizar, deletar)):
+            return jsonify({'error': 'criar, atualizar e deletar devem ser listas'}), 400
+        if len(criar) + len(atualizar) + len(deletar) > MAX_ITENS_LOTE:
+            return jsonify({'error': f'Máximo de {MAX_ITENS_LOTE} itens por requisição'}), 400
+        
+        itens = [item for item in criar + atualizar if isinstance(item, dict)]
+        
+        # Uma consulta IN por tabela para validar todas as referências do lote
+        projetos_validos = _ids_existentes(Projeto.id, (i.get('projeto_id') for i in itens))
+        squads_validas = _ids_existentes(Squad.id, (i.get('squad_id') for i in itens))
+        atividades_existentes = _ids_existentes(
+            Atividade.id,
+            [i.get('id') for i in atualizar if isinstance(i, dict)] + list(deletar)
+        )
+        
+        erros = []
+        novas, alteracoes, remocoes = [], [], []
+        
+        for indice, item in enumerate(criar):
+            try:
+                if not isinstance(item, dict):
+                    raise ValueError('Item inválido')
+                if not item.get('titulo'):
+                    raise ValueError('Título é obrigatório')
+                if not item.get('projeto_id'):
+                    raise ValueError('Projeto é obrigatório')
+                if not item.get('squad_id'):
+                    raise ValueError('Squad é obrigatória')
+                
+                campos = _validar_campos_lote(item, projetos_validos, squads_validas)
+                nova = {
+                    'observacao': '',
+                    'prioridade': 'media',
+                    'status': 'pendente',
+                    **{campo: None for campo in CAMPOS_DATA}
+                }
+                nova.update(campos)
+                novas.append(nova)
+            except ValueError as e:
+                erros.append({'operacao': 'criar', 'indice': indice, 'error': str(e)})
+        
+        for indice, item in enumerate(atualizar):
+            try:
+                if not isinstance(item, dict) or not _inteiro(item.get('id')) \
+                        or item['id'] not in atividades_existentes:
+                    raise ValueError('Atividade não encontrada')
+                campos = _validar_campos_lote(item, projetos_validos, squads_validas)
+                if campos:
+                    alteracoes.append({'id': item['id'], **campos})
+            except ValueError as e:
+                erros.append({'operacao': 'atualizar', 'indice': indice, 'error': str(e)})
+        
+        for indice, atividade_id in enumerate(deletar):
+            if _inteiro(atividade_id) and atividade_id in atividades_existentes:
+                remocoes.append(atividade_id)
+            else:
+                erros.append({'operacao': 'deletar', 'indice': indice, 'error': 'Atividade não encontrada'})
+        
+        # executemany para inserts e updates; um único DELETE ... IN.
+        # O insert vai direto na tabela: o do ORM separa as linhas conforme
+        # as colunas nulas e emitiria um INSERT por grupo
+        if novas:
+            db.session.execute(insert(Atividade.__table__), novas)
+        if alteracoes:
+            db.session.execute(update(Atividade), alteracoes)
+        if remocoes:
+            db.session.execute(
+                delete(Atividade).where(Atividade.id.in_(remocoes)),
+                execution_options={'synchronize_session': False}
+            )
+        db.session.commit()
+        cache.invalidate('atividades')
+        # Um evento por operação do lote, sem a lista de ids
+        for op, linhas in (('create', novas), ('update', alteracoes), ('delete', remocoes)):
+            if linhas:
+                events.publish('atividade', None, op)
+        
+        duracao = time.perf_counter() - inicio
+        linhas = len(novas) + len(alteracoes) + len(remocoes)
+        
+        return jsonify({
+            'criadas': len(novas),
+            'atualizadas': len(alteracoes),
+            'deletadas': len(remocoes),
+            'erros': erros,
+            'duracao_ms': round(duracao * 1000, 1),
+            'linhas_por_segundo': round(linhas / duracao) if duracao > 0 else None
+        }), 200
+    except Exception as e:
+        db.session.rollback()
+        return jsonify({'error': str(e)}), 500
+
+
+def _novo_resumo():
+    """Estrutura vazia de contagens usada nas quebras por squad/projeto"""
+    return {
+        'total': 0,
+        'por_status': {s: 0 for s in STATUS},
+        'por_prioridade': {p: 0 for p in PRIORIDADES},
+        'atrasadas': 0
+    }
+
+
 @bp.route('/estatisticas', methods=['GET'])
+@conditional(Atividade, Projeto, Squad, per_day=True)
+@cache.cached('atividades', 'projetos', 'squads')
 def estatisticas():
-    """Retorna estatísticas gerais das atividades"""
+    """Retorna estatísticas das atividades (filtros opcionais: projeto_id, squad_id)"""
     try:
-        total = Atividade.query.count()
-        pendentes = Atividade.query.filter_by(status='pendente').count()
-        em_andamento = Atividade.query.filter_by(status='em_andamento').count()
-        concluidas = Atividade.query.filter_by(status='concluida').count()
+        atrasada = case(
+            (and_(Atividade.fim_programado < date.today(), Atividade.status != 'concluida'), 1),
+            else_=0
+        )
         
-        por_prioridade = {
-            'baixa': Atividade.query.filter_by(prioridade='baixa').count(),
-            'media': Atividade.query.filter_by(prioridade='media').count(),
-            'alta': Atividade.query.filter_by(prioridade='alta').count()
-        }
+        # Uma única varredura agrupada; os totais são consolidados em Python
+        query = db.session.query(
+            Atividade.projeto_id,
+            Atividade.squad_id,
+            Atividade.status,
+            Atividade.prioridade,
+            func.count(Atividade.id),
+            func.sum(atrasada)
+        )
+        
+        projeto_id = request.args.get('projeto_id', type=int)
+        squad_id = request.args.get('squad_id', type=int)
+        
+        if projeto_id:
+            query = query.filter(Atividade.projeto_id == projeto_id)
+        if squad_id:
+            query = query.filter(Atividade.squad_id == squad_id)
+        
+        query = query.group_by(
+            Atividade.projeto_id,
+            Atividade.squad_id,
+            Atividade.status,
+            Atividade.prioridade
+        )
+        
+        geral = _novo_resumo()
+        por_status_prioridade = {s: {p: 0 for p in PRIORIDADES} for s in STATUS}
+        por_squad = {}
+        por_projeto = {}
+        
+        for proj_id, sq_id, status, prioridade, total, atrasadas in query:
+            atrasadas = atrasadas or 0
+            resumos = (
+                geral,
+                por_squad.setdefault(sq_id, _novo_resumo()),
+                por_projeto.setdefault(proj_id, _novo_resumo())
+            )
+            for resumo in resumos:
+                resumo['total'] += total
+                resumo['atrasadas'] += atrasadas
+                resumo['por_status'][status] = resumo['por_status'].get(status, 0) + total
+                resumo['por_prioridade'][prioridade] = resumo['por_prioridade'].get(prioridade, 0) + total
+            
+            linha = por_status_prioridade.setdefault(status, {p: 0 for p in PRIORIDADES})
+            linha[prioridade] = linha.get(prioridade, 0) + total
+        
+        nomes_squads = dict(
+            db.session.query(Squad.id, Squad.nome).filter(Squad.id.in_(por_squad.keys()))
+        ) if por_squad else {}
+        nomes_projetos = dict(
+            db.session.query(Projeto.id, Projeto.nome).filter(Projeto.id.in_(por_projeto.keys()))
+        ) if por_projeto else {}
         
         return jsonify({
-            'total': total,
-            'por_status': {
-                'pendente': pendentes,
-                'em_andamento': em_andamento,
-                'concluida': concluidas
-            },
-            'por_prioridade': por_prioridade
+            'total': geral['total'],
+            'por_status': geral['por_status'],
+            'por_prioridade': geral['por_prioridade'],
+            'por_status_prioridade': por_status_prioridade,
+            'atrasadas': geral['atrasadas'],
+            'por_squad': [
+                {'id': id, 'nome': nomes_squads.get(id), **resumo}
+                for id, resumo in sorted(por_squad.items())
+            ],
+            'por_projeto': [
+                {'id': id, 'nome': nomes_projetos.get(id), **resumo}
+                for id, resumo in sorted(por_projeto.items())
+            ]
         }), 200
     except Exception as e:
-        return jsonify({'error': str(e)}), 500
\ No newline at end of file
+        return jsonify({'error': str(e)}), 500
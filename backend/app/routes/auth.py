@@ -1,11 +1,15 @@
-from flask import Blueprint, request, jsonify
+from flask import Blueprint, request, jsonify, make_response
 from flask_jwt_extended import (
     create_access_token, 
     jwt_required, 
     get_jwt_identity, 
-    get_jwt
+    get_jwt,
+    get_current_user
 )
+from app import identity_cache
 from app.models import db, Usuario
+from app.utils.passwords import PasswordHasherBusy
+from sqlalchemy import update
 from datetime import timedelta
 
 auth_bp = Blueprint('auth', __name__, url_prefix='/api/auth')
@@ -31,10 +35,22 @@ def login():
         if not usuario.ativo:
             return jsonify({'error': 'Usuário inativo'}), 401
         
+        # Devolve a conexão ao pool antes do bcrypt: a verificação não usa o banco
+        db.session.expunge(usuario)
+        db.session.rollback()
+        
         # Verificar senha
         if not usuario.check_senha(senha):
             return jsonify({'error': 'Credenciais inválidas'}), 401
         
+        # BCRYPT_ROUNDS mudou desde o último hash: regrava com a senha recebida
+        if usuario.senha_precisa_rehash():
+            usuario.set_senha(senha)
+            db.session.execute(
+                update(Usuario).where(Usuario.id == usuario.id).values(senha_hash=usuario.senha_hash)
+            )
+            db.session.commit()
+        
         # Definir expiração do token baseado em "lembrar-me"
         if lembrar:
             expires = timedelta(days=30)
@@ -53,6 +69,8 @@ def login():
             'usuario': usuario.to_dict()
         }), 200
         
+    except PasswordHasherBusy as e:
+        return jsonify({'error': str(e)}), 503, {'Retry-After': '1'}
     except Exception as e:
         return jsonify({'error': str(e)}), 500
 
@@ -60,15 +78,13 @@ def login():
 @auth_bp.route('/me', methods=['GET'])
 @jwt_required()
 def get_usuario_logado():
-    """Retorna dados do usuário logado"""
+    """Retorna dados do usuário logado (do cache de identidade, sem consultar o banco)"""
     try:
-        usuario_id = int(get_jwt_identity())  # ← Converter para int
-        usuario = Usuario.query.get(usuario_id)
-        
-        if not usuario:
-            return jsonify({'error': 'Usuário não encontrado'}), 404
-        
-        return jsonify(usuario.to_dict()), 200
+        # ETag calculado sobre os próprios dados: 304 sem consultar a tabela
+        resposta = make_response(jsonify(get_current_user()), 200)
+        resposta.add_etag()
+        resposta.headers['Cache-Control'] = 'no-cache'
+        return resposta.make_conditional(request)
         
     except Exception as e:
         return jsonify({'error': str(e)}), 500
@@ -80,13 +96,26 @@ def check_token():
     """Verifica se o token é válido"""
     try:
         usuario_id = int(get_jwt_identity())  # ← Converter para int
-        claims = get_jwt()
         
         return jsonify({
             'valid': True,
             'usuario_id': usuario_id,
-            'role': claims.get('role')
+            # Perfil atual do usuário (a claim do token pode estar desatualizada)
+            'role': get_current_user()['role']
         }), 200
         
     except Exception as e:
-        return jsonify({'error': str(e)}), 401
\ No newline at end of file
+        return jsonify({'error': str(e)}), 401
+
+
+@auth_bp.route('/logout', methods=['POST'])
+@jwt_required()
+def logout():
+    """Revoga o token da requisição"""
+    try:
+        identity_cache.revoke(get_jwt())
+        return jsonify({'message': 'Logout realizado com sucesso'}), 200
+        
+    except Exception as e:
+        db.session.rollback()
+        return jsonify({'error': str(e)}), 500
\ No newline at end of file
@@ -0,0 +1,71 @@
+from flask import Blueprint, request, jsonify
+from app import db, cache
+from app.models import Projeto, Squad, Atividade
+from app.utils.http_cache import conditional
+from app.utils.queries import atividades_query, projetos_query
+from app.utils.search import search, termos
+
+busca_bp = Blueprint('busca', __name__, url_prefix='/api/busca')
+
+TIPOS = ('projeto', 'atividade')
+# Consultas mais curtas casam com boa parte do índice (prefixo de 1 letra)
+MIN_CARACTERES = 2
+
+
+@busca_bp.route('', methods=['GET'])
+@conditional(Atividade, Projeto, Squad)
+@cache.cached('atividades', 'projetos', 'squads')
+def buscar():
+    """
+    Busca textual em projetos e atividades, ordenada por relevância
+
+    Query params: q (obrigatório), tipo (projeto|atividade), page, per_page.
+    Cada palavra de q casa como prefixo, sem diferenciar acentos nem
+    maiúsculas ("goias" encontra "Goiás"), em nome, subprograma,
+    ordem_producao, etapas, disciplinas e observacao dos projetos e em
+    titulo e observacao das atividades.
+    """
+    try:
+        consulta = request.args.get('q', '').strip()
+        if len(''.join(termos(consulta))) < MIN_CARACTERES:
+            return jsonify({'error': f'Informe ao menos {MIN_CARACTERES} caracteres em q'}), 400
+
+        tipo = request.args.get('tipo') or None
+        if tipo is not None and tipo not in TIPOS:
+            return jsonify({'error': 'Tipo inválido. Use: projeto ou atividade'}), 400
+
+        page = max(request.args.get('page', 1, type=int), 1)
+        per_page = min(max(request.args.get('per_page', 20, type=int), 1), 100)
+
+        resultados, total = search(db.session, consulta, tipo, page, per_page)
+
+        # Uma consulta por tipo para carregar os registros da página
+        ids_projetos = [id for tipo_item, id, _ in resultados if tipo_item == 'projeto']
+        ids_atividades = [id for tipo_item, id, _ in resultados if tipo_item == 'atividade']
+        registros = {}
+        if ids_projetos:
+            for projeto in projetos_query().filter(Projeto.id.in_(ids_projetos)):
+                registros[('projeto', projeto.id)] = projeto.to_dict()
+        if ids_atividades:
+            for atividade in atividades_query().filter(Atividade.id.in_(ids_atividades)):
+                registros[('atividade', atividade.id)] = atividade.to_dict()
+
+        pages = (total + per_page - 1) // per_page
+        return jsonify({
+            'items': [
+                {'tipo': tipo_item, 'id': id, 'score': round(score, 4), 'item': registros[(tipo_item, id)]}
+                for tipo_item, id, score in resultados if (tipo_item, id) in registros
+            ],
+            'pagination': {
+                'page': page,
+                'per_page': per_page,
+                'total': total,
+                'pages': pages,
+                'has_next': page < pages,
+                'has_prev': page > 1,
+                'next_page': page + 1 if page < pages else None,
+                'prev_page': page - 1 if page > 1 else None
+            }
+        }), 200
+    except Exception as e:
+        return jsonify({'error': str(e)}), 500
@@ -0,0 +1,83 @@
+from flask import Blueprint, request, jsonify, Response
+from app import events
+from app.utils.events import EventsUnavailable, RESET
+import time
+
+eventos_bp = Blueprint('eventos', __name__, url_prefix='/api/eventos')
+
+# Espera do EventSource antes de reconectar (ms)
+RETRY_MS = 3000
+
+
+def _ultima_versao():
+    """Versão do último evento recebido pelo cliente (cabeçalho Last-Event-ID ou ?since=)"""
+    valor = request.headers.get('Last-Event-ID') or request.args.get('since')
+    try:
+        return int(valor) if valor else None
+    except ValueError:
+        return None
+
+
+def _stream(assinatura):
+    """
+    Corpo SSE: eventos 'alteracao' e comentários de heartbeat
+
+    O heartbeat a cada EVENTS_HEARTBEAT segundos mantém a conexão viva em
+    proxies e faz o servidor notar clientes que sumiram (a escrita falha).
+    Depois de EVENTS_STREAM_TIMEOUT segundos o stream termina e o
+    EventSource reconecta com Last-Event-ID, sem perder eventos.
+    """
+    yield f'retry: {RETRY_MS}\n\n'
+    limite = time.monotonic() + events.stream_timeout
+    while True:
+        restante = limite - time.monotonic()
+        if restante <= 0:
+            return
+        itens = assinatura.proximos(min(events.heartbeat, restante))
+        if not itens:
+            yield ': ping\n\n'
+            continue
+        partes = []
+        for item in itens:
+            if item is RESET:
+                partes.append('event: reset\ndata: {}\n\n')
+                break
+            versao, mensagem = item
+            partes.append(f'id: {versao}\nevent: alteracao\ndata: {mensagem}\n\n')
+        yield ''.join(partes)
+        if itens[-1] is RESET:
+            return
+
+
+@eventos_bp.route('', methods=['GET'])
+def eventos():
+    """
+    Stream SSE (text/event-stream) das alterações em projetos, squads e atividades
+
+    Cada evento 'alteracao' traz {entity, id, op, version}; id null indica
+    vários registros da entidade. O evento 'reset' avisa que eventos foram
+    perdidos (reconexão tardia ou cliente lento): o cliente deve recarregar
+    os dados. A conexão não usa o banco: com o worker gevent (ver
+    gunicorn.conf.py) cada cliente ocioso custa só uma greenlet.
+    """
+    try:
+        assinatura = events.subscribe(_ultima_versao())
+    except EventsUnavailable as e:
+        resposta = jsonify({'error': str(e)})
+        resposta.status_code = 503
+        resposta.headers['Retry-After'] = '30'
+        return resposta
+
+    resposta = Response(
+        _stream(assinatura),
+        mimetype='text/event-stream',
+        headers={
+            'Cache-Control': 'no-cache',
+            # nginx: envia cada evento na hora, sem bufferizar a resposta
+            'X-Accel-Buffering': 'no'
+        }
+    )
+    # Roda quando o servidor fecha a resposta, inclusive se o cliente
+    # desconectar antes do primeiro envio
+    resposta.call_on_close(lambda: events.unsubscribe(assinatura))
+    return resposta
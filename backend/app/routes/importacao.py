@@ -0,0 +1,249 @@
+from flask import Blueprint, request, jsonify
+from app import db, cache, events
+from app.models import Projeto, Squad, Atividade, projeto_squad
+from app.routes.atividades import STATUS, PRIORIDADES
+from app.utils.dates import parse_date
+from sqlalchemy import select, insert
+import csv
+import io
+import time
+
+importacao_bp = Blueprint('importacao', __name__, url_prefix='/api/import')
+
+# Linhas de atividades gravadas por transação
+LINHAS_POR_TRANSACAO = 5000
+# Erros detalhados no relatório (o total é sempre informado)
+MAX_ERROS_RELATORIO = 1000
+
+CAMPOS_PROJETO = ('subprograma', 'ordem_producao', 'etapas', 'disciplinas', 'tipos_processamento')
+DATAS_PROJETO = ('data_aplicacao', 'data_termino')
+DATAS_ATIVIDADE = ('inicio_programado', 'inicio_realizado', 'fim_programado', 'fim_realizado')
+
+
+def _abrir_csv():
+    """
+    Abre o CSV enviado como texto, sem ler o arquivo inteiro
+
+    Aceita upload multipart (campo 'arquivo') ou o corpo da requisição com
+    Content-Type text/csv. O separador (';' ou ',') é detectado pelo cabeçalho.
+
+    Returns:
+        tuple: (colunas do cabeçalho, leitor csv posicionado na primeira linha de dados)
+    """
+    arquivo = request.files.get('arquivo')
+    if arquivo is not None:
+        bruto = arquivo.stream
+    elif request.mimetype in ('text/csv', 'text/plain'):
+        bruto = request.stream
+    else:
+        raise ValueError("Envie o CSV no campo 'arquivo' (multipart) ou com Content-Type text/csv")
+
+    texto = io.TextIOWrapper(bruto, encoding='utf-8-sig', newline='')
+    primeira_linha = texto.readline()
+    if not primeira_linha.strip():
+        raise ValueError('Arquivo vazio')
+
+    separador = ';' if primeira_linha.count(';') > primeira_linha.count(',') else ','
+    colunas = [c.strip().lower() for c in next(csv.reader([primeira_linha], delimiter=separador))]
+    if 'projeto' not in colunas:
+        raise ValueError("Coluna obrigatória ausente: projeto")
+    if 'titulo' in colunas and 'squad' not in colunas:
+        raise ValueError("Coluna obrigatória ausente: squad")
+
+    return colunas, csv.reader(texto, delimiter=separador)
+
+
+def _texto(registro, campo, maximo=None):
+    valor = (registro.get(campo) or '').strip()
+    if maximo and len(valor) > maximo:
+        raise ValueError(f'{campo} excede {maximo} caracteres')
+    return valor
+
+
+class _Importacao:
+    """Estado de uma importação: caches de nomes -> ids e o lote pendente"""
+
+    def __init__(self, validar_apenas):
+        self.validar_apenas = validar_apenas
+        # Uma consulta por tabela; as linhas seguintes resolvem nomes em memória
+        self.squads = {
+            nome.strip().lower(): squad_id
+            for squad_id, nome in db.session.execute(select(Squad.id, Squad.nome))
+        }
+        self.projetos = {
+            nome: projeto_id
+            for projeto_id, nome in db.session.execute(select(Projeto.id, Projeto.nome))
+        }
+        self.vinculos = set()
+        self.pendentes = []
+        self.projetos_criados = 0
+        self.atividades_criadas = 0
+        # Já confirmados no banco (commit): permanecem mesmo se a importação falhar depois
+        self.projetos_gravados = 0
+        self.atividades_gravadas = 0
+
+    def projeto_id(self, registro):
+        """Id do projeto da linha, criando o projeto na primeira vez que aparece"""
+        nome = _texto(registro, 'projeto', 200)
+        if not nome:
+            raise ValueError('projeto é obrigatório')
+        if nome in self.projetos:
+            return self.projetos[nome]
+
+        valores = {campo: _texto(registro, campo, 200) for campo in CAMPOS_PROJETO}
+        for campo in DATAS_PROJETO:
+            valores[campo] = parse_date(registro.get(campo), campo)
+
+        if self.validar_apenas:
+            novo_id = -(self.projetos_criados + 1)
+        else:
+            novo_id = db.session.execute(
+                insert(Projeto.__table__).values(nome=nome, **valores)
+            ).inserted_primary_key[0]
+        self.projetos[nome] = novo_id
+        self.projetos_criados += 1
+        return novo_id
+
+    def atividade(self, registro, projeto_id):
+        """Valida a linha e a coloca no lote pendente"""
+        titulo = _texto(registro, 'titulo', 200)
+        squad_nome = _texto(registro, 'squad')
+        squad_id = self.squads.get(squad_nome.lower())
+        if squad_id is None:
+            raise ValueError(f"Squad '{squad_nome}' não encontrada" if squad_nome else 'squad é obrigatória')
+
+        prioridade = _texto(registro, 'prioridade') or 'media'
+        if prioridade not in PRIORIDADES:
+            raise ValueError('Prioridade inválida. Use: baixa, media ou alta')
+        status = _texto(registro, 'status') or 'pendente'
+        if status not in STATUS:
+            raise ValueError('Status inválido. Use: pendente, em_andamento ou concluida')
+
+        linha = {
+            'titulo': titulo,
+            'observacao': registro.get('observacao') or '',
+            'prioridade': prioridade,
+            'status': status,
+            'projeto_id': projeto_id,
+            'squad_id': squad_id
+        }
+        for campo in DATAS_ATIVIDADE:
+            linha[campo] = parse_date(registro.get(campo), campo)
+
+        self.pendentes.append(linha)
+        self.vinculos.add((projeto_id, squad_id))
+        if len(self.pendentes) >= LINHAS_POR_TRANSACAO:
+            self.gravar()
+
+    def gravar(self):
+        """Insere o lote pendente (executemany), associa as squads e encerra a transação"""
+        if not self.validar_apenas:
+            if self.pendentes:
+                db.session.execute(insert(Atividade.__table__), self.pendentes)
+            self.vincular_squads()
+            db.session.commit()
+            self.projetos_gravados = self.projetos_criados
+            self.atividades_gravadas = self.atividades_criadas + len(self.pendentes)
+        self.atividades_criadas += len(self.pendentes)
+        self.pendentes = []
+        self.vinculos = set()
+
+    def vincular_squads(self):
+        """Associa aos projetos as squads usadas nas atividades do lote"""
+        if self.validar_apenas or not self.vinculos:
+            return
+        projeto_ids = {projeto_id for projeto_id, _ in self.vinculos}
+        existentes = set(db.session.execute(
+            select(projeto_squad.c.projeto_id, projeto_squad.c.squad_id)
+            .where(projeto_squad.c.projeto_id.in_(projeto_ids))
+        ))
+        novos = [
+            {'projeto_id': projeto_id, 'squad_id': squad_id}
+            for projeto_id, squad_id in self.vinculos - existentes
+        ]
+        if novos:
+            db.session.execute(insert(projeto_squad), novos)
+
+    def notificar(self):
+        """Invalida o cache e publica eventos se algo foi gravado, mesmo que a importação tenha falhado depois"""
+        if self.validar_apenas or not (self.projetos_gravados or self.atividades_gravadas):
+            return
+        cache.invalidate('projetos', 'atividades')
+        if self.projetos_gravados:
+            events.publish('projeto', None, 'create')
+        if self.atividades_gravadas:
+            events.publish('atividade', None, 'create')
+
+
+def _erro(importacao, erro, status):
+    """Resposta de erro que informa o que já tinha sido gravado antes da falha"""
+    corpo = {'error': str(erro)}
+    if importacao is not None and not importacao.validar_apenas:
+        corpo['projetos_gravados'] = importacao.projetos_gravados
+        corpo['atividades_gravadas'] = importacao.atividades_gravadas
+    return jsonify(corpo), status
+
+
+@importacao_bp.route('', methods=['POST'])
+def importar():
+    """
+    Importa projetos e atividades de um CSV
+
+    Cada linha traz o projeto (pelo nome, criado se não existir, com
+    subprograma, ordem_producao, datas, etapas...) e, opcionalmente, uma
+    atividade (titulo, squad pelo nome, datas, prioridade, status). O arquivo
+    é lido linha a linha e as atividades são gravadas em transações de
+    LINHAS_POR_TRANSACAO linhas. Linhas inválidas são ignoradas e listadas
+    no relatório. Com ?validar=1 nada é gravado.
+
+    Um erro que interrompe a leitura (codificação, CSV malformado, banco)
+    não desfaz as transações já confirmadas: a resposta de erro traz
+    projetos_gravados e atividades_gravadas.
+    """
+    importacao = None
+    try:
+        inicio = time.perf_counter()
+        validar_apenas = request.args.get('validar') in ('1', 'true')
+        colunas, leitor = _abrir_csv()
+        importacao = _Importacao(validar_apenas)
+
+        erros = []
+        total_erros = 0
+        linhas_lidas = 0
+        for valores in leitor:
+            if not any(valores):
+                continue
+            linhas_lidas += 1
+            registro = dict(zip(colunas, valores))
+            try:
+                projeto_id = importacao.projeto_id(registro)
+                if _texto(registro, 'titulo'):
+                    importacao.atividade(registro, projeto_id)
+            except ValueError as e:
+                total_erros += 1
+                if len(erros) < MAX_ERROS_RELATORIO:
+                    # +1: o cabeçalho é a linha 1 do arquivo
+                    erros.append({'linha': leitor.line_num + 1, 'error': str(e)})
+
+        importacao.gravar()
+
+        duracao = time.perf_counter() - inicio
+        return jsonify({
+            'validacao': validar_apenas,
+            'linhas': linhas_lidas,
+            'projetos_criados': importacao.projetos_criados,
+            'atividades_criadas': importacao.atividades_criadas,
+            'total_erros': total_erros,
+            'erros': erros,
+            'duracao_ms': round(duracao * 1000, 1),
+            'linhas_por_segundo': round(linhas_lidas / duracao) if duracao > 0 else None
+        }), 200
+    except (ValueError, UnicodeDecodeError, csv.Error) as e:
+        db.session.rollback()
+        return _erro(importacao, e, 400)
+    except Exception as e:
+        db.session.rollback()
+        return _erro(importacao, e, 500)
+    finally:
+        if importacao is not None:
+            importacao.notificar()
@@ -1,17 +1,24 @@
 from flask import Blueprint, request, jsonify
-from app import db
-from app.models import Projeto, Squad
+from app import db, cache, events
+from app.models import Projeto, Squad, Atividade, projeto_squad
 from app.utils.pagination import paginate_query
-from datetime import datetime
+from app.utils.streaming import stream_json_list
+from app.utils.http_cache import conditional
+from app.utils.dates import parse_date
+from app.utils.queries import atividades_query, projetos_query
+from sqlalchemy import func, insert, select, literal
+from datetime import datetime, timedelta
 
 bp = Blueprint('projetos', __name__, url_prefix='/api/projetos')
 
 
 @bp.route('', methods=['GET'])
+@conditional(Atividade, Projeto, Squad)
+@cache.cached('atividades', 'projetos', 'squads')
 def listar_projetos():
     """Lista todos os projetos com paginação opcional"""
     try:
-        query = Projeto.query.order_by(Projeto.created_at.desc())
+        query = projetos_query().order_by(Projeto.created_at.desc())
         
         # Verificar se a paginação foi solicitada
         if request.args.get('page'):
@@ -22,18 +29,18 @@ def listar_projetos():
                 'pagination': result['pagination']
             }), 200
         else:
-            # Sem paginação (compatibilidade com código antigo)
-            projetos = query.all()
-            return jsonify([projeto.to_dict() for projeto in projetos]), 200
+            # Sem paginação (compatibilidade com código antigo), enviada em lotes
+            return stream_json_list(query), 200
     except Exception as e:
         return jsonify({'error': str(e)}), 500
 
 
 @bp.route('/<int:id>', methods=['GET'])
+@conditional(Atividade, Projeto, Squad)
 def buscar_projeto(id):
     """Busca um projeto por ID"""
     try:
-        projeto = Projeto.query.get_or_404(id)
+        projeto = projetos_query().filter(Projeto.id == id).first_or_404()
         return jsonify(projeto.to_dict()), 200
     except Exception as e:
         return jsonify({'error': str(e)}), 404
@@ -61,9 +68,9 @@ def criar_projeto():
                 
         # Datas opcionais
         if data.get('data_aplicacao'):
-            projeto.data_aplicacao = datetime.strptime(data['data_aplicacao'], '%Y-%m-%d').date()
+            projeto.data_aplicacao = parse_date(data['data_aplicacao'], 'data_aplicacao')
         if data.get('data_termino'):
-            projeto.data_termino = datetime.strptime(data['data_termino'], '%Y-%m-%d').date()
+            projeto.data_termino = parse_date(data['data_termino'], 'data_termino')
         
         # Associar squads se fornecidos
         if data.get('squad_ids'):
@@ -72,6 +79,8 @@ def criar_projeto():
         
         db.session.add(projeto)
         db.session.commit()
+        cache.invalidate('projetos')
+        events.publish('projeto', projeto.id, 'create')
         
         return jsonify(projeto.to_dict()), 201
     except Exception as e:
@@ -102,16 +111,20 @@ def atualizar_projeto(id):
         if 'observacao' in data:
             projeto.observacao = data['observacao']
         if 'data_aplicacao' in data:
-            projeto.data_aplicacao = datetime.strptime(data['data_aplicacao'], '%Y-%m-%d').date() if data['data_aplicacao'] else None
+            projeto.data_aplicacao = parse_date(data['data_aplicacao'], 'data_aplicacao')
         if 'data_termino' in data:
-            projeto.data_termino = datetime.strptime(data['data_termino'], '%Y-%m-%d').date() if data['data_termino'] else None
+            projeto.data_termino = parse_date(data['data_termino'], 'data_termino')
         
         # Atualizar squads se fornecidos
         if 'squad_ids' in data:
             squads = Squad.query.filter(Squad.id.in_(data['squad_ids'])).all()
             projeto.squads = squads
+            # Alterar só a associação não gera UPDATE em projetos
+            projeto.updated_at = datetime.utcnow()
         
         db.session.commit()
+        cache.invalidate('projetos')
+        events.publish('projeto', id, 'update')
         
         return jsonify(projeto.to_dict()), 200
     except Exception as e:
@@ -126,6 +139,10 @@ def deletar_projeto(id):
         projeto = Projeto.query.get_or_404(id)
         db.session.delete(projeto)
         db.session.commit()
+        cache.invalidate('projetos', 'atividades')
+        events.publish('projeto', id, 'delete')
+        # As atividades do projeto são removidas em cascata
+        events.publish('atividade', None, 'delete')
         
         return jsonify({'message': 'Projeto deletado com sucesso'}), 200
     except Exception as e:
@@ -134,11 +151,131 @@ def deletar_projeto(id):
 
 
 @bp.route('/<int:id>/atividades', methods=['GET'])
+@conditional(Atividade, Projeto, Squad)
 def listar_atividades_projeto(id):
     """Lista todas as atividades de um projeto"""
     try:
-        projeto = Projeto.query.get_or_404(id)
-        atividades = [atividade.to_dict() for atividade in projeto.atividades]
+        Projeto.query.get_or_404(id)
+        query = atividades_query().filter_by(projeto_id=id).order_by(Atividade.id)
+        atividades = [atividade.to_dict() for atividade in query]
         return jsonify(atividades), 200
     except Exception as e:
-        return jsonify({'error': str(e)}), 404
\ No newline at end of file
+        return jsonify({'error': str(e)}), 404
+
+def _deslocar_data(coluna, dias):
+    """Expressão SQL que soma 'dias' a uma coluna Date (NULL continua NULL)"""
+    if not dias:
+        return coluna
+    if db.engine.dialect.name == 'sqlite':
+        return func.date(coluna, f'{dias:+d} days')
+    return coluna + dias
+
+
+def _dias(valor):
+    """deslocamento_dias como int (None/'' = 0); None se não for um inteiro válido"""
+    if valor is None or valor == '':
+        return 0
+    if isinstance(valor, bool) or (isinstance(valor, float) and not valor.is_integer()):
+        return None
+    try:
+        dias = int(valor)
+    except (TypeError, ValueError):
+        return None
+    return dias if abs(dias) <= 36500 else None
+
+
+@bp.route('/<int:id>/clonar', methods=['POST'])
+def clonar_projeto(id):
+    """
+    Clona um projeto com suas squads e atividades
+    
+    As atividades são copiadas no banco (INSERT ... SELECT), com datas
+    programadas deslocadas por deslocamento_dias ou, se ausente, pela
+    diferença entre a nova data_aplicacao e a do projeto original.
+    Status volta para pendente e as datas realizadas são limpas.
+    """
+    try:
+        original = Projeto.query.get(id)
+        if not original:
+            return jsonify({'error': 'Projeto não encontrado'}), 404
+        
+        data = request.get_json(silent=True) or {}
+        
+        nova_aplicacao = parse_date(data.get('data_aplicacao'), 'data_aplicacao')
+        
+        if 'deslocamento_dias' in data:
+            dias = _dias(data['deslocamento_dias'])
+            if dias is None:
+                return jsonify({'error': 'deslocamento_dias deve ser um número inteiro de dias (até 36500)'}), 400
+        elif nova_aplicacao and original.data_aplicacao:
+            dias = (nova_aplicacao - original.data_aplicacao).days
+        else:
+            dias = 0
+        
+        deslocamento = timedelta(days=dias)
+        projeto = Projeto(
+            subprograma=data.get('subprograma', original.subprograma),
+            nome=data.get('nome') or f'{original.nome} (cópia)',
+            ordem_producao=data.get('ordem_producao', original.ordem_producao),
+            etapas=data.get('etapas', original.etapas),
+            disciplinas=data.get('disciplinas', original.disciplinas),
+            tipos_processamento=data.get('tipos_processamento', original.tipos_processamento),
+            observacao=data.get('observacao', original.observacao),
+            data_aplicacao=nova_aplicacao or (original.data_aplicacao + deslocamento if original.data_aplicacao else None)
+        )
+        if data.get('data_termino'):
+            projeto.data_termino = parse_date(data['data_termino'], 'data_termino')
+        elif original.data_termino:
+            projeto.data_termino = original.data_termino + deslocamento
+        
+        db.session.add(projeto)
+        db.session.flush()
+        
+        # Squads associadas
+        db.session.execute(
+            insert(projeto_squad).from_select(
+                ['projeto_id', 'squad_id'],
+                select(literal(projeto.id), projeto_squad.c.squad_id)
+                .where(projeto_squad.c.projeto_id == id)
+            )
+        )
+        
+        # Plano de atividades
+        agora = datetime.utcnow()
+        resultado = db.session.execute(
+            insert(Atividade.__table__).from_select(
+                ['titulo', 'observacao', 'inicio_programado', 'fim_programado',
+                 'prioridade', 'status', 'projeto_id', 'squad_id', 'created_at', 'updated_at'],
+                select(
+                    Atividade.titulo,
+                    Atividade.observacao,
+                    _deslocar_data(Atividade.inicio_programado, dias),
+                    _deslocar_data(Atividade.fim_programado, dias),
+                    Atividade.prioridade,
+                    literal('pendente'),
+                    literal(projeto.id),
+                    Atividade.squad_id,
+                    literal(agora),
+                    literal(agora)
+                )
+                .where(Atividade.projeto_id == id)
+                .order_by(Atividade.id)
+            )
+        )
+        db.session.commit()
+        cache.invalidate('projetos', 'atividades')
+        events.publish('projeto', projeto.id, 'create')
+        if resultado.rowcount:
+            events.publish('atividade', None, 'create')
+        
+        return jsonify({
+            **projeto.to_dict(),
+            'atividades_clonadas': resultado.rowcount,
+            'deslocamento_dias': dias
+        }), 201
+    except ValueError as e:
+        db.session.rollback()
+        return jsonify({'error': str(e)}), 400
+    except Exception as e:
+        db.session.rollback()
+        return jsonify({'error': str(e)}), 500
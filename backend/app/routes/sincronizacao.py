@@ -0,0 +1,92 @@
+from flask import Blueprint, request, jsonify
+from app import db
+from app.models import Alteracao, Atividade, Projeto, Squad
+from app.utils.queries import atividades_query, projetos_query, squads_query
+from sqlalchemy import select, func
+
+sync_bp = Blueprint('sincronizacao', __name__, url_prefix='/api/sync')
+
+# Alterações por resposta: o cliente repete com o novo cursor enquanto has_more
+LIMITE_PADRAO = 500
+LIMITE_MAXIMO = 5000
+
+# entidade em alteracoes -> (chave da resposta, query base com o to_dict das listagens, modelo)
+CONSULTAS = {
+    'projeto': ('projetos', projetos_query, Projeto),
+    'squad': ('squads', squads_query, Squad),
+    'atividade': ('atividades', atividades_query, Atividade),
+}
+
+
+def _cursor_atual():
+    return db.session.execute(select(func.coalesce(func.max(Alteracao.seq), 0))).scalar()
+
+
+@sync_bp.route('', methods=['GET'])
+def sincronizar():
+    """
+    Projetos, squads e atividades alterados desde um cursor
+
+    Query params: since (cursor da resposta anterior; 0 = tudo), limit.
+    Sem since, retorna só o cursor atual: o cliente o guarda antes de
+    carregar as listagens e, depois, pede apenas o que mudou.
+
+    Cada registro aparece uma vez, com o mesmo formato das listagens
+    (to_dict). Em 'removidos' vêm os ids apagados. Com has_more, há mais
+    alterações: repita com o cursor retornado.
+    """
+    try:
+        resposta = {
+            'alterados': {chave: [] for chave, _, _ in CONSULTAS.values()},
+            'removidos': {chave: [] for chave, _, _ in CONSULTAS.values()},
+            'has_more': False
+        }
+
+        since = request.args.get('since')
+        if since is None or since == '':
+            return jsonify({'cursor': _cursor_atual(), **resposta}), 200
+        try:
+            since = int(since)
+            if since < 0:
+                raise ValueError
+        except ValueError:
+            return jsonify({'error': 'since deve ser um cursor retornado por /api/sync (inteiro >= 0)'}), 400
+
+        limite = min(max(request.args.get('limit', LIMITE_PADRAO, type=int), 1), LIMITE_MAXIMO)
+
+        # Busca pelo índice de seq; uma linha a mais indica se há próxima página
+        linhas = db.session.execute(
+            select(Alteracao.entidade, Alteracao.registro_id, Alteracao.seq, Alteracao.op)
+            .where(Alteracao.seq > since)
+            .order_by(Alteracao.seq)
+            .limit(limite + 1)
+        ).all()
+
+        if not linhas:
+            # Cursor maior que o último seq: não veio deste banco (recriado ou restaurado)
+            if since and since > _cursor_atual():
+                return jsonify({'error': 'Cursor desconhecido; sincronize desde o início (since=0)'}), 410
+            return jsonify({'cursor': since, **resposta}), 200
+
+        resposta['has_more'] = len(linhas) > limite
+        linhas = linhas[:limite]
+
+        alterados = {entidade: [] for entidade in CONSULTAS}
+        for entidade, registro_id, _, op in linhas:
+            if op == 'delete':
+                resposta['removidos'][CONSULTAS[entidade][0]].append(registro_id)
+            else:
+                alterados[entidade].append(registro_id)
+
+        # Uma consulta por entidade, com os mesmos carregamentos das listagens
+        for entidade, ids in alterados.items():
+            if not ids:
+                continue
+            chave, consulta, modelo = CONSULTAS[entidade]
+            resposta['alterados'][chave] = [
+                registro.to_dict() for registro in consulta().filter(modelo.id.in_(ids)).order_by(modelo.id)
+            ]
+
+        return jsonify({'cursor': linhas[-1].seq, **resposta}), 200
+    except Exception as e:
+        return jsonify({'error': str(e)}), 500
@@ -0,0 +1,17 @@
+from flask import Blueprint, jsonify
+from app import db, cache
+from app.utils.database import pool_stats
+
+sistema_bp = Blueprint('sistema', __name__, url_prefix='/api/sistema')
+
+
+@sistema_bp.route('/cache', methods=['GET'])
+def estatisticas_cache():
+    """Contadores do cache de respostas (hits, misses, evictions...)"""
+    return jsonify(cache.stats()), 200
+
+
+@sistema_bp.route('/pool', methods=['GET'])
+def estatisticas_pool():
+    """Métricas do pool de conexões (espera por checkout, idade das conexões)"""
+    return jsonify(pool_stats.snapshot(db.engine.pool)), 200
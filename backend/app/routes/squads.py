@@ -1,16 +1,29 @@
 from flask import Blueprint, request, jsonify
-from app import db
-from app.models import Squad, Projeto
-from app.utils.pagination import paginate_query
+from app import db, cache, events
+from app.models import Squad, Projeto, Atividade
+from app.utils.pagination import paginate_query, paginate_keyset
+from app.utils.streaming import stream_json_list
+from app.utils.http_cache import conditional
+from app.utils.queries import atividades_query, squads_query
 
 bp = Blueprint('squads', __name__, url_prefix='/api/squads')
 
 
 @bp.route('', methods=['GET'])
+@conditional(Atividade, Projeto, Squad)
+@cache.cached('atividades', 'projetos', 'squads')
 def listar_squads():
     """Lista todas as squads com paginação opcional"""
     try:
-        query = Squad.query.order_by(Squad.nome)
+        query = squads_query().order_by(Squad.nome)
+        
+        # Paginação por cursor (opt-in): custo constante em páginas profundas
+        if 'cursor' in request.args:
+            result = paginate_keyset(query, [(Squad.nome, False), (Squad.id, False)], default_per_page=5)
+            return jsonify({
+                'items': [squad.to_dict() for squad in result['items']],
+                'pagination': result['pagination']
+            }), 200
         
         # Verificar se a paginação foi solicitada
         if request.args.get('page'):
@@ -21,18 +34,20 @@ def listar_squads():
                 'pagination': result['pagination']
             }), 200
         else:
-            # Sem paginação (compatibilidade com código antigo)
-            squads = query.all()
-            return jsonify([squad.to_dict() for squad in squads]), 200
+            # Sem paginação (compatibilidade com código antigo), enviada em lotes
+            return stream_json_list(query), 200
+    except ValueError as e:
+        return jsonify({'error': str(e)}), 400
     except Exception as e:
         return jsonify({'error': str(e)}), 500
 
 
 @bp.route('/<int:id>', methods=['GET'])
+@conditional(Atividade, Projeto, Squad)
 def buscar_squad(id):
     """Busca uma squad por ID"""
     try:
-        squad = Squad.query.get_or_404(id)
+        squad = squads_query().filter(Squad.id == id).first_or_404()
         return jsonify(squad.to_dict()), 200
     except Exception as e:
         return jsonify({'error': str(e)}), 404
@@ -59,6 +74,8 @@ def criar_squad():
         
         db.session.add(squad)
         db.session.commit()
+        cache.invalidate('squads')
+        events.publish('squad', squad.id, 'create')
         
         return jsonify(squad.to_dict()), 201
     except Exception as e:
@@ -85,6 +102,8 @@ def atualizar_squad(id):
             squad.descricao = data['descricao']
         
         db.session.commit()
+        cache.invalidate('squads')
+        events.publish('squad', id, 'update')
         
         return jsonify(squad.to_dict()), 200
     except Exception as e:
@@ -99,11 +118,13 @@ def deletar_squad(id):
         squad = Squad.query.get_or_404(id)
         
         # Verificar se a squad tem atividades associadas
-        if len(squad.atividades) > 0:
+        if squad.contar_atividades() > 0:
             return jsonify({'error': 'Não é possível deletar squad com atividades associadas'}), 400
         
         db.session.delete(squad)
         db.session.commit()
+        cache.invalidate('squads')
+        events.publish('squad', id, 'delete')
         
         return jsonify({'message': 'Squad deletada com sucesso'}), 200
     except Exception as e:
@@ -112,6 +133,7 @@ def deletar_squad(id):
 
 
 @bp.route('/<int:id>/projetos', methods=['GET'])
+@conditional(Projeto, Squad)
 def listar_projetos_squad(id):
     """Lista todos os projetos de uma squad"""
     try:
@@ -123,11 +145,13 @@ def listar_projetos_squad(id):
 
 
 @bp.route('/<int:id>/atividades', methods=['GET'])
+@conditional(Atividade, Projeto, Squad)
 def listar_atividades_squad(id):
     """Lista todas as atividades de uma squad"""
     try:
-        squad = Squad.query.get_or_404(id)
-        atividades = [atividade.to_dict() for atividade in squad.atividades]
+        Squad.query.get_or_404(id)
+        query = atividades_query().filter_by(squad_id=id).order_by(Atividade.id)
+        atividades = [atividade.to_dict() for atividade in query]
         return jsonify(atividades), 200
     except Exception as e:
         return jsonify({'error': str(e)}), 404
\ No newline at end of file
@@ -0,0 +1,110 @@
+from flask import Blueprint, request, jsonify
+from app import db, cache
+from app.models import Atividade, Projeto, Squad
+from app.utils.http_cache import conditional
+from app.utils.dates import parse_date
+from sqlalchemy import select, and_, or_, func, cast, String
+from datetime import date
+
+timeline_bp = Blueprint('timeline', __name__, url_prefix='/api/timeline')
+
+COLUNAS_TIMELINE = ('id', 'titulo', 'projeto_id', 'squad_id', 'inicio_programado', 'fim_programado',
+                    'inicio_realizado', 'fim_realizado', 'status', 'prioridade')
+DATAS_TIMELINE = ('inicio_programado', 'fim_programado', 'inicio_realizado', 'fim_realizado')
+
+
+def _sobrepoe(inicio, fim):
+    """
+    Atividades cujo período programado cruza [inicio, fim]
+
+    Sem inicio_programado, a atividade é um marco em fim_programado; sem
+    fim_programado, um marco em inicio_programado. Sem nenhuma das duas,
+    fica fora da timeline. Os dois ramos do OR são atendidos pelo índice
+    (fim_programado, inicio_programado).
+    """
+    return or_(
+        and_(
+            Atividade.fim_programado >= inicio,
+            func.coalesce(Atividade.inicio_programado, Atividade.fim_programado) <= fim
+        ),
+        and_(
+            Atividade.fim_programado.is_(None),
+            Atividade.inicio_programado.between(inicio, fim)
+        )
+    )
+
+
+@timeline_bp.route('', methods=['GET'])
+@conditional(Atividade, Projeto, Squad, per_day=True)
+@cache.cached('atividades', 'projetos', 'squads')
+def timeline():
+    """
+    Atividades de um período para o gráfico de Gantt
+
+    Query params: from e to (YYYY-MM-DD; padrão: o ano corrente),
+    projeto_id, squad_id. Retorna só as atividades cujo período programado
+    cruza a janela, em formato colunar: um array por campo, na mesma ordem
+    (a linha i é colunas.<campo>[i]), mais os nomes de projetos e squads
+    referenciados.
+    """
+    try:
+        hoje = date.today()
+        inicio = parse_date(request.args.get('from'), 'from') or date(hoje.year, 1, 1)
+        fim = parse_date(request.args.get('to'), 'to') or date(inicio.year, 12, 31)
+        if fim < inicio:
+            return jsonify({'error': 'to deve ser igual ou posterior a from'}), 400
+
+        projeto_id = request.args.get('projeto_id', type=int)
+        squad_id = request.args.get('squad_id', type=int)
+
+        # Só as colunas do gráfico, sem montar objetos do ORM; as datas já
+        # saem do banco como texto ISO, sem converter para date e de volta
+        tabela = Atividade.__table__
+        consulta = (
+            select(*[
+                cast(tabela.c[c], String).label(c) if c in DATAS_TIMELINE else tabela.c[c]
+                for c in COLUNAS_TIMELINE
+            ])
+            .where(_sobrepoe(inicio, fim))
+            .order_by(
+                Atividade.projeto_id,
+                Atividade.squad_id,
+                func.coalesce(Atividade.inicio_programado, Atividade.fim_programado),
+                Atividade.id
+            )
+        )
+        if projeto_id:
+            consulta = consulta.where(Atividade.projeto_id == projeto_id)
+        if squad_id:
+            consulta = consulta.where(Atividade.squad_id == squad_id)
+
+        linhas = db.session.execute(consulta).all()
+        # Formato colunar: um array por campo em vez de um objeto por linha
+        colunas = {campo: list(valores) for campo, valores in zip(COLUNAS_TIMELINE, zip(*linhas))} \
+            if linhas else {campo: [] for campo in COLUNAS_TIMELINE}
+
+        projetos, squads = {}, {}
+        if linhas:
+            projetos = {
+                str(id): nome for id, nome in db.session.execute(
+                    select(Projeto.id, Projeto.nome).where(Projeto.id.in_(set(colunas['projeto_id'])))
+                )
+            }
+            squads = {
+                str(id): nome for id, nome in db.session.execute(
+                    select(Squad.id, Squad.nome).where(Squad.id.in_(set(colunas['squad_id'])))
+                )
+            }
+
+        return jsonify({
+            'from': inicio.isoformat(),
+            'to': fim.isoformat(),
+            'total': len(linhas),
+            'colunas': colunas,
+            'projetos': projetos,
+            'squads': squads
+        }), 200
+    except ValueError as e:
+        return jsonify({'error': str(e)}), 400
+    except Exception as e:
+        return jsonify({'error': str(e)}), 500
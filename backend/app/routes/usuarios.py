@@ -1,19 +1,23 @@
 from flask import Blueprint, request, jsonify
-from flask_jwt_extended import jwt_required, get_jwt_identity, get_jwt
+from flask_jwt_extended import jwt_required, get_jwt_identity, current_user
+from app import identity_cache
 from app.models import db, Usuario
-from app.utils.pagination import paginate_query
+from app.utils.pagination import paginate_query, paginate_keyset
+from app.utils.streaming import stream_json_list
+from app.utils.http_cache import conditional
+from app.utils.passwords import PasswordHasherBusy
 
 usuarios_bp = Blueprint('usuarios', __name__, url_prefix='/api/usuarios')
 
 def admin_required():
-    """Verifica se o usuário é admin"""
-    claims = get_jwt()
-    if claims.get('role') != 'admin':
+    """Verifica se o usuário é admin (perfil atual, não a claim do token)"""
+    if current_user['role'] != 'admin':
         return False
     return True
 
 @usuarios_bp.route('', methods=['GET'])
 @jwt_required()
+@conditional(Usuario, per_user=True)
 def listar_usuarios():
     """Lista todos os usuários (apenas Admin) com paginação opcional"""
     try:
@@ -22,6 +26,14 @@ def listar_usuarios():
         
         query = Usuario.query.order_by(Usuario.nome)
         
+        # Paginação por cursor (opt-in): custo constante em páginas profundas
+        if 'cursor' in request.args:
+            result = paginate_keyset(query, [(Usuario.nome, False), (Usuario.id, False)], default_per_page=5)
+            return jsonify({
+                'items': [u.to_dict() for u in result['items']],
+                'pagination': result['pagination']
+            }), 200
+        
         # Verificar se a paginação foi solicitada
         if request.args.get('page'):
             # Com paginação
@@ -31,10 +43,11 @@ def listar_usuarios():
                 'pagination': result['pagination']
             }), 200
         else:
-            # Sem paginação (compatibilidade com código antigo)
-            usuarios = query.all()
-            return jsonify([u.to_dict() for u in usuarios]), 200
+            # Sem paginação (compatibilidade com código antigo), enviada em lotes
+            return stream_json_list(query), 200
         
+    except ValueError as e:
+        return jsonify({'error': str(e)}), 400
     except Exception as e:
         return jsonify({'error': str(e)}), 500
 
@@ -68,9 +81,14 @@ def criar_usuario():
         
         db.session.add(usuario)
         db.session.commit()
+        # O id pode ser de um usuário removido que ainda está no cache
+        identity_cache.invalidate(usuario.id)
         
         return jsonify(usuario.to_dict()), 201
         
+    except PasswordHasherBusy as e:
+        db.session.rollback()
+        return jsonify({'error': str(e)}), 503, {'Retry-After': '1'}
     except Exception as e:
         db.session.rollback()
         print(f"Erro ao criar usuário: {str(e)}")
@@ -105,8 +123,13 @@ def atualizar_usuario(id):
             usuario.set_senha(data['senha'])
         
         db.session.commit()
+        # Perfil/ativo mudaram: o próximo token deste usuário é conferido no banco
+        identity_cache.invalidate(id)
         return jsonify(usuario.to_dict()), 200
         
+    except PasswordHasherBusy as e:
+        db.session.rollback()
+        return jsonify({'error': str(e)}), 503, {'Retry-After': '1'}
     except Exception as e:
         db.session.rollback()
         print(f"Erro ao atualizar usuário: {str(e)}")
@@ -128,6 +151,7 @@ def deletar_usuario(id):
         usuario = Usuario.query.get_or_404(id)
         db.session.delete(usuario)
         db.session.commit()
+        identity_cache.invalidate(id)
         
         return jsonify({'message': 'Usuário deletado com sucesso'}), 200
         
@@ -0,0 +1,251 @@
+from collections import OrderedDict
+from functools import wraps
+import threading
+import time
+from flask import request, make_response, Response, g
+
+
+class CacheBackend:
+    """
+    Interface dos backends de cache
+
+    Valores são bytes. Contadores (incr) nunca expiram nem são removidos por
+    LRU: eles guardam a geração de cada tag de invalidação.
+    """
+    name = 'base'
+
+    def get(self, key):
+        raise NotImplementedError
+
+    def set(self, key, value, ttl):
+        raise NotImplementedError
+
+    def incr(self, key):
+        raise NotImplementedError
+
+    def get_counters(self, keys):
+        raise NotImplementedError
+
+    def stats(self):
+        return {}
+
+
+class MemoryCache(CacheBackend):
+    """Cache LRU em memória do processo, com TTL por entrada"""
+    name = 'memory'
+
+    def __init__(self, max_entries=512):
+        self.max_entries = max_entries
+        self._entries = OrderedDict()
+        self._counters = {}
+        self._lock = threading.Lock()
+        self.evictions = 0
+        self.expirations = 0
+
+    def get(self, key):
+        with self._lock:
+            item = self._entries.get(key)
+            if item is None:
+                return None
+            value, expires_at = item
+            if expires_at < time.monotonic():
+                del self._entries[key]
+                self.expirations += 1
+                return None
+            self._entries.move_to_end(key)
+            return value
+
+    def set(self, key, value, ttl):
+        with self._lock:
+            self._entries[key] = (value, time.monotonic() + ttl)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def incr(self, key):
+        with self._lock:
+            self._counters[key] = self._counters.get(key, 0) + 1
+            return self._counters[key]
+
+    def get_counters(self, keys):
+        return [self._counters.get(key, 0) for key in keys]
+
+    def stats(self):
+        return {
+            'entries': len(self._entries),
+            'max_entries': self.max_entries,
+            'evictions': self.evictions,
+            'expirations': self.expirations
+        }
+
+
+class RedisCache(CacheBackend):
+    """
+    Backend para Redis ou qualquer servidor compatível (compartilhado entre workers)
+
+    Args:
+        client: URL (redis://...) ou objeto cliente com get/mget/set/incr
+        prefix: Prefixo das chaves, para dividir o servidor com outras aplicações
+    """
+    name = 'redis'
+
+    def __init__(self, client, prefix='monitorop:'):
+        if isinstance(client, str):
+            import redis
+            client = redis.Redis.from_url(client)
+        self.client = client
+        self.prefix = prefix
+
+    def get(self, key):
+        return self.client.get(self.prefix + key)
+
+    def set(self, key, value, ttl):
+        self.client.set(self.prefix + key, value, ex=max(1, int(ttl)))
+
+    def incr(self, key):
+        return int(self.client.incr(self.prefix + key))
+
+    def get_counters(self, keys):
+        return [int(v or 0) for v in self.client.mget([self.prefix + key for key in keys])]
+
+
+class ResponseCache:
+    """
+    Cache de respostas GET com invalidação por tag
+
+    Abaixo de @conditional, a chave é o ETag da requisição, calculado a
+    partir da versão das tabelas no banco: uma escrita feita por qualquer
+    processo muda a chave, mesmo com o backend em memória e vários workers.
+
+    Sem @conditional, cada tag (ex: 'atividades') tem um contador de geração
+    que faz parte da chave das respostas que dependem dela.
+    invalidate('atividades') apenas incrementa o contador: as entradas
+    antigas deixam de ser alcançáveis e saem pelo LRU/TTL. Esses contadores
+    são do processo com o backend 'memory'.
+    """
+
+    def __init__(self, app=None):
+        self.backend = None
+        self.ttl = 300
+        self.max_item_bytes = 16 * 1024 * 1024
+        self.hits = 0
+        self.misses = 0
+        self.stores = 0
+        self.invalidations = 0
+        if app is not None:
+            self.init_app(app)
+
+    def init_app(self, app):
+        """Configura o backend a partir de CACHE_BACKEND ('memory', 'redis' ou 'none')"""
+        tipo = app.config.get('CACHE_BACKEND', 'memory')
+        self.ttl = app.config.get('CACHE_TTL', 300)
+        self.max_item_bytes = app.config.get('CACHE_MAX_ITEM_BYTES', self.max_item_bytes)
+
+        if tipo == 'redis':
+            self.backend = RedisCache(app.config['CACHE_REDIS_URL'])
+        elif tipo == 'memory':
+            self.backend = MemoryCache(app.config.get('CACHE_MAX_ENTRIES', 512))
+        else:
+            self.backend = None
+
+        app.extensions['response_cache'] = self
+
+    @staticmethod
+    def _normalize_args():
+        """Parâmetros ordenados, ignorando filtros vazios (cursor vazio é significativo)"""
+        return '&'.join(
+            f'{k}={v}' for k, v in sorted(request.args.items(multi=True))
+            if v != '' or k == 'cursor'
+        )
+
+    def _key(self, tags):
+        etag = g.get('etag')
+        if etag is not None:
+            return f'resp:{etag}'
+        geracoes = self.backend.get_counters([f'gen:{tag}' for tag in tags])
+        versao = ','.join(f'{tag}{g}' for tag, g in zip(tags, geracoes))
+        return f'resp:{request.path}?{self._normalize_args()}|{versao}'
+
+    def cached(self, *tags):
+        """
+        Decorator que guarda a resposta 200 da view
+
+        Args:
+            *tags: Tabelas das quais a resposta depende
+        """
+        def decorator(view):
+            @wraps(view)
+            def wrapper(*args, **kwargs):
+                if self.backend is None:
+                    return view(*args, **kwargs)
+
+                chave = self._key(tags)
+                valor = self.backend.get(chave)
+                if valor is not None:
+                    self.hits += 1
+                    mimetype, _, corpo = valor.partition(b'\0')
+                    return Response(corpo, 200, mimetype=mimetype.decode('ascii'))
+
+                self.misses += 1
+                resposta = make_response(view(*args, **kwargs))
+                if resposta.status_code != 200:
+                    return resposta
+
+                if resposta.is_streamed:
+                    resposta.response = self._store_stream(chave, resposta.mimetype, resposta.response)
+                else:
+                    self._store(chave, resposta.mimetype, resposta.get_data())
+                return resposta
+            return wrapper
+        return decorator
+
+    def _store(self, chave, mimetype, corpo):
+        if len(corpo) > self.max_item_bytes:
+            return
+        self.backend.set(chave, mimetype.encode('ascii') + b'\0' + corpo, self.ttl)
+        self.stores += 1
+
+    def _store_stream(self, chave, mimetype, pedacos):
+        """Repassa os pedaços de uma resposta em streaming e a guarda se completar"""
+        acumulado = []
+        tamanho = 0
+        try:
+            for pedaco in pedacos:
+                yield pedaco
+                if acumulado is None:
+                    continue
+                if isinstance(pedaco, str):
+                    pedaco = pedaco.encode('utf-8')
+                tamanho += len(pedaco)
+                if tamanho > self.max_item_bytes:
+                    acumulado = None
+                else:
+                    acumulado.append(pedaco)
+        finally:
+            # Cliente desconectado: encerra o gerador original (e seu contexto)
+            if hasattr(pedacos, 'close'):
+                pedacos.close()
+        if acumulado is not None:
+            self._store(chave, mimetype, b''.join(acumulado))
+
+    def invalidate(self, *tags):
+        """Invalida todas as respostas que dependem das tags informadas"""
+        if self.backend is None:
+            return
+        for tag in tags:
+            self.backend.incr(f'gen:{tag}')
+        self.invalidations += 1
+
+    def stats(self):
+        """Contadores de uso do cache"""
+        consultas = self.hits + self.misses
+        return {
+            'backend': self.backend.name if self.backend else None,
+            'hits': self.hits,
+            'misses': self.misses,
+            'hit_ratio': round(self.hits / consultas, 4) if consultas else None,
+            'stores': self.stores,
+            'invalidations': self.invalidations,
+            **(self.backend.stats() if self.backend else {})
+        }
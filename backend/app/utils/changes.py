@@ -0,0 +1,187 @@
+from sqlalchemy import inspect, text
+
+# Entidades do registro de alterações: nome em alteracoes.entidade -> tabela
+ENTIDADES = {
+    'projeto': 'projetos',
+    'squad': 'squads',
+    'atividade': 'atividades',
+}
+
+# Chave do pg_advisory_xact_lock que ordena os escritores no PostgreSQL
+_LOCK_ALTERACOES = 7305541
+
+# Cada linha de alteracoes diz que o to_dict() de um registro pode ter
+# mudado. Além da própria linha, contam as informações repetidas em outros
+# registros: total_atividades de projetos e squads, squads de um projeto
+# (projeto_squad) e os nomes de projeto e squad dentro de cada atividade.
+# (entidade, tabela, evento, SELECT com os ids afetados, op)
+_REGRAS = [
+    ('projeto', 'projetos', 'INSERT', 'SELECT NEW.id AS id', 'upsert'),
+    ('projeto', 'projetos', 'UPDATE', 'SELECT NEW.id AS id', 'upsert'),
+    ('atividade', 'projetos', 'UPDATE',
+     'SELECT id FROM atividades WHERE projeto_id = NEW.id AND OLD.nome IS DISTINCT FROM NEW.nome', 'upsert'),
+    ('projeto', 'projetos', 'DELETE', 'SELECT OLD.id AS id', 'delete'),
+
+    ('squad', 'squads', 'INSERT', 'SELECT NEW.id AS id', 'upsert'),
+    ('squad', 'squads', 'UPDATE', 'SELECT NEW.id AS id', 'upsert'),
+    ('atividade', 'squads', 'UPDATE',
+     'SELECT id FROM atividades WHERE squad_id = NEW.id AND OLD.nome IS DISTINCT FROM NEW.nome', 'upsert'),
+    ('projeto', 'squads', 'UPDATE',
+     'SELECT projeto_id AS id FROM projeto_squad WHERE squad_id = NEW.id AND OLD.nome IS DISTINCT FROM NEW.nome', 'upsert'),
+    ('squad', 'squads', 'DELETE', 'SELECT OLD.id AS id', 'delete'),
+
+    ('atividade', 'atividades', 'INSERT', 'SELECT NEW.id AS id', 'upsert'),
+    ('projeto', 'atividades', 'INSERT', 'SELECT id FROM projetos WHERE id = NEW.projeto_id', 'upsert'),
+    ('squad', 'atividades', 'INSERT', 'SELECT id FROM squads WHERE id = NEW.squad_id', 'upsert'),
+    ('atividade', 'atividades', 'UPDATE', 'SELECT NEW.id AS id', 'upsert'),
+    ('projeto', 'atividades', 'UPDATE',
+     'SELECT id FROM projetos WHERE id IN (OLD.projeto_id, NEW.projeto_id) '
+     'AND OLD.projeto_id IS DISTINCT FROM NEW.projeto_id', 'upsert'),
+    ('squad', 'atividades', 'UPDATE',
+     'SELECT id FROM squads WHERE id IN (OLD.squad_id, NEW.squad_id) AND OLD.squad_id IS DISTINCT FROM NEW.squad_id', 'upsert'),
+    ('atividade', 'atividades', 'DELETE', 'SELECT OLD.id AS id', 'delete'),
+    # Só se o pai ainda existe: na remoção em cascata ele já pode ter virado lápide
+    ('projeto', 'atividades', 'DELETE', 'SELECT id FROM projetos WHERE id = OLD.projeto_id', 'upsert'),
+    ('squad', 'atividades', 'DELETE', 'SELECT id FROM squads WHERE id = OLD.squad_id', 'upsert'),
+
+    ('projeto', 'projeto_squad', 'INSERT', 'SELECT id FROM projetos WHERE id = NEW.projeto_id', 'upsert'),
+    ('squad', 'projeto_squad', 'INSERT', 'SELECT id FROM squads WHERE id = NEW.squad_id', 'upsert'),
+    ('projeto', 'projeto_squad', 'DELETE', 'SELECT id FROM projetos WHERE id = OLD.projeto_id', 'upsert'),
+    ('squad', 'projeto_squad', 'DELETE', 'SELECT id FROM squads WHERE id = OLD.squad_id', 'upsert'),
+]
+
+_TABELAS = ('projetos', 'squads', 'atividades', 'projeto_squad')
+_EVENTOS = {'INSERT': 'ai', 'UPDATE': 'au', 'DELETE': 'ad'}
+
+
+def _registrar_sqlite(entidade, ids, op):
+    # seq = maior seq + 1 (escritas no SQLite são serializadas). As linhas
+    # nunca são apagadas, só atualizadas, então max(seq) nunca diminui.
+    # IS NOT equivale a IS DISTINCT FROM, que só existe a partir do SQLite 3.39
+    ids = ids.replace(' IS DISTINCT FROM ', ' IS NOT ')
+    return (
+        f"INSERT INTO alteracoes (entidade, registro_id, seq, op) "
+        f"SELECT '{entidade}', id, (SELECT coalesce(max(seq), 0) FROM alteracoes) "
+        f"+ row_number() OVER (ORDER BY id), '{op}' FROM ({ids}) WHERE true "
+        f"ON CONFLICT (entidade, registro_id) DO UPDATE SET seq = excluded.seq, op = excluded.op;"
+    )
+
+
+def _ddl_sqlite():
+    comandos = []
+    for tabela in _TABELAS:
+        for evento, sufixo in _EVENTOS.items():
+            corpo = ' '.join(
+                _registrar_sqlite(entidade, ids, op)
+                for entidade, origem, ev, ids, op in _REGRAS if origem == tabela and ev == evento
+            )
+            if not corpo:
+                continue
+            comandos.append(
+                f"CREATE TRIGGER IF NOT EXISTS alteracoes_{tabela}_{sufixo} "
+                f"AFTER {evento} ON {tabela} FOR EACH ROW BEGIN {corpo} END"
+            )
+    return comandos
+
+
+def _ddl_postgresql():
+    comandos = [
+        "CREATE SEQUENCE IF NOT EXISTS alteracoes_seq",
+        # O lock vale até o commit: com um escritor por vez, a ordem de seq é
+        # a ordem dos commits e nenhum cliente pula uma alteração ainda não
+        # visível com seq menor que o cursor
+        "CREATE OR REPLACE FUNCTION alteracoes_registrar(p_entidade text, p_id integer, p_op text) "
+        "RETURNS void AS $$ BEGIN "
+        f"PERFORM pg_advisory_xact_lock({_LOCK_ALTERACOES}); "
+        "INSERT INTO alteracoes (entidade, registro_id, seq, op) "
+        "VALUES (p_entidade, p_id, nextval('alteracoes_seq'), p_op) "
+        "ON CONFLICT (entidade, registro_id) DO UPDATE SET seq = EXCLUDED.seq, op = EXCLUDED.op; "
+        "END $$ LANGUAGE plpgsql",
+    ]
+    for tabela in _TABELAS:
+        blocos = {}
+        for evento in _EVENTOS:
+            chamadas = ' '.join(
+                f"PERFORM alteracoes_registrar('{entidade}', sub.id, '{op}') FROM ({ids}) AS sub;"
+                for entidade, origem, ev, ids, op in _REGRAS if origem == tabela and ev == evento
+            )
+            if chamadas:
+                blocos[evento] = f"IF TG_OP = '{evento}' THEN {chamadas} END IF;"
+        comandos += [
+            f"CREATE OR REPLACE FUNCTION alteracoes_{tabela}() RETURNS trigger AS $$ BEGIN "
+            f"{' '.join(blocos.values())} RETURN NULL; END $$ LANGUAGE plpgsql",
+            f"DROP TRIGGER IF EXISTS alteracoes_{tabela} ON {tabela}",
+            f"CREATE TRIGGER alteracoes_{tabela} AFTER {' OR '.join(blocos)} ON {tabela} "
+            f"FOR EACH ROW EXECUTE FUNCTION alteracoes_{tabela}()",
+        ]
+    return comandos
+
+
+def change_log_ddl(dialeto):
+    """Comandos que criam os triggers que preenchem a tabela alteracoes"""
+    if dialeto == 'sqlite':
+        return _ddl_sqlite()
+    if dialeto == 'postgresql':
+        return _ddl_postgresql()
+    return []
+
+
+def _preencher(connection, dialeto):
+    """
+    Registra os registros que já existem
+
+    Numa reinstalação, alterações feitas sem os triggers não ficaram no
+    registro: todos os registros recebem um seq novo.
+    """
+    for entidade, tabela in ENTIDADES.items():
+        if dialeto == 'postgresql':
+            seq = "nextval('alteracoes_seq')"
+        else:
+            seq = "(SELECT coalesce(max(seq), 0) FROM alteracoes) + row_number() OVER (ORDER BY id)"
+        connection.execute(text(
+            f"INSERT INTO alteracoes (entidade, registro_id, seq, op) "
+            f"SELECT '{entidade}', id, {seq}, 'upsert' FROM {tabela} WHERE true ORDER BY id "
+            f"ON CONFLICT (entidade, registro_id) DO UPDATE SET seq = excluded.seq, op = excluded.op"
+        ))
+
+
+def install_change_log(connection):
+    """
+    Cria os triggers do registro de alterações e registra os dados atuais
+
+    Não faz nada se os triggers já existem ou se a tabela alteracoes não existe.
+    """
+    dialeto = connection.dialect.name
+    if 'alteracoes' not in inspect(connection).get_table_names():
+        return
+    if dialeto == 'sqlite':
+        existe = connection.execute(text(
+            "SELECT 1 FROM sqlite_master WHERE type = 'trigger' AND name = 'alteracoes_projetos_ai'"
+        )).first()
+    elif dialeto == 'postgresql':
+        existe = connection.execute(text(
+            "SELECT 1 FROM pg_trigger WHERE tgname = 'alteracoes_projetos'"
+        )).first()
+    else:
+        return
+    if existe:
+        return
+
+    for comando in change_log_ddl(dialeto):
+        connection.execute(text(comando))
+    _preencher(connection, dialeto)
+
+
+def uninstall_change_log(connection):
+    """Remove triggers, funções e a sequência do registro de alterações"""
+    dialeto = connection.dialect.name
+    for tabela in _TABELAS:
+        if dialeto == 'sqlite':
+            for sufixo in _EVENTOS.values():
+                connection.execute(text(f'DROP TRIGGER IF EXISTS alteracoes_{tabela}_{sufixo}'))
+        elif dialeto == 'postgresql':
+            connection.execute(text(f'DROP TRIGGER IF EXISTS alteracoes_{tabela} ON {tabela}'))
+            connection.execute(text(f'DROP FUNCTION IF EXISTS alteracoes_{tabela}()'))
+    if dialeto == 'postgresql':
+        connection.execute(text('DROP FUNCTION IF EXISTS alteracoes_registrar(text, integer, text)'))
+        connection.execute(text('DROP SEQUENCE IF EXISTS alteracoes_seq'))
@@ -0,0 +1,230 @@
+import logging
+import re
+import sys
+import threading
+import time
+from pathlib import Path
+import click
+from sqlalchemy import event, text
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.pool import QueuePool
+from app import db
+
+logger = logging.getLogger(__name__)
+
+
+class PoolStats:
+    """
+    Métricas do pool de conexões do processo
+
+    Mede quanto tempo cada checkout esperou por uma conexão livre e a idade
+    das conexões entregues, para dimensionar DB_POOL_SIZE em função do
+    número de threads/workers em vez de chutar.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.wait_warn_seconds = 0.1
+        self.reset()
+
+    def reset(self):
+        with self._lock:
+            self.checkouts = 0
+            self.wait_total = 0.0
+            self.wait_max = 0.0
+            self.slow_waits = 0
+            self.connections_created = 0
+            self.age_total = 0.0
+            self.age_max = 0.0
+
+    def record_wait(self, segundos):
+        with self._lock:
+            self.checkouts += 1
+            self.wait_total += segundos
+            self.wait_max = max(self.wait_max, segundos)
+            lento = segundos >= self.wait_warn_seconds
+            if lento:
+                self.slow_waits += 1
+        if lento:
+            logger.warning('Espera de %.1f ms por conexão do pool', segundos * 1000)
+
+    def record_connect(self):
+        with self._lock:
+            self.connections_created += 1
+
+    def record_age(self, segundos):
+        with self._lock:
+            self.age_total += segundos
+            self.age_max = max(self.age_max, segundos)
+
+    def snapshot(self, pool=None):
+        """Retorna as métricas atuais (e o estado do pool, se informado)"""
+        with self._lock:
+            dados = {
+                'checkouts': self.checkouts,
+                'wait_avg_ms': round(self.wait_total / self.checkouts * 1000, 3) if self.checkouts else None,
+                'wait_max_ms': round(self.wait_max * 1000, 3),
+                'slow_waits': self.slow_waits,
+                'connections_created': self.connections_created,
+                'connection_age_avg_s': round(self.age_total / self.checkouts, 1) if self.checkouts else None,
+                'connection_age_max_s': round(self.age_max, 1),
+            }
+        if isinstance(pool, QueuePool):
+            dados.update({
+                'pool_size': pool.size(),
+                'checked_in': pool.checkedin(),
+                'checked_out': pool.checkedout(),
+                'overflow': max(0, pool.overflow()),
+            })
+        return dados
+
+
+pool_stats = PoolStats()
+
+
+class MonitoredQueuePool(QueuePool):
+    """QueuePool que registra o tempo de espera de cada checkout em pool_stats"""
+
+    def connect(self):
+        inicio = time.perf_counter()
+        conexao = super().connect()
+        pool_stats.record_wait(time.perf_counter() - inicio)
+        return conexao
+
+
+def prepare_engine_options(app):
+    """
+    Completa SQLALCHEMY_ENGINE_OPTIONS antes da criação do engine
+
+    Quando o pool é configurável (pool_size definido), usa MonitoredQueuePool
+    para medir a espera por conexões.
+    """
+    opcoes = dict(app.config.get('SQLALCHEMY_ENGINE_OPTIONS') or {})
+    if 'pool_size' in opcoes and 'poolclass' not in opcoes:
+        opcoes['poolclass'] = MonitoredQueuePool
+    app.config['SQLALCHEMY_ENGINE_OPTIONS'] = opcoes
+    pool_stats.wait_warn_seconds = app.config.get('DB_POOL_WAIT_WARN_MS', 100) / 1000
+
+
+def configure_engine(app):
+    """
+    Aplica ajustes de conexão conforme o banco configurado
+
+    Para SQLite, cada nova conexão recebe os PRAGMAs que permitem leituras
+    concorrentes com uma escrita (WAL), esperam o lock em vez de falhar na
+    hora (busy_timeout) e reduzem fsyncs (synchronous=NORMAL, seguro com WAL).
+    Em qualquer banco, registra criação e idade das conexões em pool_stats.
+
+    Args:
+        app: Aplicação Flask (usa o engine de db)
+    """
+    with app.app_context():
+        engine = db.engine
+
+    @event.listens_for(engine, 'connect')
+    def _registrar_conexao(dbapi_connection, connection_record):
+        connection_record.info['conectado_em'] = time.monotonic()
+        pool_stats.record_connect()
+
+    @event.listens_for(engine, 'checkout')
+    def _registrar_idade(dbapi_connection, connection_record, connection_proxy):
+        conectado_em = connection_record.info.get('conectado_em')
+        if conectado_em is not None:
+            pool_stats.record_age(time.monotonic() - conectado_em)
+
+    if engine.dialect.name == 'sqlite':
+        em_memoria = engine.url.database in (None, '', ':memory:')
+        journal_mode = app.config['SQLITE_JOURNAL_MODE']
+        busy_timeout = app.config['SQLITE_BUSY_TIMEOUT_MS']
+        synchronous = app.config['SQLITE_SYNCHRONOUS']
+
+        @event.listens_for(engine, 'connect')
+        def _sqlite_pragmas(dbapi_connection, connection_record):
+            cursor = dbapi_connection.cursor()
+            if not em_memoria and journal_mode:
+                cursor.execute(f'PRAGMA journal_mode={journal_mode}')
+            cursor.execute(f'PRAGMA busy_timeout={int(busy_timeout)}')
+            if synchronous:
+                cursor.execute(f'PRAGMA synchronous={synchronous}')
+            cursor.close()
+
+
+def migration_heads(diretorio):
+    """
+    Revisões head das migrations em `diretorio`
+
+    Lê revision/down_revision direto dos arquivos, sem importar o Alembic
+    (que custa mais que o restante da inicialização).
+    """
+    revisoes, anteriores = set(), set()
+    for caminho in Path(diretorio).glob('*.py'):
+        texto = caminho.read_text(encoding='utf-8')
+        revisao = re.search(r"^revision\s*=\s*['\"]([^'\"]+)['\"]", texto, re.M)
+        if revisao:
+            revisoes.add(revisao.group(1))
+        anterior = re.search(r'^down_revision\s*=\s*(.+)$', texto, re.M)
+        if anterior:
+            anteriores.update(re.findall(r"['\"]([^'\"]+)['\"]", anterior.group(1)))
+    return revisoes - anteriores
+
+
+def _executando_flask_db():
+    """True dentro de um comando `flask db ...` (que é quem atualiza o schema)"""
+    return click.get_current_context(silent=True) is not None and 'db' in sys.argv[1:]
+
+
+class SchemaOutdatedError(RuntimeError):
+    """Banco fora da última migration: a aplicação não sobe sem flask db upgrade"""
+
+
+def _revisoes_atuais(app):
+    with app.app_context():
+        try:
+            with db.engine.connect() as conexao:
+                return set(conexao.execute(text('SELECT version_num FROM alembic_version')).scalars())
+        except SQLAlchemyError:
+            return set()
+
+
+def upgrade_schema(app):
+    """Aplica as migrations pendentes (equivale a flask db upgrade)"""
+    from flask_migrate import upgrade
+    from app import init_migrations
+
+    if 'migrate' not in app.extensions:
+        init_migrations(app)
+    with app.app_context():
+        upgrade(directory=str(Path(app.root_path).parent / 'migrations'))
+
+
+def check_schema_version(app):
+    """
+    Confere se o banco está na última migration
+
+    Substitui o db.create_all() da inicialização: uma consulta a
+    alembic_version em vez de refletir todas as tabelas a cada processo.
+    Com SCHEMA_UPGRADE, aplica as migrations pendentes. Sem ele, um banco
+    desatualizado impede a inicialização: as rotas falhariam com 500 na
+    primeira coluna que ainda não existe.
+
+    Raises:
+        SchemaOutdatedError: Se o banco não está na última migration
+    """
+    diretorio = Path(app.root_path).parent / 'migrations' / 'versions'
+    if not app.config.get('SCHEMA_CHECK', True) or not diretorio.is_dir() or _executando_flask_db():
+        return
+
+    esperadas = migration_heads(diretorio)
+    atuais = _revisoes_atuais(app)
+    if atuais == esperadas:
+        return
+    if app.config.get('SCHEMA_UPGRADE'):
+        logger.warning('Aplicando migrations pendentes (%s -> %s)',
+                       ', '.join(sorted(atuais)) or 'nenhuma', ', '.join(sorted(esperadas)))
+        upgrade_schema(app)
+        return
+    if not atuais:
+        raise SchemaOutdatedError('Banco sem schema das migrations (alembic_version ausente ou vazia); '
+                                  'execute: flask db upgrade')
+    raise SchemaOutdatedError(f"Banco na revisão {', '.join(sorted(atuais))}, migrations em "
+                              f"{', '.join(sorted(esperadas))}; execute: flask db upgrade")
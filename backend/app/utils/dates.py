@@ -0,0 +1,34 @@
+from datetime import date
+from functools import lru_cache
+
+
+@lru_cache(maxsize=4096)
+def _parse_iso(valor):
+    # Aceita apenas AAAA-MM-DD (fromisoformat também aceitaria AAAAMMDD)
+    if len(valor) != 10 or valor[4] != '-' or valor[7] != '-':
+        raise ValueError
+    return date.fromisoformat(valor)
+
+
+def parse_date(valor, campo=None):
+    """
+    Converte 'YYYY-MM-DD' em date (None/'' viram None)
+
+    O resultado é guardado em cache por texto: importações e lotes repetem
+    as mesmas poucas datas milhares de vezes, e cada uma é convertida só
+    uma vez.
+
+    Args:
+        valor: Texto da data
+        campo: Nome do campo, usado na mensagem de erro
+
+    Raises:
+        ValueError: Data em formato inválido
+    """
+    if valor is None or valor == '':
+        return None
+    try:
+        return _parse_iso(valor.strip())
+    except (AttributeError, TypeError, ValueError):
+        onde = f' em {campo}' if campo else ''
+        raise ValueError(f'Data inválida{onde}. Use o formato YYYY-MM-DD') from None
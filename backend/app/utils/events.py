@@ -0,0 +1,365 @@
+from collections import deque
+import json
+import logging
+import queue
+import threading
+import time
+
+logger = logging.getLogger(__name__)
+
+
+class EventsUnavailable(RuntimeError):
+    """Stream de eventos desativado ou com o limite de conexões atingido"""
+
+
+class EventBackend:
+    """
+    Interface dos backends de eventos
+
+    O backend numera os eventos (version, crescente) e os leva até todos os
+    processos da aplicação; em cada processo, o EventBroker entrega as
+    mensagens recebidas às conexões abertas. Mensagens são texto JSON.
+    """
+    name = 'base'
+
+    def next_version(self):
+        raise NotImplementedError
+
+    def current_version(self):
+        raise NotImplementedError
+
+    def publish(self, mensagem):
+        raise NotImplementedError
+
+    def start(self, entregar):
+        """Passa a chamar entregar(mensagem) para cada evento publicado"""
+        raise NotImplementedError
+
+
+class LocalEvents(EventBackend):
+    """Entrega direta, dentro do processo (um único worker)"""
+    name = 'memory'
+
+    def __init__(self):
+        self._versao = 0
+        self._lock = threading.Lock()
+        self._entregar = None
+
+    def next_version(self):
+        with self._lock:
+            self._versao += 1
+            return self._versao
+
+    def current_version(self):
+        return self._versao
+
+    def publish(self, mensagem):
+        if self._entregar is not None:
+            self._entregar(mensagem)
+
+    def start(self, entregar):
+        self._entregar = entregar
+
+
+class RedisEvents(EventBackend):
+    """
+    Pub/sub do Redis (ou servidor compatível), para vários workers
+
+    A versão é um contador no servidor (INCR), comum a todos os processos.
+    Cada processo mantém uma thread inscrita no canal, iniciada na primeira
+    conexão de cliente ou chamada a listen(): processos sem clientes nem
+    ouvintes só publicam.
+
+    Args:
+        client: URL (redis://...) ou objeto cliente com incr/get/publish/pubsub
+        prefix: Prefixo da chave do contador e do canal
+    """
+    name = 'redis'
+
+    def __init__(self, client, prefix='monitorop:'):
+        if isinstance(client, str):
+            import redis
+            client = redis.Redis.from_url(client)
+        self.client = client
+        self.canal = f'{prefix}eventos'
+        self.chave_versao = f'{prefix}eventos:versao'
+
+    def next_version(self):
+        return int(self.client.incr(self.chave_versao))
+
+    def current_version(self):
+        return int(self.client.get(self.chave_versao) or 0)
+
+    def publish(self, mensagem):
+        self.client.publish(self.canal, mensagem)
+
+    def start(self, entregar):
+        threading.Thread(target=self._escutar, args=(entregar,), name='eventos-redis', daemon=True).start()
+
+    def _escutar(self, entregar):
+        espera = 1
+        while True:
+            try:
+                pubsub = self.client.pubsub(ignore_subscribe_messages=True)
+                pubsub.subscribe(self.canal)
+                espera = 1
+                for mensagem in pubsub.listen():
+                    dados = mensagem['data']
+                    entregar(dados.decode('utf-8') if isinstance(dados, bytes) else dados)
+            except Exception:
+                logger.warning('Conexão de eventos com o Redis perdida; nova tentativa em %d s', espera,
+                               exc_info=True)
+                time.sleep(espera)
+                espera = min(espera * 2, 30)
+
+
+# Marcador na fila de uma assinatura: o cliente perdeu eventos e deve recarregar tudo
+RESET = object()
+
+
+class Assinatura:
+    """Fila de eventos de uma conexão do stream"""
+
+    def __init__(self, tamanho):
+        self.fila = queue.Queue(tamanho)
+        self.descartada = False
+
+    def entregar(self, item):
+        """Enfileira sem bloquear; cliente lento demais recebe RESET e é encerrado"""
+        if self.descartada:
+            return False
+        try:
+            self.fila.put_nowait(item)
+            return True
+        except queue.Full:
+            self.descartada = True
+            # Libera uma posição para o RESET: os eventos pendentes já não servem
+            while True:
+                try:
+                    self.fila.get_nowait()
+                except queue.Empty:
+                    break
+            self.fila.put_nowait(RESET)
+            return False
+
+    def proximos(self, espera):
+        """
+        Eventos disponíveis, aguardando até `espera` segundos pelo primeiro
+
+        Returns:
+            list: (versão, mensagem) em ordem de chegada, podendo terminar em
+            RESET; vazia se nada chegou no prazo
+        """
+        try:
+            itens = [self.fila.get(timeout=espera)]
+        except queue.Empty:
+            return []
+        # Rajadas (lotes, importações) saem em um único envio
+        while itens[-1] is not RESET:
+            try:
+                itens.append(self.fila.get_nowait())
+            except queue.Empty:
+                break
+        return itens
+
+
+class EventBroker:
+    """
+    Eventos de alteração (entity, id, op, version) para o stream SSE
+
+    As rotas chamam publish() logo após o commit. O backend numera o evento
+    e o distribui; em cada processo, o broker guarda os últimos
+    EVENTS_HISTORY eventos (para o cliente que reconecta com Last-Event-ID)
+    e os copia para a fila de cada conexão aberta. Um cliente que acumula
+    mais de EVENTS_QUEUE_SIZE eventos sem ler recebe 'reset' e é
+    desconectado, em vez de segurar memória do servidor.
+
+    id None indica alteração em vários registros da entidade (lotes,
+    importação, clonagem): o cliente recarrega a lista inteira.
+
+    O mesmo canal leva mensagens internas entre os processos (listen() /
+    publish_internal()), que não são numeradas nem chegam ao stream.
+    """
+
+    def __init__(self, app=None):
+        self.backend = None
+        self.heartbeat = 15
+        self.stream_timeout = 600
+        self.max_clients = 100
+        self.queue_size = 256
+        self._historico = deque(maxlen=1000)
+        self._ultima_versao = 0
+        self._assinaturas = set()
+        self._internos = {}
+        self._iniciado = False
+        self._lock = threading.Lock()
+        self.published = 0
+        self.publish_errors = 0
+        self.delivered = 0
+        self.dropped = 0
+        self.rejected = 0
+        if app is not None:
+            self.init_app(app)
+
+    def init_app(self, app):
+        """Configura o backend a partir de EVENTS_BACKEND ('memory', 'redis' ou 'none')"""
+        tipo = app.config.get('EVENTS_BACKEND', 'memory')
+        self.heartbeat = app.config.get('EVENTS_HEARTBEAT', 15)
+        self.stream_timeout = app.config.get('EVENTS_STREAM_TIMEOUT', 600)
+        self.max_clients = app.config.get('EVENTS_MAX_CLIENTS', 100)
+        self.queue_size = app.config.get('EVENTS_QUEUE_SIZE', 256)
+        self._historico = deque(maxlen=app.config.get('EVENTS_HISTORY', 1000))
+
+        if tipo == 'redis':
+            self.backend = RedisEvents(app.config['EVENTS_REDIS_URL'])
+        elif tipo == 'memory':
+            self.backend = LocalEvents()
+        else:
+            self.backend = None
+        self._iniciado = False
+
+        app.extensions['event_broker'] = self
+
+    def _iniciar(self):
+        # Sob self._lock, na primeira publicação ou conexão (comandos da CLI
+        # não abrem a inscrição no Redis). A versão inicial vem do backend:
+        # eventos anteriores não estão no histórico deste processo
+        if not self._iniciado:
+            self._ultima_versao = self.backend.current_version()
+            self.backend.start(self._distribuir)
+            self._iniciado = True
+
+    def publish(self, entidade, id, op):
+        """
+        Publica a alteração de um registro (chamar após o commit)
+
+        Falhas do backend são registradas no log e não afetam a requisição:
+        a alteração já foi gravada.
+
+        Args:
+            entidade: 'projeto', 'squad' ou 'atividade'
+            id: Id do registro, ou None para vários registros
+            op: 'create', 'update' ou 'delete'
+        """
+        if self.backend is None:
+            return
+        try:
+            with self._lock:
+                self._iniciar()
+            versao = self.backend.next_version()
+            mensagem = json.dumps(
+                {'entity': entidade, 'id': id, 'op': op, 'version': versao},
+                separators=(',', ':')
+            )
+            self.backend.publish(mensagem)
+            self.published += 1
+        except Exception:
+            self.publish_errors += 1
+            logger.warning('Falha ao publicar evento %s %s %s', entidade, id, op, exc_info=True)
+
+    def listen(self, tipo, callback):
+        """
+        Passa a chamar callback(dados) para as mensagens internas `tipo`
+        publicadas por qualquer processo (inclusive este)
+
+        Returns:
+            bool: False sem backend (EVENTS_BACKEND=none): nada chega
+        """
+        if self.backend is None:
+            return False
+        with self._lock:
+            self._internos[tipo] = callback
+            self._iniciar()
+        return True
+
+    def publish_internal(self, tipo, dados):
+        """
+        Publica uma mensagem interna para todos os processos
+
+        Como em publish(), falhas do backend só são registradas no log.
+        """
+        if self.backend is None:
+            return
+        try:
+            with self._lock:
+                self._iniciar()
+            self.backend.publish(json.dumps({'internal': tipo, 'data': dados}, separators=(',', ':')))
+        except Exception:
+            self.publish_errors += 1
+            logger.warning('Falha ao publicar mensagem interna %s', tipo, exc_info=True)
+
+    def _distribuir(self, mensagem):
+        """Guarda o evento no histórico e o coloca na fila de cada conexão"""
+        dados = json.loads(mensagem)
+        if 'internal' in dados:
+            callback = self._internos.get(dados['internal'])
+            if callback is not None:
+                callback(dados['data'])
+            return
+        versao = dados['version']
+        with self._lock:
+            self._historico.append((versao, mensagem))
+            self._ultima_versao = max(self._ultima_versao, versao)
+            assinaturas = list(self._assinaturas)
+        for assinatura in assinaturas:
+            ja_descartada = assinatura.descartada
+            if assinatura.entregar((versao, mensagem)):
+                self.delivered += 1
+            elif not ja_descartada:
+                self.dropped += 1
+
+    def subscribe(self, ultima_versao=None):
+        """
+        Abre uma assinatura, já com os eventos perdidos desde `ultima_versao`
+
+        Com o backend Redis, eventos publicados quase ao mesmo tempo por
+        processos diferentes podem chegar fora de ordem de versão; o cliente
+        guarda a maior versão vista.
+
+        Returns:
+            Assinatura: A primeira entrada é RESET se os eventos perdidos já
+            saíram do histórico
+
+        Raises:
+            EventsUnavailable: Eventos desativados ou limite de conexões atingido
+        """
+        if self.backend is None:
+            raise EventsUnavailable('Eventos desativados (EVENTS_BACKEND=none)')
+
+        assinatura = Assinatura(self.queue_size)
+        with self._lock:
+            if len(self._assinaturas) >= self.max_clients:
+                self.rejected += 1
+                raise EventsUnavailable('Limite de conexões de eventos atingido; tente novamente mais tarde')
+            self._iniciar()
+            if ultima_versao is not None and ultima_versao != self._ultima_versao:
+                # O histórico precisa cobrir desde a versão seguinte à do
+                # cliente; versão acima da atual vem de antes de um reinício
+                # do contador (backend em memória) e também exige recarga
+                if ultima_versao < self._ultima_versao and self._historico \
+                        and self._historico[0][0] <= ultima_versao + 1:
+                    for item in self._historico:
+                        if item[0] > ultima_versao:
+                            assinatura.entregar(item)
+                else:
+                    assinatura.entregar(RESET)
+            self._assinaturas.add(assinatura)
+        return assinatura
+
+    def unsubscribe(self, assinatura):
+        with self._lock:
+            self._assinaturas.discard(assinatura)
+
+    def stats(self):
+        """Contadores do broker"""
+        return {
+            'backend': self.backend.name if self.backend else None,
+            'clients': len(self._assinaturas),
+            'max_clients': self.max_clients,
+            'version': self._ultima_versao,
+            'published': self.published,
+            'publish_errors': self.publish_errors,
+            'delivered': self.delivered,
+            'dropped': self.dropped,
+            'rejected': self.rejected
+        }
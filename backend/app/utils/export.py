@@ -0,0 +1,162 @@
+import csv
+import io
+import os
+import tempfile
+from datetime import date, datetime
+from flask import Response, stream_with_context
+
+# Limite de linhas de uma planilha do Excel (incluindo o cabeçalho)
+XLSX_MAX_LINHAS = 1048576
+
+
+# Início de texto que o Excel/LibreOffice interpreta como fórmula ao abrir um CSV
+INICIO_FORMULA = ('=', '+', '-', '@', '\t', '\r')
+
+
+class ExportTooLarge(ValueError):
+    """Exportação com mais linhas do que o formato suporta"""
+
+
+def _texto(valor):
+    if valor is None:
+        return ''
+    if isinstance(valor, (date, datetime)):
+        return valor.isoformat()
+    # Texto digitado pelo usuário (ex: =HYPERLINK(...)) não pode virar
+    # fórmula: o apóstrofo faz a planilha exibi-lo como texto
+    if isinstance(valor, str) and valor.startswith(INICIO_FORMULA):
+        return "'" + valor
+    return valor
+
+
+def stream_csv(cabecalho, linhas, nome_arquivo, delimitador=';', linhas_por_envio=1000):
+    """
+    Cria resposta CSV gerada incrementalmente
+
+    As linhas são escritas em um buffer pequeno que é enviado e esvaziado a
+    cada `linhas_por_envio`; combinada com uma consulta em streaming
+    (yield_per), a memória não depende do número de linhas. O arquivo começa
+    com BOM UTF-8 para o Excel reconhecer os acentos. Textos que começam
+    com = + - @ recebem um apóstrofo, para não serem abertos como fórmula.
+
+    Args:
+        cabecalho: Nomes das colunas
+        linhas: Iterável de tuplas (consumido durante o envio)
+        nome_arquivo: Nome sugerido para o download
+        delimitador: Separador de campos (';' é o padrão do Excel em pt-BR)
+        linhas_por_envio: Linhas acumuladas antes de cada envio
+
+    Returns:
+        Response: Download com corpo gerado sob demanda
+    """
+    def gerar():
+        buffer = io.StringIO()
+        escritor = csv.writer(buffer, delimiter=delimitador, lineterminator='\r\n')
+        buffer.write('\ufeff')
+        escritor.writerow(cabecalho)
+
+        for numero, linha in enumerate(linhas, start=1):
+            escritor.writerow([_texto(valor) for valor in linha])
+            if numero % linhas_por_envio == 0:
+                yield buffer.getvalue()
+                buffer.seek(0)
+                buffer.truncate()
+
+        yield buffer.getvalue()
+
+    return Response(
+        stream_with_context(gerar()),
+        mimetype='text/csv',
+        headers={'Content-Disposition': f'attachment; filename="{nome_arquivo}"'}
+    )
+
+
+def xlsx_response(cabecalho, linhas, nome_arquivo, nome_planilha='Dados', bloco=64 * 1024):
+    """
+    Gera uma planilha XLSX em memória constante e a envia em blocos
+
+    Usa o modo constant_memory do XlsxWriter, que grava cada linha em disco
+    assim que a próxima começa; o .xlsx (um zip) é montado em um arquivo
+    temporário, enviado em blocos e apagado quando a resposta é fechada.
+    Textos são gravados sempre como texto, nunca como fórmula ou link.
+
+    Args:
+        cabecalho: Nomes das colunas
+        linhas: Iterável de tuplas
+        nome_arquivo: Nome sugerido para o download
+        nome_planilha: Nome da aba
+        bloco: Bytes por envio
+
+    Returns:
+        Response: Download do arquivo
+
+    Raises:
+        ImportError: XlsxWriter não instalado
+        ExportTooLarge: Mais linhas do que uma planilha suporta
+    """
+    import xlsxwriter
+
+    descritor, caminho = tempfile.mkstemp(suffix='.xlsx')
+    os.close(descritor)
+    try:
+        workbook = xlsxwriter.Workbook(caminho, {
+            'constant_memory': True,
+            'tmpdir': tempfile.gettempdir(),
+            'strings_to_formulas': False,
+            'strings_to_urls': False,
+        })
+        planilha = workbook.add_worksheet(nome_planilha)
+        negrito = workbook.add_format({'bold': True})
+        formato_data = workbook.add_format({'num_format': 'dd/mm/yyyy'})
+        formato_data_hora = workbook.add_format({'num_format': 'dd/mm/yyyy hh:mm'})
+
+        planilha.write_row(0, 0, cabecalho, negrito)
+        planilha.freeze_panes(1, 0)
+
+        numero = 0
+        for numero, linha in enumerate(linhas, start=1):
+            if numero >= XLSX_MAX_LINHAS:
+                workbook.close()
+                raise ExportTooLarge(
+                    f'A exportação tem mais de {XLSX_MAX_LINHAS - 1} linhas, o limite do XLSX; '
+                    'use format=csv ou aplique filtros'
+                )
+            for coluna, valor in enumerate(linha):
+                if valor is None:
+                    continue
+                if isinstance(valor, datetime):
+                    planilha.write_datetime(numero, coluna, valor, formato_data_hora)
+                elif isinstance(valor, date):
+                    planilha.write_datetime(numero, coluna, valor, formato_data)
+                elif isinstance(valor, str):
+                    planilha.write_string(numero, coluna, valor)
+                else:
+                    planilha.write(numero, coluna, valor)
+
+        if numero:
+            planilha.autofilter(0, 0, numero, len(cabecalho) - 1)
+        workbook.close()
+        tamanho = os.path.getsize(caminho)
+    except BaseException:
+        os.remove(caminho)
+        raise
+
+    def enviar():
+        with open(caminho, 'rb') as arquivo:
+            while True:
+                dados = arquivo.read(bloco)
+                if not dados:
+                    break
+                yield dados
+
+    resposta = Response(
+        enviar(),
+        mimetype='application/vnd.openxmlformats-officedocument.spreadsheetml.sheet',
+        headers={
+            'Content-Disposition': f'attachment; filename="{nome_arquivo}"',
+            'Content-Length': str(tamanho)
+        }
+    )
+    # Roda quando o servidor fecha a resposta, mesmo se o download for interrompido
+    resposta.call_on_close(lambda: os.path.exists(caminho) and os.remove(caminho))
+    return resposta
@@ -0,0 +1,96 @@
+from functools import wraps
+from datetime import date, datetime, time, timezone
+import hashlib
+from flask import request, make_response, g
+from flask_jwt_extended import get_jwt_identity
+from sqlalchemy import select, func
+from app import db
+
+
+def table_versions(*models):
+    """
+    Calcula a versão atual das tabelas dos models informados
+
+    A versão de cada tabela é max(updated_at) + count(*): inserções e
+    alterações mudam o máximo e exclusões mudam a contagem. Tudo sai de um
+    único SELECT com subconsultas escalares (max usa o índice de updated_at).
+
+    Args:
+        *models: Models com a coluna updated_at
+
+    Returns:
+        tuple: (lista de valores que identifica a versão, última alteração ou None)
+    """
+    colunas = []
+    for model in models:
+        colunas.append(select(func.max(model.updated_at)).scalar_subquery())
+        colunas.append(select(func.count()).select_from(model).scalar_subquery())
+
+    valores = list(db.session.execute(select(*colunas)).one())
+    datas = [v for v in valores[::2] if v is not None]
+    return valores, max(datas) if datas else None
+
+
+def conditional(*models, per_user=False, per_day=False):
+    """
+    Decorator que responde GETs condicionais (ETag / Last-Modified / 304)
+
+    O ETag é derivado da rota, dos parâmetros da query string e da versão
+    das tabelas das quais a resposta depende. Se o cliente já tem essa
+    versão, a view não é executada: nem a consulta da listagem nem a
+    serialização acontecem.
+
+    Args:
+        *models: Models cujas alterações invalidam a resposta
+        per_user: Inclui o usuário do token no ETag (respostas por usuário)
+        per_day: Inclui a data de hoje no ETag (respostas que dependem de
+            date.today(), como atrasadas e a janela padrão da timeline)
+    """
+    def decorator(view):
+        @wraps(view)
+        def wrapper(*args, **kwargs):
+            versao, ultima_alteracao = table_versions(*models)
+
+            partes = [request.path, sorted(request.args.items(multi=True)), versao]
+            if per_user:
+                partes.append(get_jwt_identity())
+            hoje = date.today()
+            if per_day:
+                partes.append(hoje.isoformat())
+            etag = hashlib.sha1(repr(partes).encode('utf-8')).hexdigest()
+            # Chave do cache de respostas (cache.cached): a mesma versão lida do
+            # banco, comum a todos os processos
+            g.etag = etag
+
+            if ultima_alteracao is not None:
+                ultima_alteracao = ultima_alteracao.replace(microsecond=0, tzinfo=timezone.utc)
+            if per_day:
+                # A resposta muda à meia-noite mesmo sem nenhuma escrita
+                meia_noite = datetime.combine(hoje, time()).astimezone(timezone.utc)
+                if ultima_alteracao is None or ultima_alteracao < meia_noite:
+                    ultima_alteracao = meia_noite
+
+            if request.if_none_match:
+                nao_modificado = request.if_none_match.contains(etag)
+            else:
+                nao_modificado = (
+                    request.if_modified_since is not None
+                    and ultima_alteracao is not None
+                    and ultima_alteracao <= request.if_modified_since
+                )
+
+            if nao_modificado:
+                resposta = make_response('', 304)
+            else:
+                resposta = make_response(view(*args, **kwargs))
+                if resposta.status_code != 200:
+                    return resposta
+
+            resposta.set_etag(etag)
+            if ultima_alteracao is not None:
+                resposta.last_modified = ultima_alteracao
+            # O navegador pode guardar a resposta, mas sempre revalida
+            resposta.headers['Cache-Control'] = 'no-cache'
+            return resposta
+        return wrapper
+    return decorator
@@ -0,0 +1,194 @@
+from collections import OrderedDict
+from datetime import datetime, timezone
+import threading
+import time
+
+
+class IdentityCache:
+    """
+    Usuários dos tokens JWT em memória, com revogação de tokens
+
+    Cada requisição autenticada precisa saber se o usuário do token ainda
+    existe e está ativo (os tokens não expiram). Os dados do usuário ficam
+    em um LRU por id, válidos por IDENTITY_CACHE_TTL segundos; no caminho
+    quente, a verificação não faz nenhuma consulta. atualizar_usuario e
+    deletar_usuario chamam invalidate(id), que descarta a entrada neste
+    processo e avisa os demais pelo canal do EventBroker.
+
+    Tokens revogados pelo logout são gravados em tokens_revogados (valem
+    para todos os processos e depois de um reinício) e copiados para um
+    conjunto em memória por jti, até o vencimento do token. Cada processo
+    lê a tabela na primeira verificação e recebe as revogações seguintes
+    pelo mesmo canal.
+    """
+
+    def __init__(self, app=None, jwt=None, events=None):
+        self.ttl = 60
+        self.max_entries = 10000
+        self._entries = OrderedDict()
+        # Invalidações por id: um carregamento que cruzou um invalidate() não é guardado
+        self._geracoes = {}
+        self._revogados = {}
+        self._lock = threading.Lock()
+        self._preparado = False
+        self._lock_preparo = threading.Lock()
+        self.events = None
+        self.hits = 0
+        self.misses = 0
+        if app is not None:
+            self.init_app(app, jwt, events)
+
+    def init_app(self, app, jwt, events):
+        """
+        Lê IDENTITY_CACHE_* e registra os loaders do flask_jwt_extended
+
+        Args:
+            events: EventBroker que leva invalidações e revogações aos outros processos
+        """
+        self.ttl = app.config.get('IDENTITY_CACHE_TTL', 60)
+        self.max_entries = app.config.get('IDENTITY_CACHE_MAX_ENTRIES', 10000)
+        self.events = events
+        self._preparado = False
+        jwt.token_in_blocklist_loader(self._token_revogado)
+        jwt.user_lookup_loader(self._usuario_do_token)
+        app.extensions['identity_cache'] = self
+
+    def _carregar(self, usuario_id):
+        from app import db
+        from app.models import Usuario
+
+        usuario = db.session.get(Usuario, usuario_id)
+        if usuario is None:
+            return None
+        criado_em = usuario.created_at.replace(tzinfo=timezone.utc).timestamp() if usuario.created_at else 0
+        return {'usuario': usuario.to_dict(), 'ativo': bool(usuario.ativo), 'criado_em': criado_em}
+
+    def get(self, usuario_id):
+        """
+        Dados do usuário (None se não existe), do cache ou do banco
+
+        Returns:
+            dict: {'usuario': to_dict(), 'ativo': bool, 'criado_em': timestamp} ou None
+        """
+        agora = time.monotonic()
+        with self._lock:
+            item = self._entries.get(usuario_id)
+            if item is not None and item[1] > agora:
+                self._entries.move_to_end(usuario_id)
+                self.hits += 1
+                return item[0]
+            self.misses += 1
+            geracao = self._geracoes.get(usuario_id, 0)
+
+        # Fora do lock: a consulta não bloqueia as outras threads
+        dados = self._carregar(usuario_id)
+        with self._lock:
+            if self._geracoes.get(usuario_id, 0) != geracao:
+                # invalidate() durante a consulta: os dados lidos podem ser
+                # anteriores à alteração (ex: usuário ainda ativo)
+                return dados
+            self._entries[usuario_id] = (dados, agora + self.ttl)
+            self._entries.move_to_end(usuario_id)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+        return dados
+
+    def _preparar(self):
+        # Na primeira verificação de token (comandos da CLI não abrem a
+        # inscrição): primeiro a inscrição no canal, depois a leitura da
+        # tabela, para não perder uma revogação feita entre as duas
+        if self._preparado:
+            return
+        with self._lock_preparo:
+            if self._preparado:
+                return
+            self.events.listen('identidade', self._receber)
+            revogados = self._carregar_revogados()
+            with self._lock:
+                self._revogados.update(revogados)
+            self._preparado = True
+
+    @staticmethod
+    def _carregar_revogados():
+        from app import db
+        from app.models import TokenRevogado
+
+        linhas = db.session.query(TokenRevogado.jti, TokenRevogado.expira_em).filter(
+            (TokenRevogado.expira_em.is_(None)) | (TokenRevogado.expira_em > datetime.utcnow())
+        )
+        return {
+            jti: expira_em.replace(tzinfo=timezone.utc).timestamp() if expira_em else None
+            for jti, expira_em in linhas
+        }
+
+    def _receber(self, dados):
+        """Mensagem de outro processo (ou deste): usuário alterado ou token revogado"""
+        if 'usuario_id' in dados:
+            self._descartar(dados['usuario_id'])
+        if 'jti' in dados:
+            self._guardar_revogacao(dados['jti'], dados.get('exp'))
+
+    def _descartar(self, usuario_id):
+        with self._lock:
+            self._entries.pop(usuario_id, None)
+            self._geracoes[usuario_id] = self._geracoes.get(usuario_id, 0) + 1
+
+    def _guardar_revogacao(self, jti, exp):
+        agora = time.time()
+        with self._lock:
+            # Aproveita para descartar revogações de tokens já vencidos
+            for vencido in [j for j, e in self._revogados.items() if e is not None and e < agora]:
+                del self._revogados[vencido]
+            self._revogados[jti] = exp
+
+    def invalidate(self, usuario_id):
+        """Descarta o usuário do cache de todos os processos (chamar após alterá-lo ou removê-lo)"""
+        self._descartar(usuario_id)
+        self.events.publish_internal('identidade', {'usuario_id': usuario_id})
+
+    def revoke(self, claims):
+        """Revoga o token com essas claims (jti) até o seu vencimento, em todos os processos"""
+        from app import db
+        from app.models import TokenRevogado
+
+        jti, exp = claims['jti'], claims.get('exp')
+        expira_em = datetime.fromtimestamp(exp, timezone.utc).replace(tzinfo=None) if exp else None
+        db.session.query(TokenRevogado).filter(TokenRevogado.expira_em < datetime.utcnow()).delete()
+        db.session.merge(TokenRevogado(jti=jti, expira_em=expira_em))
+        db.session.commit()
+        self._guardar_revogacao(jti, exp)
+        self.events.publish_internal('identidade', {'jti': jti, 'exp': exp})
+
+    def _token_revogado(self, jwt_header, jwt_payload):
+        """
+        Token inválido se revogado, se o usuário não existe ou está inativo,
+        ou se foi emitido antes da criação do usuário (id reaproveitado)
+        """
+        self._preparar()
+        with self._lock:
+            if jwt_payload.get('jti') in self._revogados:
+                return True
+        try:
+            dados = self.get(int(jwt_payload['sub']))
+        except (KeyError, ValueError):
+            return True
+        if dados is None or not dados['ativo']:
+            return True
+        return jwt_payload.get('iat', 0) + 1 < dados['criado_em']
+
+    def _usuario_do_token(self, jwt_header, jwt_payload):
+        # current_user: o dict do usuário (já verificado por _token_revogado)
+        dados = self.get(int(jwt_payload['sub']))
+        return dados['usuario'] if dados else None
+
+    def stats(self):
+        """Contadores do cache"""
+        with self._lock:
+            consultas = self.hits + self.misses
+            return {
+                'entries': len(self._entries),
+                'hits': self.hits,
+                'misses': self.misses,
+                'hit_ratio': round(self.hits / consultas, 4) if consultas else None,
+                'revoked_tokens': len(self._revogados)
+            }
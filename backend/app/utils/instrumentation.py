@@ -0,0 +1,99 @@
+import logging
+import time
+import warnings
+from flask import g, request, has_request_context
+from sqlalchemy import event
+
+logger = logging.getLogger(__name__)
+
+
+class SQLBudgetWarning(UserWarning):
+    """Requisição executou mais SQL do que SQL_STATEMENT_BUDGET permite"""
+
+
+def _resumir_parametros(parametros, limite=500):
+    """Representação curta dos parâmetros de um statement (executemany resume o lote)"""
+    if isinstance(parametros, (list, tuple)) and parametros and isinstance(parametros[0], (list, tuple, dict)):
+        texto = f'{len(parametros)} linhas, primeira={parametros[0]!r}'
+    else:
+        texto = repr(parametros)
+    if len(texto) > limite:
+        texto = texto[:limite] + '...'
+    return texto
+
+
+def _rota():
+    regra = request.url_rule.rule if request.url_rule else request.path
+    return f'{request.method} {regra}'
+
+
+def init_instrumentation(app, engine):
+    """
+    Mede o SQL executado em cada requisição
+
+    Conta os statements e soma o tempo gasto no banco por requisição (eventos
+    before/after_cursor_execute) e devolve os totais no header Server-Timing.
+    Statements acima de SLOW_QUERY_MS são registrados com a rota e os
+    parâmetros. Se SQL_STATEMENT_BUDGET estiver definido (desenvolvimento),
+    requisições que passarem do limite emitem SQLBudgetWarning, o que
+    denuncia consultas N+1 em to_dict() assim que aparecem.
+
+    Args:
+        app: Aplicação Flask
+        engine: Engine SQLAlchemy da aplicação
+    """
+    limite_lento = app.config.get('SLOW_QUERY_MS', 200) / 1000
+    orcamento = app.config.get('SQL_STATEMENT_BUDGET')
+    server_timing = app.config.get('SERVER_TIMING', True)
+
+    @event.listens_for(engine, 'before_cursor_execute')
+    def _inicio_statement(conn, cursor, statement, parameters, context, executemany):
+        # No contexto de execução, e não numa pilha em conn.info: um statement
+        # que falha não chega ao after_cursor_execute e deixaria o início dele
+        # empilhado na conexão do pool, casando com o fim dos seguintes
+        context._inicio_statement = time.perf_counter()
+
+    @event.listens_for(engine, 'after_cursor_execute')
+    def _fim_statement(conn, cursor, statement, parameters, context, executemany):
+        duracao = time.perf_counter() - context._inicio_statement
+
+        if has_request_context() and 'sql_count' in g:
+            g.sql_count += 1
+            g.sql_time += duracao
+            rota = _rota()
+        else:
+            rota = '(fora de requisição)'
+
+        if duracao >= limite_lento:
+            logger.warning(
+                'SQL lento (%.1f ms) em %s: %s | parâmetros: %s',
+                duracao * 1000, rota, ' '.join(statement.split()), _resumir_parametros(parameters)
+            )
+
+    @app.before_request
+    def _iniciar_medicao():
+        g.sql_count = 0
+        g.sql_time = 0.0
+        g.inicio_requisicao = time.perf_counter()
+
+    @app.after_request
+    def _server_timing(resposta):
+        if server_timing and 'sql_count' in g:
+            total = (time.perf_counter() - g.inicio_requisicao) * 1000
+            # Em respostas em streaming, o SQL dos lotes seguintes ainda não rodou
+            resposta.headers.add(
+                'Server-Timing',
+                f'db;dur={g.sql_time * 1000:.2f};desc="{g.sql_count} SQL", app;dur={total:.2f}'
+            )
+        return resposta
+
+    if orcamento:
+        @app.teardown_request
+        def _verificar_orcamento(exc):
+            # teardown roda depois do fim do streaming, com a contagem completa
+            if 'sql_count' in g and g.sql_count > orcamento:
+                warnings.warn(
+                    f'{_rota()} executou {g.sql_count} statements SQL '
+                    f'(orçamento: {orcamento}); verifique consultas N+1',
+                    SQLBudgetWarning, stacklevel=2
+                )
@@ -0,0 +1,197 @@
+import sys
+import threading
+import time
+from bisect import bisect_left
+from flask import g, request
+
+# Limites (em segundos) dos buckets de latência; p50/p95/p99 saem de
+# histogram_quantile() no Prometheus
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.075, 0.1, 0.25, 0.5, 0.75, 1.0, 2.5, 5.0, 10.0)
+# Limites (em bytes) dos buckets de tamanho de resposta
+SIZE_BUCKETS = (256, 1024, 4096, 16384, 65536, 262144, 1048576, 4194304, 16777216)
+
+
+class _Shard:
+    """Contadores de uma thread; só ela escreve, então não há lock"""
+
+    def __init__(self):
+        self.requests = {}   # (endpoint, method, status) -> n
+        self.errors = {}     # endpoint -> n (status >= 500)
+        self.latency = {}    # endpoint -> [buckets..., +Inf, soma]
+        self.sizes = {}      # endpoint -> [buckets..., +Inf, soma]
+        self.db_seconds = {}  # endpoint -> soma
+
+    @staticmethod
+    def _observe(tabela, chave, limites, valor):
+        linha = tabela.get(chave)
+        if linha is None:
+            linha = tabela[chave] = [0] * (len(limites) + 1) + [0.0]
+        # Buckets não cumulativos aqui; acumulados na exportação
+        linha[bisect_left(limites, valor)] += 1
+        linha[-1] += valor
+
+
+def _local_por_thread():
+    """
+    threading.local da thread do sistema operacional
+
+    Com o monkey patching do gevent, threading.local passa a ser por
+    greenlet: cada requisição criaria um _Shard que nunca é liberado. As
+    greenlets de uma thread podem dividir o shard, porque a gravação não
+    cede a vez no meio.
+    """
+    monkey = sys.modules.get('gevent.monkey')
+    if monkey is not None and monkey.is_module_patched('threading'):
+        return monkey.get_original('threading', 'local')()
+    return threading.local()
+
+
+class RequestMetrics:
+    """
+    Métricas HTTP por endpoint no formato de exposição do Prometheus
+
+    Cada thread do servidor grava no seu próprio _Shard (threading.local),
+    inclusive sob o gevent, em que as greenlets dividem o shard da thread,
+    então registrar uma requisição não disputa lock com as outras threads.
+    O lock só é usado ao criar o shard de uma thread nova e ao exportar,
+    quando os shards são somados.
+    """
+
+    def __init__(self):
+        self._local = _local_por_thread()
+        self._shards = []
+        self._lock = threading.Lock()
+
+    def _shard(self):
+        shard = getattr(self._local, 'shard', None)
+        if shard is None:
+            shard = self._local.shard = _Shard()
+            with self._lock:
+                self._shards.append(shard)
+        return shard
+
+    def observe_request(self, endpoint, method, status, segundos, db_segundos=None):
+        shard = self._shard()
+        chave = (endpoint, method, status)
+        shard.requests[chave] = shard.requests.get(chave, 0) + 1
+        if status >= 500:
+            shard.errors[endpoint] = shard.errors.get(endpoint, 0) + 1
+        shard._observe(shard.latency, endpoint, LATENCY_BUCKETS, segundos)
+        if db_segundos is not None:
+            shard.db_seconds[endpoint] = shard.db_seconds.get(endpoint, 0.0) + db_segundos
+
+    def observe_size(self, endpoint, tamanho):
+        shard = self._shard()
+        shard._observe(shard.sizes, endpoint, SIZE_BUCKETS, tamanho)
+
+    def _somar(self, atributo):
+        total = {}
+        with self._lock:
+            shards = list(self._shards)
+        for shard in shards:
+            # dict.copy() é atômico sob o GIL; a thread dona pode seguir gravando
+            for chave, valor in getattr(shard, atributo).copy().items():
+                if isinstance(valor, list):
+                    acumulado = total.setdefault(chave, [0] * len(valor))
+                    for i, v in enumerate(list(valor)):
+                        acumulado[i] += v
+                else:
+                    total[chave] = total.get(chave, 0) + valor
+        return total
+
+    def render(self, gauges=()):
+        """
+        Gera o texto de /metrics
+
+        Args:
+            gauges: Iterável de (nome, ajuda, tipo, valor) com métricas extras
+        """
+        linhas = []
+
+        def cabecalho(nome, ajuda, tipo):
+            linhas.append(f'# HELP {nome} {ajuda}')
+            linhas.append(f'# TYPE {nome} {tipo}')
+
+        cabecalho('monitorop_http_requests_total', 'Requisições atendidas', 'counter')
+        for (endpoint, method, status), n in sorted(self._somar('requests').items()):
+            linhas.append(
+                f'monitorop_http_requests_total{{endpoint="{endpoint}",method="{method}",status="{status}"}} {n}'
+            )
+
+        cabecalho('monitorop_http_request_errors_total', 'Respostas com status 5xx', 'counter')
+        for endpoint, n in sorted(self._somar('errors').items()):
+            linhas.append(f'monitorop_http_request_errors_total{{endpoint="{endpoint}"}} {n}')
+
+        self._histograma(linhas, cabecalho, 'monitorop_http_request_duration_seconds',
+                         'Latência das requisições (até o primeiro byte em streaming)',
+                         LATENCY_BUCKETS, self._somar('latency'))
+        self._histograma(linhas, cabecalho, 'monitorop_http_response_size_bytes',
+                         'Tamanho do corpo das respostas', SIZE_BUCKETS, self._somar('sizes'))
+
+        cabecalho('monitorop_db_seconds_total', 'Tempo gasto em SQL por endpoint', 'counter')
+        for endpoint, soma in sorted(self._somar('db_seconds').items()):
+            linhas.append(f'monitorop_db_seconds_total{{endpoint="{endpoint}"}} {soma:.6f}')
+
+        for nome, ajuda, tipo, valor in gauges:
+            if valor is None:
+                continue
+            cabecalho(nome, ajuda, tipo)
+            linhas.append(f'{nome} {valor}')
+
+        return '\n'.join(linhas) + '\n'
+
+    @staticmethod
+    def _histograma(linhas, cabecalho, nome, ajuda, limites, dados):
+        cabecalho(nome, ajuda, 'histogram')
+        for endpoint, valores in sorted(dados.items()):
+            acumulado = 0
+            for limite, n in zip(list(limites) + ['+Inf'], valores[:-1]):
+                acumulado += n
+                linhas.append(f'{nome}_bucket{{endpoint="{endpoint}",le="{limite}"}} {acumulado}')
+            linhas.append(f'{nome}_sum{{endpoint="{endpoint}"}} {valores[-1]:.6f}')
+            linhas.append(f'{nome}_count{{endpoint="{endpoint}"}} {acumulado}')
+
+
+request_metrics = RequestMetrics()
+
+
+def endpoint_label():
+    """Nome do endpoint sem o prefixo do blueprint raiz (ex: 'atividades.listar_atividades')"""
+    if request.endpoint is None:
+        return 'sem_rota'
+    return request.endpoint.removeprefix('main.')
+
+
+def _contar_bytes(endpoint, pedacos):
+    """Repassa o corpo em streaming e registra o tamanho quando termina"""
+    tamanho = 0
+    try:
+        for pedaco in pedacos:
+            tamanho += len(pedaco.encode('utf-8') if isinstance(pedaco, str) else pedaco)
+            yield pedaco
+    finally:
+        if hasattr(pedacos, 'close'):
+            pedacos.close()
+        request_metrics.observe_size(endpoint, tamanho)
+
+
+def start_timer():
+    g.metrics_inicio = time.perf_counter()
+
+
+def record_response(resposta):
+    """Registra latência, status e tamanho da resposta atual"""
+    inicio = g.pop('metrics_inicio', None)
+    if inicio is None:
+        return resposta
+
+    endpoint = endpoint_label()
+    request_metrics.observe_request(
+        endpoint, request.method, resposta.status_code,
+        time.perf_counter() - inicio, g.get('sql_time')
+    )
+    if resposta.is_streamed:
+        resposta.response = _contar_bytes(endpoint, resposta.response)
+    else:
+        request_metrics.observe_size(endpoint, resposta.content_length or 0)
+    return resposta
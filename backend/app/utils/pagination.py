@@ -1,4 +1,8 @@
 from flask import request, jsonify
+from sqlalchemy import tuple_
+from datetime import datetime, date
+import base64
+import json
 
 
 def paginate_query(query, default_per_page=10):
@@ -57,4 +61,113 @@ def create_pagination_response(items, to_dict_func=None):
     else:
         items_data = [item.to_dict() for item in items]
     
-    return items_data
\ No newline at end of file
+    return items_data
+
+def _encode_cursor(valores, direcao):
+    """Serializa os valores da chave de ordenação em um cursor opaco"""
+    payload = json.dumps({
+        'v': [v.isoformat() if isinstance(v, (datetime, date)) else v for v in valores],
+        'd': direcao
+    }, separators=(',', ':'))
+    return base64.urlsafe_b64encode(payload.encode('utf-8')).decode('ascii').rstrip('=')
+
+
+def _decode_cursor(cursor, colunas):
+    """Recupera valores e direção de um cursor gerado por _encode_cursor"""
+    try:
+        padding = '=' * (-len(cursor) % 4)
+        payload = json.loads(base64.urlsafe_b64decode(cursor + padding))
+        valores, direcao = payload['v'], payload['d']
+        if direcao not in ('next', 'prev') or len(valores) != len(colunas):
+            raise ValueError
+        
+        convertidos = []
+        for coluna, valor in zip(colunas, valores):
+            tipo = coluna.type.python_type
+            if valor is not None and tipo is datetime:
+                valor = datetime.fromisoformat(valor)
+            elif valor is not None and tipo is date:
+                valor = date.fromisoformat(valor)
+            convertidos.append(valor)
+        return convertidos, direcao
+    except (ValueError, KeyError, TypeError):
+        raise ValueError('Cursor inválido')
+
+
+def paginate_keyset(query, keys, default_per_page=10):
+    """
+    Aplica paginação por cursor (keyset) a uma query SQLAlchemy
+    
+    Em vez de OFFSET, filtra pelas colunas de ordenação a partir do último
+    item visto, então o custo de uma página não cresce com a profundidade e
+    inserções concorrentes não deslocam as linhas. O total só é calculado
+    quando solicitado com with_total=1.
+    
+    Args:
+        query: Query SQLAlchemy (a ordenação existente é substituída)
+        keys: Lista de tuplas (coluna, descendente) que identifica cada linha
+              de forma única, ex: [(Atividade.created_at, True), (Atividade.id, True)].
+              Todas as colunas devem ter a mesma direção.
+        default_per_page: Número padrão de itens por página
+    
+    Returns:
+        dict: Dicionário com dados paginados e metadados
+    
+    Raises:
+        ValueError: Se o cursor informado for inválido
+    """
+    per_page = request.args.get('per_page', default_per_page, type=int)
+    per_page = max(1, min(per_page, 100))
+    cursor = request.args.get('cursor', '')
+    with_total = request.args.get('with_total', type=int) == 1
+    
+    colunas = [coluna for coluna, _ in keys]
+    descendente = keys[0][1]
+    if any(desc != descendente for _, desc in keys):
+        raise ValueError('As chaves do cursor devem ter a mesma direção')
+    
+    total = query.order_by(None).count() if with_total else None
+    
+    direcao = 'next'
+    if cursor:
+        valores, direcao = _decode_cursor(cursor, colunas)
+        chave, referencia = tuple_(*colunas), tuple_(*valores)
+        # Avançar em ordem decrescente significa buscar chaves menores
+        if (direcao == 'next') == descendente:
+            query = query.filter(chave < referencia)
+        else:
+            query = query.filter(chave > referencia)
+    
+    # Para voltar, percorre na ordem inversa e depois desinverte a página
+    inverter = direcao == 'prev'
+    ordem = [
+        coluna.desc() if descendente != inverter else coluna.asc()
+        for coluna in colunas
+    ]
+    items = query.order_by(None).order_by(*ordem).limit(per_page + 1).all()
+    
+    tem_mais = len(items) > per_page
+    items = items[:per_page]
+    if inverter:
+        items.reverse()
+        has_next, has_prev = True, tem_mais
+    else:
+        has_next, has_prev = tem_mais, bool(cursor)
+    
+    def valores_de(item):
+        return [getattr(item, coluna.key) for coluna in colunas]
+    
+    pagination = {
+        'per_page': per_page,
+        'has_next': has_next and bool(items),
+        'has_prev': has_prev and bool(items),
+        'next_cursor': _encode_cursor(valores_de(items[-1]), 'next') if has_next and items else None,
+        'prev_cursor': _encode_cursor(valores_de(items[0]), 'prev') if has_prev and items else None
+    }
+    if with_total:
+        pagination['total'] = total
+    
+    return {
+        'items': items,
+        'pagination': pagination
+    }
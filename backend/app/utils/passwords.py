@@ -0,0 +1,119 @@
+from concurrent.futures import ThreadPoolExecutor, TimeoutError as FutureTimeoutError
+import sys
+import threading
+import bcrypt
+
+
+class PasswordHasherBusy(RuntimeError):
+    """Pool de hash de senhas sem capacidade para a requisição"""
+
+
+def _pool_de_threads(workers):
+    """
+    Pool de threads do sistema operacional
+
+    Com o monkey patching do gevent (python wsgi.py, worker gevent), as
+    threads do concurrent.futures viram greenlets e o bcrypt, que não cede a
+    vez, pararia o servidor inteiro a cada login. O pool do gevent roda em
+    threads de verdade, e a espera pelo resultado cede a vez às greenlets.
+    """
+    monkey = sys.modules.get('gevent.monkey')
+    if monkey is not None and monkey.is_module_patched('threading'):
+        from gevent.threadpool import ThreadPoolExecutor as Executor
+    else:
+        Executor = ThreadPoolExecutor
+    return Executor(max_workers=workers, thread_name_prefix='bcrypt')
+
+
+class PasswordHasher:
+    """
+    Hash e verificação de senhas (bcrypt) em um pool de threads limitado
+
+    O bcrypt é caro de propósito (~250 ms com custo 12) e libera o GIL
+    enquanto calcula. Executado direto nas threads do servidor, um pico de
+    logins ocupa todos os núcleos e atrasa as demais requisições. Aqui no
+    máximo PASSWORD_HASH_WORKERS hashes rodam ao mesmo tempo; até
+    PASSWORD_HASH_QUEUE aguardam na fila, e além disso a chamada falha na
+    hora com PasswordHasherBusy (a rota responde 503).
+
+    Sem init_app (scripts fora da aplicação), o hash roda na própria thread.
+    """
+
+    def __init__(self, app=None):
+        self.rounds = 12
+        self.workers = 0
+        self.max_queue = 0
+        self.timeout = None
+        self._executor = None
+        self._lock = threading.Lock()
+        self.in_flight = 0
+        self.completed = 0
+        self.rejected = 0
+        if app is not None:
+            self.init_app(app)
+
+    def init_app(self, app):
+        """Configura custo e pool a partir de BCRYPT_ROUNDS e PASSWORD_HASH_*"""
+        self.rounds = app.config.get('BCRYPT_ROUNDS', 12)
+        self.workers = app.config.get('PASSWORD_HASH_WORKERS', 1)
+        self.max_queue = app.config.get('PASSWORD_HASH_QUEUE', 0)
+        self.timeout = app.config.get('PASSWORD_HASH_TIMEOUT', 10)
+
+        if self._executor is not None:
+            self._executor.shutdown(wait=False)
+        self._executor = _pool_de_threads(self.workers)
+
+        app.extensions['password_hasher'] = self
+
+    def _executar(self, funcao, *args):
+        if self._executor is None:
+            return funcao(*args)
+
+        with self._lock:
+            if self.in_flight >= self.workers + self.max_queue:
+                self.rejected += 1
+                raise PasswordHasherBusy('Muitas autenticações simultâneas; tente novamente em instantes')
+            self.in_flight += 1
+
+        def concluir(_):
+            with self._lock:
+                self.in_flight -= 1
+                self.completed += 1
+
+        futuro = self._executor.submit(funcao, *args)
+        futuro.add_done_callback(concluir)
+        try:
+            return futuro.result(timeout=self.timeout)
+        except FutureTimeoutError:
+            futuro.cancel()
+            with self._lock:
+                self.rejected += 1
+            raise PasswordHasherBusy('Tempo de espera pelo hash de senha esgotado') from None
+
+    def hash(self, senha):
+        """Gera o hash bcrypt de `senha` com o custo configurado"""
+        gerado = self._executar(bcrypt.hashpw, senha.encode('utf-8'), bcrypt.gensalt(self.rounds))
+        return gerado.decode('utf-8')
+
+    def verify(self, senha, senha_hash):
+        """Confere `senha` com um hash bcrypt"""
+        return self._executar(bcrypt.checkpw, senha.encode('utf-8'), senha_hash.encode('utf-8'))
+
+    def needs_rehash(self, senha_hash):
+        """True se o hash foi gerado com um custo diferente do atual ($2b$<custo>$...)"""
+        try:
+            return int(senha_hash.split('$')[2]) != self.rounds
+        except (AttributeError, IndexError, ValueError):
+            return True
+
+    def stats(self):
+        """Contadores do pool"""
+        with self._lock:
+            return {
+                'rounds': self.rounds,
+                'workers': self.workers,
+                'max_queue': self.max_queue,
+                'in_flight': self.in_flight,
+                'completed': self.completed,
+                'rejected': self.rejected
+            }
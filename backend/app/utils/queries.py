@@ -0,0 +1,88 @@
+from sqlalchemy import func
+from sqlalchemy.orm import joinedload, selectinload, with_expression
+from app import db
+from app.models import Atividade, Projeto, Squad, projeto_squad
+
+
+def atividades_query():
+    """
+    Query base para listagens de atividades
+
+    Carrega projeto e squad no mesmo SELECT (JOIN), evitando que
+    Atividade.to_dict() dispare duas consultas extras por linha.
+
+    Returns:
+        Query: Query de Atividade com os relacionamentos já carregados
+    """
+    return Atividade.query.options(
+        joinedload(Atividade.projeto),
+        joinedload(Atividade.squad)
+    )
+
+
+def _contagem_por(coluna_agrupada, coluna_contada):
+    """
+    Subquery com COUNT agrupado por uma chave estrangeira
+
+    Args:
+        coluna_agrupada: Coluna usada no GROUP BY (ex: Atividade.projeto_id)
+        coluna_contada: Coluna contada (ex: Atividade.id)
+
+    Returns:
+        Subquery: Colunas 'chave' e 'total'
+    """
+    return (
+        db.session.query(
+            coluna_agrupada.label('chave'),
+            func.count(coluna_contada).label('total')
+        )
+        .group_by(coluna_agrupada)
+        .subquery()
+    )
+
+
+def projetos_query():
+    """
+    Query base para listagens de projetos
+
+    Traz total_atividades de uma subquery agrupada no mesmo SELECT e carrega
+    as squads em uma única consulta adicional (IN), em vez de montar a
+    coleção de atividades de cada projeto só para contá-la.
+
+    Returns:
+        Query: Query de Projeto com contagens e squads já carregadas
+    """
+    atividades = _contagem_por(Atividade.projeto_id, Atividade.id)
+
+    return (
+        Projeto.query
+        .outerjoin(atividades, atividades.c.chave == Projeto.id)
+        .options(
+            selectinload(Projeto.squads),
+            with_expression(Projeto.total_atividades, func.coalesce(atividades.c.total, 0))
+        )
+    )
+
+
+def squads_query():
+    """
+    Query base para listagens de squads
+
+    Traz total_projetos e total_atividades de subqueries agrupadas no
+    mesmo SELECT.
+
+    Returns:
+        Query: Query de Squad com as contagens já carregadas
+    """
+    projetos = _contagem_por(projeto_squad.c.squad_id, projeto_squad.c.projeto_id)
+    atividades = _contagem_por(Atividade.squad_id, Atividade.id)
+
+    return (
+        Squad.query
+        .outerjoin(projetos, projetos.c.chave == Squad.id)
+        .outerjoin(atividades, atividades.c.chave == Squad.id)
+        .options(
+            with_expression(Squad.total_projetos, func.coalesce(projetos.c.total, 0)),
+            with_expression(Squad.total_atividades, func.coalesce(atividades.c.total, 0))
+        )
+    )
@@ -0,0 +1,190 @@
+import re
+from sqlalchemy import inspect, text
+
+# Pesos por coluna no ranking (mesma ordem das colunas indexadas)
+COLUNAS_PROJETO = ('nome', 'subprograma', 'ordem_producao', 'etapas', 'disciplinas', 'observacao')
+PESOS_PROJETO = (10.0, 5.0, 5.0, 1.0, 1.0, 1.0)
+COLUNAS_ATIVIDADE = ('titulo', 'observacao')
+PESOS_ATIVIDADE = (5.0, 1.0)
+INDICES = {
+    'projetos': (COLUNAS_PROJETO, PESOS_PROJETO),
+    'atividades': (COLUNAS_ATIVIDADE, PESOS_ATIVIDADE),
+}
+
+# Tabelas do índice de busca: criadas por SQL (migration / after_create),
+# fora dos models, e ignoradas pelo autogenerate do Alembic
+PREFIXOS_TABELAS_BUSCA = ('projetos_fts', 'atividades_fts', 'projetos_busca', 'atividades_busca')
+
+
+def is_search_table(nome):
+    """True para as tabelas do índice de busca (inclui as tabelas internas do FTS5)"""
+    return nome.startswith(PREFIXOS_TABELAS_BUSCA)
+
+
+def _ddl_sqlite(tabela, colunas):
+    """FTS5 com conteúdo externo (não duplica o texto) e triggers de sincronização"""
+    fts = f'{tabela}_fts'
+    lista = ', '.join(colunas)
+    novos = ', '.join(f'new.{c}' for c in colunas)
+    antigos = ', '.join(f'old.{c}' for c in colunas)
+    return [
+        f"CREATE VIRTUAL TABLE IF NOT EXISTS {fts} USING fts5({lista}, content='{tabela}', "
+        f"content_rowid='id', tokenize='unicode61 remove_diacritics 2')",
+        f"CREATE TRIGGER IF NOT EXISTS {fts}_ai AFTER INSERT ON {tabela} BEGIN "
+        f"INSERT INTO {fts}(rowid, {lista}) VALUES (new.id, {novos}); END",
+        f"CREATE TRIGGER IF NOT EXISTS {fts}_ad AFTER DELETE ON {tabela} BEGIN "
+        f"INSERT INTO {fts}({fts}, rowid, {lista}) VALUES ('delete', old.id, {antigos}); END",
+        f"CREATE TRIGGER IF NOT EXISTS {fts}_au AFTER UPDATE ON {tabela} BEGIN "
+        f"INSERT INTO {fts}({fts}, rowid, {lista}) VALUES ('delete', old.id, {antigos}); "
+        f"INSERT INTO {fts}(rowid, {lista}) VALUES (new.id, {novos}); END",
+        f"INSERT INTO {fts}({fts}) VALUES ('rebuild')",
+    ]
+
+
+def _ddl_postgresql(tabela, colunas, pesos):
+    """Tabela com tsvector sem acentos (unaccent), índice GIN e trigger de sincronização"""
+    busca = f'{tabela}_busca'
+    # setweight aceita só 4 classes (A-D): agrupa os pesos em ordem decrescente
+    classes = dict(zip(sorted(set(pesos), reverse=True), 'ABCD'))
+    documento = ' || '.join(
+        f"setweight(to_tsvector('simple', unaccent(coalesce(NEW.{c}, ''))), '{classes[p]}')"
+        for c, p in zip(colunas, pesos)
+    )
+    return [
+        "CREATE EXTENSION IF NOT EXISTS unaccent",
+        f"CREATE TABLE IF NOT EXISTS {busca} ("
+        f"id integer PRIMARY KEY REFERENCES {tabela}(id) ON DELETE CASCADE, documento tsvector NOT NULL)",
+        f"CREATE INDEX IF NOT EXISTS ix_{busca}_documento ON {busca} USING gin (documento)",
+        f"CREATE OR REPLACE FUNCTION {busca}_sync() RETURNS trigger AS $$ BEGIN "
+        f"INSERT INTO {busca} (id, documento) VALUES (NEW.id, {documento}) "
+        f"ON CONFLICT (id) DO UPDATE SET documento = EXCLUDED.documento; "
+        f"RETURN NULL; END $$ LANGUAGE plpgsql",
+        f"DROP TRIGGER IF EXISTS {busca}_sync ON {tabela}",
+        f"CREATE TRIGGER {busca}_sync AFTER INSERT OR UPDATE ON {tabela} "
+        f"FOR EACH ROW EXECUTE FUNCTION {busca}_sync()",
+        # Preenche a partir dos registros existentes (o UPDATE dispara o trigger)
+        f"UPDATE {tabela} SET id = id",
+    ]
+
+
+def search_ddl(dialeto, tabela):
+    """Comandos que criam o índice de busca de `tabela` ('projetos' ou 'atividades')"""
+    colunas, pesos = INDICES[tabela]
+    if dialeto == 'sqlite':
+        return _ddl_sqlite(tabela, colunas)
+    if dialeto == 'postgresql':
+        return _ddl_postgresql(tabela, colunas, pesos)
+    return []
+
+
+def _tabela_indice(dialeto, tabela):
+    return f'{tabela}_fts' if dialeto == 'sqlite' else f'{tabela}_busca'
+
+
+def install_search(connection):
+    """
+    Cria o índice de busca que ainda não existir no banco da conexão
+
+    Índices já criados são mantidos: o preenchimento inicial percorre a
+    tabela inteira e não deve se repetir a cada inicialização.
+    """
+    dialeto = connection.dialect.name
+    existentes = set(inspect(connection).get_table_names())
+    for tabela in INDICES:
+        if _tabela_indice(dialeto, tabela) in existentes:
+            continue
+        for comando in search_ddl(dialeto, tabela):
+            connection.execute(text(comando))
+
+
+def uninstall_search(connection):
+    """Remove tabelas, triggers e funções do índice de busca"""
+    dialeto = connection.dialect.name
+    for tabela in INDICES:
+        indice = _tabela_indice(dialeto, tabela)
+        if dialeto == 'sqlite':
+            for sufixo in ('ai', 'ad', 'au'):
+                connection.execute(text(f'DROP TRIGGER IF EXISTS {indice}_{sufixo}'))
+        elif dialeto == 'postgresql':
+            connection.execute(text(f'DROP TRIGGER IF EXISTS {indice}_sync ON {tabela}'))
+            connection.execute(text(f'DROP FUNCTION IF EXISTS {indice}_sync()'))
+        connection.execute(text(f'DROP TABLE IF EXISTS {indice}'))
+
+
+def termos(consulta):
+    """Palavras da consulta, sem operadores (o usuário digita texto livre)"""
+    return re.findall(r'\w+', consulta or '')
+
+
+def _consulta_sqlite(palavras, tipo):
+    # Cada palavra vira um prefixo entre aspas: "saeg"* casa com SAEGO
+    match = ' '.join(f'"{p}"*' for p in palavras)
+    partes = []
+    if tipo in (None, 'projeto'):
+        pesos = ', '.join(str(p) for p in PESOS_PROJETO)
+        partes.append(
+            f"SELECT 'projeto' AS tipo, rowid AS id, -bm25(projetos_fts, {pesos}) AS score "
+            f"FROM projetos_fts WHERE projetos_fts MATCH :match"
+        )
+    if tipo in (None, 'atividade'):
+        pesos = ', '.join(str(p) for p in PESOS_ATIVIDADE)
+        partes.append(
+            f"SELECT 'atividade' AS tipo, rowid AS id, -bm25(atividades_fts, {pesos}) AS score "
+            f"FROM atividades_fts WHERE atividades_fts MATCH :match"
+        )
+    return ' UNION ALL '.join(partes), {'match': match}
+
+
+def _consulta_postgresql(palavras, tipo):
+    consulta = ' & '.join(f'{p}:*' for p in palavras)
+    tsquery = "to_tsquery('simple', unaccent(:consulta))"
+    partes = []
+    if tipo in (None, 'projeto'):
+        partes.append(
+            f"SELECT 'projeto' AS tipo, id, ts_rank(documento, {tsquery}) AS score "
+            f"FROM projetos_busca WHERE documento @@ {tsquery}"
+        )
+    if tipo in (None, 'atividade'):
+        partes.append(
+            f"SELECT 'atividade' AS tipo, id, ts_rank(documento, {tsquery}) AS score "
+            f"FROM atividades_busca WHERE documento @@ {tsquery}"
+        )
+    return ' UNION ALL '.join(partes), {'consulta': consulta}
+
+
+def search(session, consulta, tipo=None, page=1, per_page=20):
+    """
+    Busca projetos e atividades no índice de texto
+
+    Todas as palavras precisam aparecer (como prefixo), sem diferenciar
+    acentos nem maiúsculas. Os resultados dos dois tipos vêm em uma única
+    lista ordenada por relevância (score maior = mais relevante).
+
+    Args:
+        session: Sessão SQLAlchemy
+        consulta: Texto digitado pelo usuário
+        tipo: 'projeto', 'atividade' ou None (ambos)
+        page: Página (a partir de 1)
+        per_page: Itens por página
+
+    Returns:
+        tuple: (lista de (tipo, id, score) da página, total de resultados)
+    """
+    palavras = termos(consulta)
+    if not palavras:
+        return [], 0
+
+    dialeto = session.get_bind().dialect.name
+    if dialeto == 'sqlite':
+        sql, parametros = _consulta_sqlite(palavras, tipo)
+    elif dialeto == 'postgresql':
+        sql, parametros = _consulta_postgresql(palavras, tipo)
+    else:
+        raise NotImplementedError(f'Busca não suportada para {dialeto}')
+
+    total = session.execute(text(f'SELECT count(*) FROM ({sql}) AS resultados'), parametros).scalar()
+    pagina = session.execute(
+        text(f'{sql} ORDER BY score DESC, id DESC LIMIT :limite OFFSET :deslocamento'),
+        {**parametros, 'limite': per_page, 'deslocamento': (page - 1) * per_page}
+    ).all()
+    return [(linha.tipo, linha.id, linha.score) for linha in pagina], total
@@ -0,0 +1,41 @@
+from flask import Response, current_app, stream_with_context
+
+
+def stream_json_list(query, to_dict_func=None, batch_size=500):
+    """
+    Cria resposta JSON (lista) gerada incrementalmente a partir de uma query
+
+    As linhas são buscadas em lotes (yield_per) e cada lote é serializado e
+    enviado antes do próximo ser lido, então a memória usada depende do
+    tamanho do lote e não do tamanho da tabela. O corpo gerado é o mesmo
+    que jsonify([...]) produziria.
+
+    Args:
+        query: Query SQLAlchemy já filtrada e ordenada
+        to_dict_func: Função para converter items em dicts (opcional)
+        batch_size: Quantidade de linhas buscadas e enviadas por vez
+
+    Returns:
+        Response: Resposta com corpo gerado sob demanda
+    """
+    dumps = current_app.json.dumps
+
+    def gerar():
+        yield '['
+        separador = ''
+        lote = []
+
+        for item in query.yield_per(batch_size):
+            dados = to_dict_func(item) if to_dict_func else item.to_dict()
+            lote.append(dumps(dados, separators=(',', ':')))
+
+            if len(lote) >= batch_size:
+                yield separador + ','.join(lote)
+                separador = ','
+                lote = []
+
+        if lote:
+            yield separador + ','.join(lote)
+        yield ']'
+
+    return Response(stream_with_context(gerar()), mimetype='application/json')
@@ -0,0 +1 @@
+"""Scripts de benchmark do backend (não fazem parte da aplicação)"""
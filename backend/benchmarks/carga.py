@@ -0,0 +1,159 @@
+"""
+Teste de carga HTTP simples (threads + urllib, sem dependências extras)
+
+Contra um servidor já em execução:
+    python -m benchmarks.carga --url http://localhost:5000/api/atividades?page=1
+
+Comparando o servidor de desenvolvimento (run.py) com o de produção (wsgi.py
+com waitress e, se instalado, gunicorn com WSGI_WORKERS processos), todos
+iniciados pelo script sobre o mesmo banco (DATABASE_URL) e sem cache:
+    python -m benchmarks.carga --comparar
+"""
+import argparse
+import json
+import os
+import socket
+import subprocess
+import sys
+import threading
+import time
+import urllib.request
+
+ROTAS_PADRAO = [
+    '/api/atividades?page=1&per_page=20',
+    '/api/atividades/estatisticas',
+    '/api/projetos',
+    '/api/squads',
+]
+
+
+def _percentil(valores, p):
+    if not valores:
+        return None
+    ordenados = sorted(valores)
+    indice = min(len(ordenados) - 1, int(round(p / 100 * (len(ordenados) - 1))))
+    return ordenados[indice]
+
+
+def executar_carga(urls, concorrencia, duracao):
+    """
+    Dispara requisições em paralelo até o fim da duração
+
+    Returns:
+        dict: Requisições, erros, req/s e latências (ms)
+    """
+    latencias = []
+    erros = [0]
+    lock = threading.Lock()
+    fim = time.perf_counter() + duracao
+
+    def trabalhador(deslocamento):
+        i = deslocamento
+        locais, falhas = [], 0
+        while time.perf_counter() < fim:
+            url = urls[i % len(urls)]
+            i += 1
+            inicio = time.perf_counter()
+            try:
+                with urllib.request.urlopen(url, timeout=30) as resposta:
+                    resposta.read()
+                locais.append((time.perf_counter() - inicio) * 1000)
+            except Exception:
+                falhas += 1
+        with lock:
+            latencias.extend(locais)
+            erros[0] += falhas
+
+    threads = [threading.Thread(target=trabalhador, args=(n,)) for n in range(concorrencia)]
+    inicio = time.perf_counter()
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    decorrido = time.perf_counter() - inicio
+
+    return {
+        'requisicoes': len(latencias),
+        'erros': erros[0],
+        'req_por_segundo': round(len(latencias) / decorrido, 1),
+        'p50_ms': round(_percentil(latencias, 50) or 0, 1),
+        'p95_ms': round(_percentil(latencias, 95) or 0, 1),
+        'p99_ms': round(_percentil(latencias, 99) or 0, 1),
+    }
+
+
+def _porta_livre():
+    with socket.socket() as s:
+        s.bind(('127.0.0.1', 0))
+        return s.getsockname()[1]
+
+
+def _aguardar(porta, processo, limite=30):
+    fim = time.time() + limite
+    while time.time() < fim:
+        if processo.poll() is not None:
+            raise RuntimeError('Servidor encerrou durante a inicialização')
+        try:
+            urllib.request.urlopen(f'http://127.0.0.1:{porta}/', timeout=1).read()
+            return
+        except Exception:
+            time.sleep(0.2)
+    raise RuntimeError('Servidor não respondeu a tempo')
+
+
+def _comparar(concorrencia, duracao):
+    backend = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    servidores = {
+        'desenvolvimento': "from run import app; app.run(debug=True, use_reloader=False, host='127.0.0.1', port={porta})",
+        'wsgi': "import os; from wsgi import app; from waitress import serve; "
+                "serve(app, host='127.0.0.1', port={porta}, threads=app.config['WSGI_THREADS'], _quiet=True)",
+    }
+    try:
+        import gunicorn  # noqa: F401 (disponível apenas em Linux/macOS)
+        servidores['gunicorn'] = (
+            "import sys; from gunicorn.app.wsgiapp import run; "
+            "sys.argv = ['gunicorn', '-c', 'gunicorn.conf.py', '-b', '127.0.0.1:{porta}', 'wsgi:app']; run()"
+        )
+    except ImportError:
+        pass
+
+    ambiente = {**os.environ, 'CACHE_BACKEND': 'none'}
+    resultados = {}
+
+    for nome, codigo in servidores.items():
+        porta = _porta_livre()
+        processo = subprocess.Popen(
+            [sys.executable, '-c', codigo.format(porta=porta)],
+            cwd=backend, env=ambiente,
+            stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL
+        )
+        try:
+            _aguardar(porta, processo)
+            urls = [f'http://127.0.0.1:{porta}{rota}' for rota in ROTAS_PADRAO]
+            resultados[nome] = executar_carga(urls, concorrencia, duracao)
+        finally:
+            processo.terminate()
+            processo.wait()
+        print(nome, json.dumps(resultados[nome]))
+
+    return resultados
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Teste de carga HTTP')
+    parser.add_argument('--url', action='append', help='URL alvo (pode repetir)')
+    parser.add_argument('--concorrencia', type=int, default=16)
+    parser.add_argument('--duracao', type=float, default=10.0, help='segundos')
+    parser.add_argument('--comparar', action='store_true',
+                        help='Compara run.py (desenvolvimento) com wsgi.py (waitress/gunicorn)')
+    args = parser.parse_args()
+
+    if args.comparar:
+        _comparar(args.concorrencia, args.duracao)
+    else:
+        urls = args.url or [f'http://localhost:5000{rota}' for rota in ROTAS_PADRAO]
+        print(json.dumps(executar_carga(urls, args.concorrencia, args.duracao)))
+
+
+if __name__ == '__main__':
+    main()
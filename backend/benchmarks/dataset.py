@@ -0,0 +1,192 @@
+"""
+Gerador de bases sintéticas para benchmarks
+
+Cria squads, projetos (com suas squads), atividades e usuários com
+INSERTs em lote (executemany), sem instanciar objetos ORM: 100 projetos x
+8 squads x 10 mil atividades ficam prontos em poucos segundos. Os dados
+são determinísticos para a mesma semente.
+
+Uso (a partir de backend/):
+    python -m benchmarks.dataset --db /tmp/bench.db --projetos 100 --squads 8 --atividades 10000
+"""
+import argparse
+import os
+import random
+import time
+from datetime import date, datetime, timedelta
+
+STATUS = ('pendente', 'em_andamento', 'concluida')
+PRIORIDADES = ('baixa', 'media', 'alta')
+SUBPROGRAMAS = ('Cartografia', 'Geodésia', 'Imageamento', 'Hidrografia')
+ETAPAS = ('Aquisição', 'Processamento', 'Validação', 'Edição', 'Publicação')
+
+# Senha de todos os usuários gerados (login 'admin' e 'usuarioN')
+SENHA_PADRAO = 'benchmark'
+
+MIGRATIONS_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'migrations')
+
+
+def gerar_dataset(projetos=100, squads=8, atividades=10000, usuarios=10, seed=42, lote=10000):
+    """
+    Insere uma base sintética no banco da aplicação atual
+
+    Deve ser chamada dentro de um app_context, com as tabelas já criadas.
+    Cada projeto recebe de 1 a 3 squads e cada atividade pertence a uma
+    squad do seu projeto; datas, status e prioridades variam como numa
+    base real, para que filtros e índices se comportem de forma realista.
+
+    Args:
+        projetos: Quantidade de projetos
+        squads: Quantidade de squads
+        atividades: Quantidade de atividades
+        usuarios: Quantidade de usuários (o primeiro é 'admin')
+        seed: Semente do gerador (mesma semente, mesma base)
+        lote: Linhas por INSERT em lote
+
+    Returns:
+        dict: Linhas inseridas por tabela, segundos e linhas/s
+    """
+    from app import db
+    from app.models import Projeto, Squad, Atividade, Usuario, projeto_squad
+
+    rng = random.Random(seed)
+    inicio = time.perf_counter()
+    agora = datetime.utcnow()
+    base = date(agora.year - 1, 1, 1)
+
+    db.session.execute(db.insert(Squad), [
+        {'nome': f'Squad {i + 1:02d}', 'descricao': f'Squad sintética {i + 1}',
+         'created_at': agora, 'updated_at': agora}
+        for i in range(squads)
+    ])
+    squad_ids = list(db.session.execute(db.select(Squad.id).order_by(Squad.id)).scalars())
+
+    db.session.execute(db.insert(Projeto), [
+        {
+            'nome': f'Projeto {i + 1:05d}',
+            'subprograma': rng.choice(SUBPROGRAMAS),
+            'ordem_producao': f'OP-{agora.year}-{i + 1:05d}',
+            'data_aplicacao': base + timedelta(days=rng.randrange(365)),
+            'data_termino': base + timedelta(days=365 + rng.randrange(365)),
+            'etapas': ', '.join(rng.sample(ETAPAS, 2)),
+            'created_at': agora,
+            'updated_at': agora
+        }
+        for i in range(projetos)
+    ])
+    projeto_ids = list(db.session.execute(db.select(Projeto.id).order_by(Projeto.id)).scalars())
+
+    squads_do_projeto = {
+        projeto_id: rng.sample(squad_ids, min(len(squad_ids), rng.randint(1, 3)))
+        for projeto_id in projeto_ids
+    }
+    db.session.execute(projeto_squad.insert(), [
+        {'projeto_id': projeto_id, 'squad_id': squad_id}
+        for projeto_id, ids in squads_do_projeto.items() for squad_id in ids
+    ])
+
+    # Core insert na tabela: o insert do ORM separa as linhas em grupos
+    # conforme as colunas nulas e perde o executemany
+    pendentes = []
+    for i in range(atividades):
+        projeto_id = projeto_ids[i % len(projeto_ids)]
+        inicio_programado = base + timedelta(days=rng.randrange(540))
+        fim_programado = inicio_programado + timedelta(days=rng.randint(1, 60))
+        status = rng.choices(STATUS, weights=(5, 2, 3))[0]
+        criado = agora - timedelta(minutes=rng.randrange(525600))
+        pendentes.append({
+            'titulo': f'Atividade {i + 1}',
+            'observacao': 'Observação gerada para benchmark' if i % 4 == 0 else None,
+            'inicio_programado': inicio_programado,
+            'fim_programado': fim_programado,
+            'inicio_realizado': inicio_programado if status != 'pendente' else None,
+            'fim_realizado': fim_programado if status == 'concluida' else None,
+            'prioridade': rng.choices(PRIORIDADES, weights=(3, 5, 2))[0],
+            'status': status,
+            'projeto_id': projeto_id,
+            'squad_id': rng.choice(squads_do_projeto[projeto_id]),
+            'created_at': criado,
+            'updated_at': criado
+        })
+        if len(pendentes) >= lote:
+            db.session.execute(Atividade.__table__.insert(), pendentes)
+            pendentes = []
+    if pendentes:
+        db.session.execute(Atividade.__table__.insert(), pendentes)
+
+    # Um único hash bcrypt para todos: o custo do bcrypt dominaria a geração
+    modelo = Usuario()
+    modelo.set_senha(SENHA_PADRAO)
+    db.session.execute(db.insert(Usuario), [
+        {
+            'nome': 'Administrador' if i == 0 else f'Usuário {i}',
+            'login': 'admin' if i == 0 else f'usuario{i}',
+            'senha_hash': modelo.senha_hash,
+            'role': 'admin' if i == 0 else 'analista',
+            'ativo': True,
+            'created_at': agora,
+            'updated_at': agora
+        }
+        for i in range(max(1, usuarios))
+    ])
+
+    db.session.commit()
+    segundos = time.perf_counter() - inicio
+    linhas = {
+        'squads': squads,
+        'projetos': projetos,
+        'projeto_squad': sum(len(ids) for ids in squads_do_projeto.values()),
+        'atividades': atividades,
+        'usuarios': max(1, usuarios)
+    }
+    return {
+        'linhas': linhas,
+        'segundos': round(segundos, 3),
+        'linhas_por_segundo': round(sum(linhas.values()) / segundos) if segundos else None
+    }
+
+
+def criar_banco(db_path, **parametros):
+    """
+    Cria um banco SQLite novo em db_path com a base sintética
+
+    Configura DATABASE_URL antes de importar a aplicação, então deve ser
+    chamada em um processo que ainda não criou o app.
+    """
+    os.environ['DATABASE_URL'] = f'sqlite:///{db_path}'
+    # O banco ainda está vazio: o aviso de schema desatualizado não se aplica
+    os.environ['SCHEMA_CHECK'] = 'false'
+    from flask_migrate import upgrade
+    from app import create_app
+
+    app = create_app('production')
+    with app.app_context():
+        # Mesmo schema da aplicação (índices, busca textual, alembic_version)
+        upgrade(directory=MIGRATIONS_DIR)
+        resultado = gerar_dataset(**parametros)
+    return app, resultado
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--db', required=True, help='Arquivo SQLite a criar')
+    parser.add_argument('--projetos', type=int, default=100)
+    parser.add_argument('--squads', type=int, default=8)
+    parser.add_argument('--atividades', type=int, default=10000)
+    parser.add_argument('--usuarios', type=int, default=10)
+    parser.add_argument('--seed', type=int, default=42)
+    args = parser.parse_args()
+
+    if os.path.exists(args.db):
+        parser.error(f'{args.db} já existe; informe um arquivo novo')
+
+    _, resultado = criar_banco(
+        os.path.abspath(args.db), projetos=args.projetos, squads=args.squads,
+        atividades=args.atividades, usuarios=args.usuarios, seed=args.seed
+    )
+    print(f"{sum(resultado['linhas'].values())} linhas em {resultado['segundos']} s "
+          f"({resultado['linhas_por_segundo']} linhas/s): {resultado['linhas']}")
+
+
+if __name__ == '__main__':
+    main()
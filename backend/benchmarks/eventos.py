@@ -0,0 +1,187 @@
+"""
+Conexões SSE ociosas: quantas o servidor aceita e o efeito nas demais rotas
+
+Cria uma base sintética, sobe o servidor (gunicorn com 1 worker e
+gunicorn.conf.py, ou python wsgi.py) e abre --conexoes streams em
+/api/eventos, que ficam ociosos. Com eles abertos, mede a latência de
+leituras da API e o tempo até uma alteração (POST /api/squads) chegar a
+todos os streams. Compara:
+
+- gthread: limite EVENTS_MAX_CLIENTS padrão (1/4 das threads), excedentes
+  recebem 503;
+- gthread_sem_limite: EVENTS_MAX_CLIENTS alto, cada stream prende uma thread;
+- gevent: WSGI_WORKER_CLASS=gevent (requer pip install gevent);
+- wsgi_waitress / wsgi_gevent: python wsgi.py, o servidor dos scripts
+  start-sistema-*.bat, com WSGI_SERVER=waitress e com o gevent.
+
+Os cenários do gunicorn só rodam no Linux; os de wsgi.py, em qualquer SO.
+
+    python -m benchmarks.eventos
+    python -m benchmarks.eventos --conexoes 500 --leituras 50
+"""
+import argparse
+import json
+import os
+import selectors
+import signal
+import socket
+import subprocess
+import sys
+import tempfile
+import time
+import urllib.request
+
+from benchmarks.carga import ROTAS_PADRAO, _percentil, _porta_livre, _aguardar
+
+BACKEND = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+class Streams:
+    """Conexões SSE abertas por sockets não bloqueantes (uma thread para todas)"""
+
+    def __init__(self, porta, quantidade):
+        self.seletor = selectors.DefaultSelector()
+        for _ in range(quantidade):
+            conexao = socket.create_connection(('127.0.0.1', porta))
+            conexao.sendall(b'GET /api/eventos HTTP/1.1\r\nHost: localhost\r\nAccept: text/event-stream\r\n\r\n')
+            conexao.setblocking(False)
+            self.seletor.register(conexao, selectors.EVENT_READ, bytearray())
+
+    def ler(self, segundos):
+        fim = time.perf_counter() + segundos
+        while time.perf_counter() < fim:
+            for chave, _ in self.seletor.select(0.05):
+                try:
+                    dados = chave.fileobj.recv(65536)
+                except (BlockingIOError, ConnectionError):
+                    continue
+                chave.data.extend(dados)
+
+    def contar(self, trecho):
+        return sum(1 for chave in self.seletor.get_map().values() if trecho in chave.data)
+
+    def fechar(self):
+        for chave in list(self.seletor.get_map().values()):
+            chave.fileobj.close()
+        self.seletor.close()
+
+
+def medir(porta, conexoes, leituras):
+    """
+    Abre os streams, mede leituras e a entrega de um evento
+
+    Returns:
+        dict: Streams aceitos/recusados, latência das leituras e da entrega
+    """
+    base_url = f'http://127.0.0.1:{porta}'
+    streams = Streams(porta, conexoes)
+    try:
+        streams.ler(3)
+        aceitos = streams.contar(b'HTTP/1.1 200')
+        recusados = streams.contar(b'HTTP/1.1 503')
+
+        latencias, erros = [], 0
+        for i in range(leituras):
+            inicio = time.perf_counter()
+            try:
+                with urllib.request.urlopen(f'{base_url}{ROTAS_PADRAO[i % len(ROTAS_PADRAO)]}', timeout=5) as resposta:
+                    resposta.read()
+                latencias.append((time.perf_counter() - inicio) * 1000)
+            except Exception:
+                erros += 1
+                if erros >= 3:
+                    # Sem threads livres: cada leitura esperaria o timeout inteiro
+                    break
+
+        requisicao = urllib.request.Request(
+            f'{base_url}/api/squads', data=json.dumps({'nome': f'Squad SSE {time.time()}'}).encode('utf-8'),
+            headers={'Content-Type': 'application/json'}
+        )
+        inicio = time.perf_counter()
+        entregues = 0
+        try:
+            urllib.request.urlopen(requisicao, timeout=10).read()
+            while entregues < aceitos and time.perf_counter() - inicio < 10:
+                streams.ler(0.05)
+                entregues = streams.contar(b'"op":"create"')
+        except Exception:
+            pass
+        entrega_ms = (time.perf_counter() - inicio) * 1000
+    finally:
+        streams.fechar()
+
+    return {
+        'streams_aceitos': aceitos,
+        'streams_recusados_503': recusados,
+        'leituras': len(latencias),
+        'erros_leitura': erros,
+        'leitura_p50_ms': round(_percentil(latencias, 50) or 0, 1),
+        'leitura_p99_ms': round(_percentil(latencias, 99) or 0, 1),
+        'evento_entregue': entregues,
+        'entrega_todos_ms': round(entrega_ms, 1) if aceitos and entregues == aceitos else None,
+    }
+
+
+def _servidor(ambiente, servidor):
+    porta = _porta_livre()
+    if servidor == 'gunicorn':
+        comando = [sys.executable, '-m', 'gunicorn', '-c', 'gunicorn.conf.py', '--bind', f'127.0.0.1:{porta}', 'wsgi:app']
+    else:
+        comando = [sys.executable, 'wsgi.py']
+        ambiente = {**ambiente, 'HOST': '127.0.0.1', 'PORT': str(porta)}
+    processo = subprocess.Popen(
+        comando, cwd=BACKEND, env=ambiente, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL
+    )
+    try:
+        _aguardar(porta, processo)
+    except Exception:
+        processo.terminate()
+        raise
+    return porta, processo
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Conexões SSE ociosas e latência das demais rotas')
+    parser.add_argument('--conexoes', type=int, default=500, help='Streams em /api/eventos')
+    parser.add_argument('--leituras', type=int, default=50, help='Leituras medidas com os streams abertos')
+    parser.add_argument('--atividades', type=int, default=10000)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as pasta:
+        db_path = os.path.join(pasta, 'eventos.db')
+        ambiente = {**os.environ, 'DATABASE_URL': f'sqlite:///{db_path}', 'CACHE_BACKEND': 'none',
+                    'WSGI_WORKERS': '1', 'EVENTS_BACKEND': 'memory'}
+        subprocess.run(
+            [sys.executable, '-m', 'benchmarks.dataset', '--db', db_path, '--atividades', str(args.atividades)],
+            cwd=BACKEND, env=ambiente, check=True, stdout=subprocess.DEVNULL
+        )
+
+        resultados = {'parametros': {**vars(args), 'wsgi_threads': int(os.environ.get('WSGI_THREADS', 8))}}
+        cenarios = [
+            ('gthread', 'gunicorn', {'WSGI_WORKER_CLASS': 'gthread'}),
+            ('gthread_sem_limite', 'gunicorn',
+             {'WSGI_WORKER_CLASS': 'gthread', 'EVENTS_MAX_CLIENTS': str(args.conexoes)}),
+            ('gevent', 'gunicorn', {'WSGI_WORKER_CLASS': 'gevent'}),
+            ('wsgi_waitress', 'wsgi', {'WSGI_SERVER': 'waitress'}),
+            ('wsgi_gevent', 'wsgi', {'WSGI_SERVER': 'gevent'}),
+        ]
+        if sys.platform == 'win32':
+            cenarios = [c for c in cenarios if c[1] != 'gunicorn']
+        for nome, servidor, configuracao in cenarios:
+            porta, processo = _servidor({**ambiente, **configuracao}, servidor)
+            try:
+                resultados[nome] = medir(porta, args.conexoes, args.leituras)
+            finally:
+                # SIGINT: parada rápida, sem esperar o fim dos streams
+                if sys.platform == 'win32':
+                    processo.terminate()
+                else:
+                    processo.send_signal(signal.SIGINT)
+                processo.wait()
+            print(nome, json.dumps(resultados[nome]), file=sys.stderr)
+
+    print(json.dumps(resultados, indent=2))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,147 @@
+"""
+Tempo de inicialização da aplicação: imports, create_app e primeira resposta
+
+Mede, em processos novos (sem nada em memória):
+- o tempo de import do pacote e de create_app('production'), e o tempo até
+  a primeira resposta do test client;
+- o tempo do início do processo do servidor (wsgi.py com waitress) até o
+  primeiro GET / respondido (partida a frio);
+- os módulos mais caros no import (python -X importtime), somados por pacote.
+
+A partida a frio tem um orçamento (--limite-ms). Acima dele, o script sai
+com código 1, para uso em CI.
+
+Uso (a partir de backend/):
+    python -m benchmarks.inicializacao
+    python -m benchmarks.inicializacao --repeticoes 5 --limite-ms 1200 --top 15
+"""
+import argparse
+import json
+import os
+import re
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+import urllib.request
+from collections import Counter
+
+from benchmarks.carga import _porta_livre
+
+BACKEND = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+# Orçamento padrão da partida a frio (processo iniciado -> primeira resposta)
+LIMITE_PARTIDA_MS = 1200
+
+FASES = """
+import json, time
+inicio = time.perf_counter()
+import app
+importado = time.perf_counter()
+from app import create_app
+aplicacao = create_app('production')
+criado = time.perf_counter()
+aplicacao.test_client().get('/')
+respondido = time.perf_counter()
+print(json.dumps({
+    'import_ms': (importado - inicio) * 1000,
+    'create_app_ms': (criado - importado) * 1000,
+    'primeira_resposta_ms': (respondido - criado) * 1000,
+    'total_ms': (respondido - inicio) * 1000,
+}))
+"""
+
+SERVIDOR = ("from wsgi import app; from waitress import serve; "
+            "serve(app, host='127.0.0.1', port={porta}, threads=app.config['WSGI_THREADS'], _quiet=True)")
+
+
+def medir_fases(ambiente):
+    """import / create_app / primeira resposta (test client), em um processo novo"""
+    saida = subprocess.run([sys.executable, '-c', FASES], cwd=BACKEND, env=ambiente,
+                           capture_output=True, text=True, check=True)
+    return json.loads(saida.stdout.strip().splitlines()[-1])
+
+
+def medir_partida(ambiente, limite_s=30):
+    """Milissegundos do Popen do servidor até o primeiro GET / com status 200"""
+    porta = _porta_livre()
+    inicio = time.perf_counter()
+    processo = subprocess.Popen([sys.executable, '-c', SERVIDOR.format(porta=porta)], cwd=BACKEND,
+                                env=ambiente, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+    try:
+        while time.perf_counter() - inicio < limite_s:
+            if processo.poll() is not None:
+                raise RuntimeError('Servidor encerrou durante a inicialização')
+            try:
+                with urllib.request.urlopen(f'http://127.0.0.1:{porta}/', timeout=1) as resposta:
+                    if resposta.status == 200:
+                        return (time.perf_counter() - inicio) * 1000
+            except OSError:
+                time.sleep(0.005)
+        raise RuntimeError('Servidor não respondeu a tempo')
+    finally:
+        processo.terminate()
+        processo.wait()
+
+
+def perfil_imports(ambiente, top):
+    """Módulos e pacotes mais caros no import de wsgi.py (python -X importtime)"""
+    saida = subprocess.run([sys.executable, '-X', 'importtime', '-c', 'import wsgi'], cwd=BACKEND,
+                           env=ambiente, capture_output=True, text=True, check=True)
+    modulos, pacotes = [], Counter()
+    for linha in saida.stderr.splitlines():
+        encontrado = re.match(r'import time:\s+(\d+) \|\s+(\d+) \| ( *)(\S+)', linha)
+        if not encontrado:
+            continue
+        proprio, acumulado, nome = int(encontrado.group(1)), int(encontrado.group(2)), encontrado.group(4)
+        modulos.append((acumulado, nome))
+        pacotes[nome.split('.')[0]] += proprio
+    return {
+        'total_ms': round(sum(pacotes.values()) / 1000, 1),
+        'pacotes_ms': {nome: round(us / 1000, 1) for nome, us in pacotes.most_common(top)},
+        'modulos_acumulado_ms': {nome: round(us / 1000, 1) for us, nome in sorted(modulos, reverse=True)[:top]},
+    }
+
+
+def _resumo(valores):
+    return {
+        'mediana': round(statistics.median(valores), 1),
+        'min': round(min(valores), 1),
+        'max': round(max(valores), 1),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--repeticoes', type=int, default=5)
+    parser.add_argument('--top', type=int, default=15, help='Módulos/pacotes listados no perfil de import')
+    parser.add_argument('--limite-ms', type=float, default=LIMITE_PARTIDA_MS,
+                        help='Orçamento da partida a frio (mediana), em ms')
+    parser.add_argument('--db', help='Banco SQLite já migrado (padrão: um novo, criado com as migrations)')
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as pasta:
+        db_path = args.db or os.path.join(pasta, 'inicializacao.db')
+        ambiente = {**os.environ, 'DATABASE_URL': f'sqlite:///{os.path.abspath(db_path)}'}
+        if not args.db:
+            subprocess.run([sys.executable, '-m', 'benchmarks.dataset', '--db', db_path, '--atividades', '1000'],
+                           cwd=BACKEND, env=ambiente, check=True, stdout=subprocess.DEVNULL)
+
+        fases = [medir_fases(ambiente) for _ in range(args.repeticoes)]
+        partidas = [medir_partida(ambiente) for _ in range(args.repeticoes)]
+        resultado = {
+            'fases_ms': {fase: _resumo([f[fase] for f in fases]) for fase in fases[0]},
+            'partida_a_frio_ms': _resumo(partidas),
+            'limite_ms': args.limite_ms,
+            'imports': perfil_imports(ambiente, args.top),
+        }
+
+    print(json.dumps(resultado, indent=2))
+    if resultado['partida_a_frio_ms']['mediana'] > args.limite_ms:
+        print(f"Partida a frio de {resultado['partida_a_frio_ms']['mediana']} ms acima do orçamento "
+              f"de {args.limite_ms} ms", file=sys.stderr)
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
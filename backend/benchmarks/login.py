@@ -0,0 +1,186 @@
+"""
+Pico de logins: latência do login e das leituras que rodam ao mesmo tempo
+
+Cria uma base sintética, sobe o servidor de produção (wsgi.py com waitress)
+e, durante alguns segundos, dispara logins em paralelo (a equipe inteira
+entrando às 8h) enquanto outras threads leem a API. Compara três cenários:
+
+- sem_logins: só as leituras, como referência;
+- sem_limite: um hash por thread do servidor e fila ilimitada (equivale ao
+  bcrypt direto na thread da requisição);
+- pool: PASSWORD_HASH_WORKERS/PASSWORD_HASH_QUEUE informados (padrão: os da
+  configuração), com logins excedentes recusados com 503.
+
+    python -m benchmarks.login
+    python -m benchmarks.login --workers 1 --fila 2 --logins 16 --leitores 4 --duracao 10 --rounds 12
+"""
+import argparse
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+import urllib.error
+import urllib.request
+
+from benchmarks.carga import ROTAS_PADRAO, _percentil, _porta_livre, _aguardar
+
+BACKEND = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+SERVIDOR = ("from wsgi import app; from waitress import serve; "
+            "serve(app, host='127.0.0.1', port={porta}, threads=app.config['WSGI_THREADS'], _quiet=True)")
+
+
+def _resumo(latencias, decorrido, **extras):
+    return {
+        'requisicoes': len(latencias),
+        **extras,
+        'req_por_segundo': round(len(latencias) / decorrido, 1) if decorrido else None,
+        'p50_ms': round(_percentil(latencias, 50) or 0, 1),
+        'p95_ms': round(_percentil(latencias, 95) or 0, 1),
+        'p99_ms': round(_percentil(latencias, 99) or 0, 1),
+    }
+
+
+def tempestade(base_url, logins, leitores, duracao, usuarios, senha):
+    """
+    Roda `logins` threads fazendo login e `leitores` threads lendo a API
+
+    Returns:
+        dict: Latências de login (ok e recusados com 503) e de leitura
+    """
+    fim = time.perf_counter() + duracao
+    lock = threading.Lock()
+    resultado = {'login': [], 'recusados': 0, 'erros_login': 0, 'leitura': [], 'erros_leitura': 0}
+
+    def logar(numero):
+        locais, recusados, erros = [], 0, 0
+        i = numero
+        while time.perf_counter() < fim:
+            login = 'admin' if i % usuarios == 0 else f'usuario{i % usuarios}'
+            i += logins
+            corpo = json.dumps({'login': login, 'senha': senha}).encode('utf-8')
+            requisicao = urllib.request.Request(
+                f'{base_url}/api/auth/login', data=corpo, headers={'Content-Type': 'application/json'}
+            )
+            inicio = time.perf_counter()
+            try:
+                with urllib.request.urlopen(requisicao, timeout=60) as resposta:
+                    resposta.read()
+                locais.append((time.perf_counter() - inicio) * 1000)
+            except urllib.error.HTTPError as e:
+                if e.code == 503:
+                    # Como o frontend faria: espera o Retry-After antes de tentar de novo
+                    recusados += 1
+                    time.sleep(float(e.headers.get('Retry-After', 1)))
+                else:
+                    erros += 1
+            except Exception:
+                erros += 1
+        with lock:
+            resultado['login'].extend(locais)
+            resultado['recusados'] += recusados
+            resultado['erros_login'] += erros
+
+    def ler(numero):
+        locais, erros = [], 0
+        i = numero
+        while time.perf_counter() < fim:
+            url = f'{base_url}{ROTAS_PADRAO[i % len(ROTAS_PADRAO)]}'
+            i += 1
+            inicio = time.perf_counter()
+            try:
+                with urllib.request.urlopen(url, timeout=60) as resposta:
+                    resposta.read()
+                locais.append((time.perf_counter() - inicio) * 1000)
+            except Exception:
+                erros += 1
+        with lock:
+            resultado['leitura'].extend(locais)
+            resultado['erros_leitura'] += erros
+
+    threads = [threading.Thread(target=logar, args=(n,)) for n in range(logins)]
+    threads += [threading.Thread(target=ler, args=(n,)) for n in range(leitores)]
+    inicio = time.perf_counter()
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    decorrido = time.perf_counter() - inicio
+
+    saida = {'leitura': _resumo(resultado['leitura'], decorrido, erros=resultado['erros_leitura'])}
+    if logins:
+        saida['login'] = _resumo(resultado['login'], decorrido, recusados_503=resultado['recusados'],
+                                 erros=resultado['erros_login'])
+    return saida
+
+
+def _servidor(ambiente):
+    porta = _porta_livre()
+    processo = subprocess.Popen(
+        [sys.executable, '-c', SERVIDOR.format(porta=porta)],
+        cwd=BACKEND, env=ambiente, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL
+    )
+    try:
+        _aguardar(porta, processo)
+    except Exception:
+        processo.terminate()
+        raise
+    return porta, processo
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Pico de logins com leituras concorrentes')
+    parser.add_argument('--workers', type=int, help='PASSWORD_HASH_WORKERS do cenário pool')
+    parser.add_argument('--fila', type=int, help='PASSWORD_HASH_QUEUE do cenário pool')
+    parser.add_argument('--logins', type=int, default=16, help='Threads fazendo login')
+    parser.add_argument('--leitores', type=int, default=4, help='Threads lendo a API')
+    parser.add_argument('--duracao', type=float, default=10.0, help='segundos por cenário')
+    parser.add_argument('--rounds', type=int, default=12, help='BCRYPT_ROUNDS')
+    parser.add_argument('--usuarios', type=int, default=50)
+    parser.add_argument('--atividades', type=int, default=20000)
+    args = parser.parse_args()
+
+    threads_servidor = int(os.environ.get('WSGI_THREADS', 8))
+    pool = {}
+    if args.workers is not None:
+        pool['PASSWORD_HASH_WORKERS'] = str(args.workers)
+    if args.fila is not None:
+        pool['PASSWORD_HASH_QUEUE'] = str(args.fila)
+
+    with tempfile.TemporaryDirectory() as pasta:
+        db_path = os.path.join(pasta, 'login.db')
+        # Os hashes da base precisam ter o custo medido (senão o 1º login de cada um regrava)
+        os.environ['BCRYPT_ROUNDS'] = str(args.rounds)
+        ambiente = {**os.environ, 'DATABASE_URL': f'sqlite:///{db_path}', 'CACHE_BACKEND': 'none'}
+        subprocess.run(
+            [sys.executable, '-m', 'benchmarks.dataset', '--db', db_path,
+             '--usuarios', str(args.usuarios), '--atividades', str(args.atividades)],
+            cwd=BACKEND, env=ambiente, check=True, stdout=subprocess.DEVNULL
+        )
+        from benchmarks.dataset import SENHA_PADRAO
+
+        resultados = {'parametros': {**vars(args), 'wsgi_threads': threads_servidor, 'cpus': os.cpu_count()}}
+        cenarios = [
+            ('sem_logins', 0, {}),
+            ('sem_limite', args.logins, {'PASSWORD_HASH_WORKERS': str(threads_servidor),
+                                         'PASSWORD_HASH_QUEUE': '1000000'}),
+            ('pool', args.logins, pool),
+        ]
+        for nome, logins, configuracao in cenarios:
+            porta, processo = _servidor({**ambiente, **configuracao})
+            try:
+                resultados[nome] = tempestade(
+                    f'http://127.0.0.1:{porta}', logins, args.leitores, args.duracao, args.usuarios, SENHA_PADRAO
+                )
+            finally:
+                processo.terminate()
+                processo.wait()
+            print(nome, json.dumps(resultados[nome]), file=sys.stderr)
+
+    print(json.dumps(resultados, indent=2))
+
+
+if __name__ == '__main__':
+    main()
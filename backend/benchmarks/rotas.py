@@ -0,0 +1,314 @@
+"""
+Benchmark das rotas da API com o test client do Flask, em vários tamanhos de base
+
+Para cada tamanho, gera uma base sintética (benchmarks.dataset) num
+processo próprio e mede latência (média, p50/p95/p99), vazão, tamanho da
+resposta e número de statements SQL de cada rota registrada em
+app/routes/. O cache de respostas fica desligado, para medir o trabalho
+real de cada rota. O resultado sai em JSON para comparar commits.
+
+Uso (a partir de backend/):
+    python -m benchmarks.rotas --tamanhos 1000,10000,100000 --saida resultado.json
+    python -m benchmarks.rotas --tamanhos 10000 --comparar-com resultado.json
+"""
+import argparse
+import json
+import os
+import platform
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import datetime
+
+# Aumento relativo padrão do p95 a partir do qual --comparar-com aponta regressão
+LIMITE_REGRESSAO = 0.2
+
+
+def _percentil(valores, p):
+    ordenados = sorted(valores)
+    indice = min(len(ordenados) - 1, int(round(p / 100 * (len(ordenados) - 1))))
+    return ordenados[indice]
+
+
+def _cenarios():
+    """
+    Cenários por endpoint: (endpoint, método, url, corpo, preparar)
+
+    corpo pode ser um dict fixo ou uma função(contexto) chamada a cada
+    requisição (nomes únicos, squad válida da base); bytes são enviados
+    como text/csv. preparar(cliente,
+    contexto) roda antes de cada medição, fora do tempo medido, e devolve
+    valores para a url (ex: o id do registro que será excluído).
+    """
+    def atividade(ctx):
+        return {'titulo': 'Atividade benchmark', 'projeto_id': 1, 'squad_id': ctx['squad_id']}
+
+    def lote(ctx):
+        return {'criar': [dict(atividade(ctx), titulo=f'Lote {i}') for i in range(100)]}
+
+    def usuario(ctx):
+        return {'nome': 'Usuário benchmark', 'login': f"bench{next(ctx['contador'])}", 'senha': 'benchmark'}
+
+    def squad(ctx):
+        return {'nome': f"Squad benchmark {next(ctx['contador'])}"}
+
+    def criar(url, corpo):
+        def preparar(cliente, ctx):
+            dados = corpo(ctx) if callable(corpo) else corpo
+            return {'id': cliente.post(url, json=dados, headers=ctx['headers']).get_json()['id']}
+        return preparar
+
+    def csv_importacao(ctx):
+        linhas = ['projeto;titulo;squad;prioridade;status;fim_programado']
+        linhas += [f'Projeto 00001;Importada {i};Squad 01;alta;pendente;2025-06-30' for i in range(100)]
+        return ('\n'.join(linhas) + '\n').encode('utf-8')
+
+    def cursor_recente(cliente, ctx):
+        # Polling típico: uma atividade alterada desde o último cursor
+        cursor = cliente.get('/api/sync', headers=ctx['headers']).get_json()['cursor']
+        cliente.put('/api/atividades/1', json={'observacao': f"sync {next(ctx['contador'])}"}, headers=ctx['headers'])
+        return {'cursor': cursor}
+
+    return [
+        ('index', 'GET', '/', None, None),
+        ('metrics.metrics', 'GET', '/metrics', None, None),
+
+        ('projetos.listar_projetos', 'GET', '/api/projetos', None, None),
+        ('projetos.buscar_projeto', 'GET', '/api/projetos/1', None, None),
+        ('projetos.listar_atividades_projeto', 'GET', '/api/projetos/1/atividades', None, None),
+        ('projetos.criar_projeto', 'POST', '/api/projetos', {'nome': 'Projeto benchmark'}, None),
+        ('projetos.atualizar_projeto', 'PUT', '/api/projetos/1', {'observacao': 'benchmark'}, None),
+        ('projetos.clonar_projeto', 'POST', '/api/projetos/2/clonar', {}, None),
+        ('projetos.deletar_projeto', 'DELETE', '/api/projetos/{id}', None,
+         criar('/api/projetos', {'nome': 'Temporário'})),
+
+        ('squads.listar_squads', 'GET', '/api/squads', None, None),
+        ('squads.buscar_squad', 'GET', '/api/squads/1', None, None),
+        ('squads.listar_projetos_squad', 'GET', '/api/squads/1/projetos', None, None),
+        ('squads.listar_atividades_squad', 'GET', '/api/squads/1/atividades', None, None),
+        ('squads.criar_squad', 'POST', '/api/squads', squad, None),
+        ('squads.atualizar_squad', 'PUT', '/api/squads/1', {'descricao': 'benchmark'}, None),
+        ('squads.deletar_squad', 'DELETE', '/api/squads/{id}', None,
+         criar('/api/squads', squad)),
+
+        ('atividades.listar_atividades', 'GET', '/api/atividades', None, None),
+        ('atividades.listar_atividades', 'GET', '/api/atividades?page=1&per_page=50', None, None),
+        ('atividades.listar_atividades', 'GET', '/api/atividades?cursor=&per_page=50', None, None),
+        ('atividades.listar_atividades', 'GET', '/api/atividades?status=pendente&prioridade=alta&page=1', None, None),
+        ('atividades.buscar_atividade', 'GET', '/api/atividades/1', None, None),
+        ('atividades.estatisticas', 'GET', '/api/atividades/estatisticas', None, None),
+        ('atividades.criar_atividade', 'POST', '/api/atividades', atividade, None),
+        ('atividades.atualizar_atividade', 'PUT', '/api/atividades/1', {'status': 'em_andamento'}, None),
+        ('atividades.lote_atividades', 'POST', '/api/atividades/bulk', lote, None),
+        ('atividades.deletar_atividade', 'DELETE', '/api/atividades/{id}', None,
+         criar('/api/atividades', atividade)),
+        ('atividades.exportar_atividades', 'GET', '/api/atividades/export?format=csv', None, None),
+        ('atividades.exportar_atividades', 'GET', '/api/atividades/export?format=xlsx&projeto_id=1', None, None),
+
+        ('busca.buscar', 'GET', '/api/busca?q=projeto 00001', None, None),
+        ('busca.buscar', 'GET', '/api/busca?q=observacao&tipo=atividade&per_page=50', None, None),
+
+        ('importacao.importar', 'POST', '/api/import', csv_importacao, None),
+
+        ('timeline.timeline', 'GET', '/api/timeline', None, None),
+        ('timeline.timeline', 'GET', '/api/timeline?squad_id=1', None, None),
+
+        ('sincronizacao.sincronizar', 'GET', '/api/sync', None, None),
+        ('sincronizacao.sincronizar', 'GET', '/api/sync?since=0', None, None),
+        ('sincronizacao.sincronizar', 'GET', '/api/sync?since={cursor}', None, cursor_recente),
+
+        ('auth.login', 'POST', '/api/auth/login', {'login': 'admin', 'senha': 'benchmark'}, None),
+        ('auth.get_usuario_logado', 'GET', '/api/auth/me', None, None),
+        ('auth.check_token', 'GET', '/api/auth/check', None, None),
+
+        ('usuarios.listar_usuarios', 'GET', '/api/usuarios', None, None),
+        ('usuarios.criar_usuario', 'POST', '/api/usuarios', usuario, None),
+        ('usuarios.atualizar_usuario', 'PUT', '/api/usuarios/2', {'nome': 'Usuário benchmark'}, None),
+        ('usuarios.deletar_usuario', 'DELETE', '/api/usuarios/{id}', None, criar('/api/usuarios', usuario)),
+
+        ('sistema.estatisticas_cache', 'GET', '/api/sistema/cache', None, None),
+        ('sistema.estatisticas_pool', 'GET', '/api/sistema/pool', None, None),
+    ]
+
+
+def _medir(db_path, repeticoes):
+    """Mede todas as rotas sobre uma base já criada e imprime o resultado em JSON"""
+    os.environ['DATABASE_URL'] = f'sqlite:///{db_path}'
+    os.environ['CACHE_BACKEND'] = 'none'
+    os.environ['SLOW_QUERY_MS'] = str(10 ** 9)
+    from sqlalchemy import event
+    from app import create_app, db
+
+    app = create_app('production')
+    cliente = app.test_client()
+
+    # Statements contados no engine até o fim do corpo: o Server-Timing de uma
+    # resposta em streaming sai antes dos lotes seguintes serem lidos
+    executados = [0]
+
+    def contar(*_):
+        executados[0] += 1
+
+    with app.app_context():
+        event.listen(db.engine, 'after_cursor_execute', contar)
+
+    token = cliente.post('/api/auth/login', json={'login': 'admin', 'senha': 'benchmark'}).get_json()['token']
+    headers = {'Authorization': f'Bearer {token}'}
+    contexto = {
+        'headers': headers,
+        'squad_id': cliente.get('/api/projetos/1').get_json()['squads'][0]['id'],
+        'contador': iter(range(10 ** 9))
+    }
+
+    cenarios = _cenarios()
+    cobertos = {endpoint for endpoint, *_ in cenarios}
+    registrados = {
+        regra.endpoint.removeprefix('main.') for regra in app.url_map.iter_rules()
+        if regra.endpoint != 'static'
+    }
+
+    resultados = {}
+    for endpoint, metodo, url, corpo, preparar in cenarios:
+        latencias, tamanhos, statements, erros = [], [], [], 0
+        # login mede o bcrypt de propósito; poucas repetições bastam
+        n = min(repeticoes, 5) if endpoint == 'auth.login' else repeticoes
+
+        # A primeira execução só aquece caches do SQLAlchemy e do SQLite
+        for i in range(n + 1):
+            valores = preparar(cliente, contexto) if preparar else {}
+            dados = corpo(contexto) if callable(corpo) else corpo
+
+            if isinstance(dados, bytes):
+                envio = {'data': dados, 'content_type': 'text/csv'}
+            else:
+                envio = {'json': dados}
+
+            executados[0] = 0
+            inicio = time.perf_counter()
+            resposta = cliente.open(url.format(**valores), method=metodo, headers=headers, **envio)
+            tamanho = len(resposta.get_data())
+            duracao = time.perf_counter() - inicio
+            sql = executados[0]
+
+            if i == 0:
+                continue
+            if resposta.status_code >= 400:
+                erros += 1
+            latencias.append(duracao * 1000)
+            tamanhos.append(tamanho)
+            statements.append(sql)
+
+        total_s = sum(latencias) / 1000
+        resultados[f'{metodo} {url}'] = {
+            'endpoint': endpoint,
+            'n': len(latencias),
+            'erros': erros,
+            'media_ms': round(sum(latencias) / len(latencias), 3),
+            'p50_ms': round(_percentil(latencias, 50), 3),
+            'p95_ms': round(_percentil(latencias, 95), 3),
+            'p99_ms': round(_percentil(latencias, 99), 3),
+            'req_s': round(len(latencias) / total_s, 1) if total_s else None,
+            'bytes': round(sum(tamanhos) / len(tamanhos)),
+            'sql': max(statements) if statements else None
+        }
+
+    print(json.dumps({'rotas': resultados, 'sem_cenario': sorted(registrados - cobertos)}))
+
+
+def _executar_tamanho(atividades, projetos, squads, repeticoes):
+    """Gera a base e mede as rotas, cada etapa em um subprocesso"""
+    with tempfile.TemporaryDirectory() as tmp:
+        db_path = os.path.join(tmp, 'bench.db')
+        geracao = subprocess.run(
+            [sys.executable, '-m', 'benchmarks.dataset', '--db', db_path,
+             '--projetos', str(projetos), '--squads', str(squads), '--atividades', str(atividades)],
+            capture_output=True, text=True, check=True
+        )
+        medicao = subprocess.run(
+            [sys.executable, '-m', 'benchmarks.rotas', '--medir', db_path, '--repeticoes', str(repeticoes)],
+            capture_output=True, text=True, check=True
+        )
+    resultado = json.loads(medicao.stdout.strip().splitlines()[-1])
+    resultado['dataset'] = geracao.stdout.strip().splitlines()[-1]
+    return resultado
+
+
+def _commit_atual():
+    try:
+        return subprocess.run(['git', 'rev-parse', '--short', 'HEAD'],
+                              capture_output=True, text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def _comparar(atual, anterior, limite=LIMITE_REGRESSAO):
+    """Lista rotas cujo p95 piorou mais que o limite, ou que passaram a executar mais SQL"""
+    regressoes = []
+    for tamanho, dados in atual['tamanhos'].items():
+        base = anterior.get('tamanhos', {}).get(tamanho)
+        if not base:
+            continue
+        for rota, medida in dados['rotas'].items():
+            antes = base['rotas'].get(rota)
+            if not antes or not antes['p95_ms']:
+                continue
+            variacao = medida['p95_ms'] / antes['p95_ms'] - 1
+            if variacao > limite or (medida['sql'] or 0) > (antes['sql'] or 0):
+                regressoes.append(
+                    f"[{tamanho}] {rota}: p95 {antes['p95_ms']} -> {medida['p95_ms']} ms "
+                    f"({variacao:+.0%}), SQL {antes['sql']} -> {medida['sql']}"
+                )
+    return regressoes
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--tamanhos', default='1000,10000',
+                        help='Quantidades de atividades, separadas por vírgula')
+    parser.add_argument('--projetos', type=int, default=100)
+    parser.add_argument('--squads', type=int, default=8)
+    parser.add_argument('--repeticoes', type=int, default=20)
+    parser.add_argument('--saida', help='Arquivo JSON de resultado (padrão: stdout)')
+    parser.add_argument('--comparar-com', help='Resultado anterior para apontar regressões')
+    parser.add_argument('--limite', type=float, default=LIMITE_REGRESSAO,
+                        help='Piora relativa do p95 considerada regressão (padrão: 0.2)')
+    parser.add_argument('--medir', help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.medir:
+        _medir(args.medir, args.repeticoes)
+        return
+
+    resultado = {
+        'commit': _commit_atual(),
+        'data': datetime.now().isoformat(timespec='seconds'),
+        'python': platform.python_version(),
+        'plataforma': platform.platform(),
+        'parametros': {'projetos': args.projetos, 'squads': args.squads, 'repeticoes': args.repeticoes},
+        'tamanhos': {}
+    }
+    for tamanho in [int(t) for t in args.tamanhos.split(',') if t.strip()]:
+        print(f'Medindo {tamanho} atividades...', file=sys.stderr)
+        resultado['tamanhos'][str(tamanho)] = _executar_tamanho(
+            tamanho, args.projetos, args.squads, args.repeticoes
+        )
+
+    texto = json.dumps(resultado, indent=2, ensure_ascii=False)
+    if args.saida:
+        with open(args.saida, 'w', encoding='utf-8') as arquivo:
+            arquivo.write(texto)
+    else:
+        print(texto)
+
+    if args.comparar_com:
+        with open(args.comparar_com, encoding='utf-8') as arquivo:
+            regressoes = _comparar(resultado, json.load(arquivo), args.limite)
+        for linha in regressoes:
+            print(f'REGRESSÃO {linha}', file=sys.stderr)
+        if regressoes:
+            sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
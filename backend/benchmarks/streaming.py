@@ -0,0 +1,103 @@
+"""
+Compara a listagem completa de atividades materializada (jsonify de uma
+lista) com a versão em streaming: pico de memória e tempo até o primeiro byte.
+
+Cada modo roda em um subprocesso próprio, para que o pico de memória de um
+não contamine o outro.
+
+Uso (a partir de backend/):
+    python -m benchmarks.streaming --linhas 100000
+"""
+import argparse
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import time
+
+
+def _pico_memoria_mb():
+    """Pico de memória residente do processo atual (MB), quando disponível"""
+    try:
+        import resource
+    except ImportError:  # Windows
+        return None
+    pico = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux informa em KB, macOS em bytes
+    return pico / (1024 * 1024) if sys.platform == 'darwin' else pico / 1024
+
+
+def _popular(db_path, linhas):
+    """Cria um banco SQLite com 'linhas' atividades (ver benchmarks.dataset)"""
+    from benchmarks.dataset import criar_banco
+    criar_banco(db_path, projetos=10, squads=8, atividades=linhas)
+
+
+def _medir(db_path, modo):
+    """Executa a listagem no modo indicado e imprime as métricas em JSON"""
+    os.environ['DATABASE_URL'] = f'sqlite:///{db_path}'
+    from flask import jsonify
+    from app import create_app
+    from app.models import Atividade
+    from app.utils.queries import atividades_query
+
+    app = create_app('production')
+    base = _pico_memoria_mb()
+    inicio = time.perf_counter()
+
+    if modo == 'lista':
+        # Comportamento anterior: carrega tudo, monta a lista e serializa
+        with app.test_request_context():
+            query = atividades_query().order_by(Atividade.created_at.desc())
+            corpo = jsonify([a.to_dict() for a in query.all()]).get_data()
+        primeiro_byte = time.perf_counter() - inicio
+        tamanho = len(corpo)
+    else:
+        cliente = app.test_client()
+        resposta = cliente.get('/api/atividades', buffered=False)
+        pedacos = iter(resposta.response)
+        tamanho = len(next(pedacos))
+        primeiro_byte = time.perf_counter() - inicio
+        for pedaco in pedacos:
+            tamanho += len(pedaco)
+        resposta.close()
+
+    total = time.perf_counter() - inicio
+    pico = _pico_memoria_mb()
+    print(json.dumps({
+        'modo': modo,
+        'primeiro_byte_s': round(primeiro_byte, 4),
+        'total_s': round(total, 4),
+        'bytes': tamanho,
+        'pico_rss_mb': round(pico, 1) if pico is not None else None,
+        'rss_inicial_mb': round(base, 1) if base is not None else None
+    }))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--linhas', type=int, default=100000)
+    parser.add_argument('--medir', choices=['lista', 'stream'], help=argparse.SUPPRESS)
+    parser.add_argument('--db', help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.medir:
+        _medir(args.db, args.medir)
+        return
+
+    with tempfile.TemporaryDirectory() as tmp:
+        db_path = os.path.join(tmp, 'bench.db')
+        print(f'Populando {args.linhas} atividades...')
+        _popular(db_path, args.linhas)
+
+        for modo in ('lista', 'stream'):
+            saida = subprocess.run(
+                [sys.executable, '-m', 'benchmarks.streaming', '--medir', modo, '--db', db_path],
+                capture_output=True, text=True, check=True
+            )
+            print(saida.stdout.strip().splitlines()[-1])
+
+
+if __name__ == '__main__':
+    main()
@@ -4,6 +4,49 @@ from datetime import timedelta
 
 basedir = Path(__file__).parent
 
+# Servidor WSGI de produção (wsgi.py / gunicorn.conf.py)
+WSGI_WORKERS = int(os.environ.get('WSGI_WORKERS', 1))
+WSGI_THREADS = int(os.environ.get('WSGI_THREADS', 8))
+# 'gthread' (padrão) ou 'gevent' (conexões SSE ociosas não prendem threads)
+WSGI_WORKER_CLASS = os.environ.get('WSGI_WORKER_CLASS', 'gthread')
+
+
+def _env_bool(nome, padrao):
+    """Lê uma variável de ambiente booleana ('1', 'true', 'sim'...)"""
+    valor = os.environ.get(nome)
+    if valor is None:
+        return padrao
+    return valor.strip().lower() in ('1', 'true', 'yes', 'sim', 'on')
+
+
+def _engine_options(uri):
+    """
+    Opções do engine SQLAlchemy (pool e timeouts) a partir do ambiente
+    
+    DB_POOL_SIZE, DB_MAX_OVERFLOW, DB_POOL_TIMEOUT, DB_POOL_PRE_PING,
+    DB_POOL_RECYCLE e DB_STATEMENT_TIMEOUT_MS (apenas PostgreSQL).
+    O padrão do pool é uma conexão por thread do servidor WSGI.
+    """
+    sqlite = uri.startswith('sqlite')
+    if sqlite and (':memory:' in uri or uri.rstrip('/') == 'sqlite:'):
+        # Banco em memória usa uma única conexão (StaticPool)
+        return {}
+    
+    opcoes = {
+        'pool_size': int(os.environ.get('DB_POOL_SIZE', WSGI_THREADS)),
+        'max_overflow': int(os.environ.get('DB_MAX_OVERFLOW', WSGI_THREADS if sqlite else 10)),
+        'pool_timeout': int(os.environ.get('DB_POOL_TIMEOUT', 30)),
+        # Arquivo local não cai; bancos em rede podem derrubar conexões ociosas
+        'pool_pre_ping': _env_bool('DB_POOL_PRE_PING', not sqlite),
+        'pool_recycle': int(os.environ.get('DB_POOL_RECYCLE', -1 if sqlite else 1800)),
+    }
+    
+    statement_timeout = int(os.environ.get('DB_STATEMENT_TIMEOUT_MS', 0))
+    if statement_timeout and uri.startswith('postgres'):
+        opcoes['connect_args'] = {'options': f'-c statement_timeout={statement_timeout}'}
+    
+    return opcoes
+
 
 class Config:
     """Configurações base da aplicação"""
@@ -11,6 +54,41 @@ class Config:
     SQLALCHEMY_DATABASE_URI = os.environ.get('DATABASE_URL') or \
         f'sqlite:///{basedir / "instance" / "atividades.db"}'
     SQLALCHEMY_TRACK_MODIFICATIONS = False
+    SQLALCHEMY_ENGINE_OPTIONS = _engine_options(SQLALCHEMY_DATABASE_URI)
+    
+    # SQLite: PRAGMAs aplicados a cada conexão
+    SQLITE_JOURNAL_MODE = os.environ.get('SQLITE_JOURNAL_MODE', 'WAL')
+    SQLITE_BUSY_TIMEOUT_MS = int(os.environ.get('SQLITE_BUSY_TIMEOUT_MS', 5000))
+    SQLITE_SYNCHRONOUS = os.environ.get('SQLITE_SYNCHRONOUS', 'NORMAL')
+    
+    # Na inicialização, recusa subir se o banco não está na última migration;
+    # com SCHEMA_UPGRADE (python wsgi.py / run.py), aplica as pendentes
+    SCHEMA_CHECK = _env_bool('SCHEMA_CHECK', True)
+    SCHEMA_UPGRADE = _env_bool('SCHEMA_UPGRADE', False)
+    
+    # Pool: tempo de espera por conexão a partir do qual um aviso é registrado
+    DB_POOL_WAIT_WARN_MS = int(os.environ.get('DB_POOL_WAIT_WARN_MS', 100))
+    
+    # Instrumentação: statements mais lentos que isso são registrados no log
+    SLOW_QUERY_MS = int(os.environ.get('SLOW_QUERY_MS', 200))
+    SERVER_TIMING = _env_bool('SERVER_TIMING', True)
+    # Limite de statements por requisição (None desliga o aviso)
+    SQL_STATEMENT_BUDGET = None
+    
+    # Servidor WSGI
+    WSGI_WORKERS = WSGI_WORKERS
+    WSGI_THREADS = WSGI_THREADS
+    WSGI_WORKER_CLASS = WSGI_WORKER_CLASS
+    
+    # Senhas (bcrypt): custo e pool de threads que calcula os hashes.
+    # Hashes com outro custo são regravados no próximo login. Cada hash em
+    # execução ou na fila prende uma thread do servidor: com WORKERS + QUEUE
+    # abaixo de WSGI_THREADS sobram threads para as demais rotas durante um
+    # pico de logins (os excedentes recebem 503).
+    BCRYPT_ROUNDS = int(os.environ.get('BCRYPT_ROUNDS', 12))
+    PASSWORD_HASH_WORKERS = int(os.environ.get('PASSWORD_HASH_WORKERS', max(1, (os.cpu_count() or 2) // 2)))
+    PASSWORD_HASH_QUEUE = int(os.environ.get('PASSWORD_HASH_QUEUE', max(0, WSGI_THREADS // 2 - PASSWORD_HASH_WORKERS)))
+    PASSWORD_HASH_TIMEOUT = float(os.environ.get('PASSWORD_HASH_TIMEOUT', 10))  # segundos
     
     # CORS
     CORS_ORIGINS = os.environ.get('CORS_ORIGINS', '*')
@@ -18,6 +96,33 @@ class Config:
     # JWT
     JWT_SECRET_KEY = os.environ.get('JWT_SECRET_KEY') or SECRET_KEY
     JWT_ACCESS_TOKEN_EXPIRES = False  # Sessão do navegador (não expira automaticamente)
+    
+    # Usuários dos tokens em memória (ver app/utils/identity.py): alterações
+    # chegam aos outros processos pelo EventBroker; o TTL cobre mensagens perdidas
+    IDENTITY_CACHE_TTL = int(os.environ.get('IDENTITY_CACHE_TTL', 60))
+    IDENTITY_CACHE_MAX_ENTRIES = int(os.environ.get('IDENTITY_CACHE_MAX_ENTRIES', 10000))
+    
+    # Cache de respostas: 'memory' (LRU no processo), 'redis' ou 'none'
+    CACHE_BACKEND = os.environ.get('CACHE_BACKEND', 'memory')
+    CACHE_REDIS_URL = os.environ.get('CACHE_REDIS_URL', 'redis://localhost:6379/0')
+    CACHE_TTL = int(os.environ.get('CACHE_TTL', 300))  # segundos
+    CACHE_MAX_ENTRIES = int(os.environ.get('CACHE_MAX_ENTRIES', 512))
+    CACHE_MAX_ITEM_BYTES = int(os.environ.get('CACHE_MAX_ITEM_BYTES', 16 * 1024 * 1024))
+    
+    # Eventos de alteração (/api/eventos): 'memory' (um worker), 'redis'
+    # (vários workers) ou 'none'. Com servidores de threads (gthread,
+    # waitress) cada conexão aberta prende uma thread: o padrão reserva no
+    # máximo 1/4 das threads para o stream; com gevent, cada conexão é uma
+    # greenlet e o limite pode ficar na casa das centenas
+    EVENTS_BACKEND = os.environ.get('EVENTS_BACKEND', 'memory')
+    EVENTS_REDIS_URL = os.environ.get('EVENTS_REDIS_URL', os.environ.get('CACHE_REDIS_URL', 'redis://localhost:6379/0'))
+    EVENTS_MAX_CLIENTS = int(os.environ.get(
+        'EVENTS_MAX_CLIENTS', 1000 if WSGI_WORKER_CLASS == 'gevent' else max(1, WSGI_THREADS // 4)
+    ))
+    EVENTS_HEARTBEAT = int(os.environ.get('EVENTS_HEARTBEAT', 15))  # segundos
+    EVENTS_STREAM_TIMEOUT = int(os.environ.get('EVENTS_STREAM_TIMEOUT', 600))  # segundos
+    EVENTS_QUEUE_SIZE = int(os.environ.get('EVENTS_QUEUE_SIZE', 256))
+    EVENTS_HISTORY = int(os.environ.get('EVENTS_HISTORY', 1000))
 
 
 class DevelopmentConfig(Config):
@@ -25,6 +130,8 @@ class DevelopmentConfig(Config):
     DEBUG = True
     # Permitir CORS de qualquer origem em desenvolvimento
     CORS_ORIGINS = '*'
+    # Avisa (SQLBudgetWarning) quando uma requisição passa deste número de statements
+    SQL_STATEMENT_BUDGET = int(os.environ.get('SQL_STATEMENT_BUDGET', 20))
 
 
 class ProductionConfig(Config):
@@ -0,0 +1,36 @@
+"""Configuração do gunicorn (Linux): gunicorn -c gunicorn.conf.py wsgi:app"""
+import os
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent))
+# Os mesmos padrões que a aplicação usa (pool de conexões, limite de streams)
+from config import WSGI_WORKERS, WSGI_THREADS, WSGI_WORKER_CLASS, Config  # noqa: E402
+
+bind = f"{os.environ.get('HOST', '0.0.0.0')}:{os.environ.get('PORT', 5000)}"
+workers = WSGI_WORKERS
+threads = WSGI_THREADS
+# gthread: uma thread por requisição em andamento. gevent (pip install
+# gevent): cada conexão é uma greenlet, e centenas de clientes ociosos em
+# /api/eventos cabem em um worker; o gunicorn aplica o monkey patching
+worker_class = WSGI_WORKER_CLASS
+worker_connections = int(os.environ.get('WSGI_WORKER_CONNECTIONS', 1000))
+timeout = 60
+# Cada worker cria a própria aplicação (e o próprio pool de conexões)
+preload_app = False
+
+
+def on_starting(server):
+    """Com mais de um worker, recusa backends que só valem dentro de um processo"""
+    if server.cfg.workers <= 1:
+        return
+    if Config.EVENTS_BACKEND != 'redis':
+        # Eventos, invalidações do cache de identidades e revogações de um
+        # worker não chegariam aos clientes e aos caches dos outros
+        raise SystemExit(
+            f'{server.cfg.workers} workers com EVENTS_BACKEND={Config.EVENTS_BACKEND}: cada worker '
+            'veria só os próprios eventos, invalidações e logouts. Use EVENTS_BACKEND=redis ou WSGI_WORKERS=1'
+        )
+    server.log.warning(
+        '%s workers: /metrics mostra os contadores do worker que atender a coleta', server.cfg.workers
+    )
@@ -1,13 +1,22 @@
+import os
+from pathlib import Path
+
+# O próprio script aplica as migrations: dispensa o aviso de schema desatualizado
+os.environ.setdefault('SCHEMA_CHECK', 'false')
+
+from flask_migrate import upgrade
 from app import create_app, db
 from app.models import Usuario
 
+MIGRATIONS_DIR = Path(__file__).parent / 'migrations'
+
 def criar_admin():
     """Cria o usuário admin inicial se não existir"""
     app = create_app('development')
     
     with app.app_context():
-        # Criar todas as tabelas
-        db.create_all()
+        # Criar/atualizar as tabelas pelas migrations (equivale a flask db upgrade)
+        upgrade(directory=str(MIGRATIONS_DIR))
         
         # Verificar se admin já existe
         admin = Usuario.query.filter_by(login='admin').first()
@@ -0,0 +1,35 @@
+"""Índices de filtro e ordenação em atividades
+
+Revision ID: 3f9c2a7e1b40
+Revises: 7d7b53ed9636
+Create Date: 2026-10-18 08:05:12.418233
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '3f9c2a7e1b40'
+down_revision = '7d7b53ed9636'
+branch_labels = None
+depends_on = None
+
+
+INDICES = [
+    ('ix_atividades_projeto_id_created_at', 'atividades', ['projeto_id', 'created_at']),
+    ('ix_atividades_squad_id_created_at', 'atividades', ['squad_id', 'created_at']),
+    ('ix_atividades_status_prioridade_created_at', 'atividades', ['status', 'prioridade', 'created_at']),
+    ('ix_atividades_created_at', 'atividades', ['created_at']),
+    ('ix_projeto_squad_squad_id', 'projeto_squad', ['squad_id']),
+]
+
+
+def upgrade():
+    for nome, tabela, colunas in INDICES:
+        op.create_index(nome, tabela, colunas, unique=False, if_not_exists=True)
+
+
+def downgrade():
+    for nome, tabela, colunas in reversed(INDICES):
+        op.drop_index(nome, table_name=tabela, if_exists=True)
@@ -0,0 +1,38 @@
+"""Registro de alterações (alteracoes) para sincronização incremental
+
+Revision ID: 485be5721ad5
+Revises: 9a1f5c3e7b62
+Create Date: 2026-10-18 17:05:12.402981
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+from app.utils.changes import install_change_log, uninstall_change_log
+
+
+# revision identifiers, used by Alembic.
+revision = '485be5721ad5'
+down_revision = '9a1f5c3e7b62'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_table(
+        'alteracoes',
+        sa.Column('entidade', sa.String(length=20), nullable=False),
+        sa.Column('registro_id', sa.Integer(), autoincrement=False, nullable=False),
+        sa.Column('seq', sa.BigInteger(), nullable=False),
+        sa.Column('op', sa.String(length=10), nullable=False),
+        sa.PrimaryKeyConstraint('entidade', 'registro_id')
+    )
+    op.create_index('ix_alteracoes_seq', 'alteracoes', ['seq'], unique=True)
+    # Triggers nas tabelas de dados; registra os registros atuais
+    install_change_log(op.get_bind())
+
+
+def downgrade():
+    uninstall_change_log(op.get_bind())
+    op.drop_index('ix_alteracoes_seq', table_name='alteracoes')
+    op.drop_table('alteracoes')
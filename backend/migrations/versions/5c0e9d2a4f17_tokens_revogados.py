@@ -0,0 +1,30 @@
+"""Tokens revogados pelo logout (tokens_revogados)
+
+Revision ID: 5c0e9d2a4f17
+Revises: 485be5721ad5
+Create Date: 2026-10-18 19:41:27.115032
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '5c0e9d2a4f17'
+down_revision = '485be5721ad5'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_table(
+        'tokens_revogados',
+        sa.Column('jti', sa.String(length=36), nullable=False),
+        sa.Column('expira_em', sa.DateTime(), nullable=True),
+        sa.Column('revogado_em', sa.DateTime(), nullable=True),
+        sa.PrimaryKeyConstraint('jti')
+    )
+
+
+def downgrade():
+    op.drop_table('tokens_revogados')
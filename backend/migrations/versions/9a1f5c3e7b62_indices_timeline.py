@@ -0,0 +1,31 @@
+"""Índice de datas programadas em atividades (timeline)
+
+Revision ID: 9a1f5c3e7b62
+Revises: e4b7a2c91d05
+Create Date: 2026-10-18 15:40:27.906113
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '9a1f5c3e7b62'
+down_revision = 'e4b7a2c91d05'
+branch_labels = None
+depends_on = None
+
+
+INDICES = [
+    ('ix_atividades_fim_programado_inicio_programado', 'atividades', ['fim_programado', 'inicio_programado']),
+]
+
+
+def upgrade():
+    for nome, tabela, colunas in INDICES:
+        op.create_index(nome, tabela, colunas, unique=False, if_not_exists=True)
+
+
+def downgrade():
+    for nome, tabela, colunas in reversed(INDICES):
+        op.drop_index(nome, table_name=tabela, if_exists=True)
@@ -0,0 +1,26 @@
+"""Índices para paginação por cursor de squads e usuários
+
+Revision ID: b51e08d4c2a9
+Revises: 3f9c2a7e1b40
+Create Date: 2026-10-18 09:12:40.102345
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'b51e08d4c2a9'
+down_revision = '3f9c2a7e1b40'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_index('ix_squads_nome', 'squads', ['nome'], unique=False, if_not_exists=True)
+    op.create_index('ix_usuarios_nome', 'usuarios', ['nome'], unique=False, if_not_exists=True)
+
+
+def downgrade():
+    op.drop_index('ix_usuarios_nome', table_name='usuarios', if_exists=True)
+    op.drop_index('ix_squads_nome', table_name='squads', if_exists=True)
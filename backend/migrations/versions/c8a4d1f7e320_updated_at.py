@@ -0,0 +1,40 @@
+"""Coluna updated_at em projetos, squads, atividades e usuarios
+
+Revision ID: c8a4d1f7e320
+Revises: b51e08d4c2a9
+Create Date: 2026-10-18 10:31:08.552190
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'c8a4d1f7e320'
+down_revision = 'b51e08d4c2a9'
+branch_labels = None
+depends_on = None
+
+
+TABELAS = ['projetos', 'squads', 'atividades', 'usuarios']
+
+
+def upgrade():
+    inspector = sa.inspect(op.get_bind())
+
+    for tabela in TABELAS:
+        colunas = {c['name'] for c in inspector.get_columns(tabela)}
+        if 'updated_at' not in colunas:
+            with op.batch_alter_table(tabela, schema=None) as batch_op:
+                batch_op.add_column(sa.Column('updated_at', sa.DateTime(), nullable=True))
+
+        # Registros existentes partem da data de criação
+        op.execute(f'UPDATE {tabela} SET updated_at = created_at WHERE updated_at IS NULL')
+        op.create_index(f'ix_{tabela}_updated_at', tabela, ['updated_at'], unique=False, if_not_exists=True)
+
+
+def downgrade():
+    for tabela in reversed(TABELAS):
+        op.drop_index(f'ix_{tabela}_updated_at', table_name=tabela, if_exists=True)
+        with op.batch_alter_table(tabela, schema=None) as batch_op:
+            batch_op.drop_column('updated_at')
@@ -0,0 +1,27 @@
+"""Índice de busca textual em projetos e atividades (FTS5 no SQLite, tsvector no PostgreSQL)
+
+Revision ID: e4b7a2c91d05
+Revises: c8a4d1f7e320
+Create Date: 2026-10-18 14:12:40.318804
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+from app.utils.search import install_search, uninstall_search
+
+
+# revision identifiers, used by Alembic.
+revision = 'e4b7a2c91d05'
+down_revision = 'c8a4d1f7e320'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    # Tabelas virtuais/tsvector e triggers de sincronização; preenche com os dados atuais
+    install_search(op.get_bind())
+
+
+def downgrade():
+    uninstall_search(op.get_bind())
@@ -1,641 +1,266 @@
 """
-Script para popular o banco de dados com dados de exemplo
-Execute após criar as migrations: python populate_db.py
+Script para popular o banco de dados a partir dos arquivos de seeds/
+Aplica as migrations pendentes (flask db upgrade) antes da carga: python populate_db.py
+
+A carga é incremental: registros são identificados pela chave natural
+(squad e projeto pelo nome; atividade por projeto + squad + título).
+Registros novos são inseridos, os que mudaram são atualizados e os demais
+ficam como estão; nada é apagado, a não ser com --limpar.
+
+Cada tabela pode vir em <tabela>.json (lista de objetos) ou <tabela>.csv
+(UTF-8, com cabeçalho). Em projetos, 'squads' é uma lista de nomes (no CSV,
+separados por ';'). Datas aceitam AAAA-MM-DD ou deslocamentos em dias a
+partir de hoje ('+5', '-3'); datas relativas valem só na inserção, para que
+recarregar em outro dia não altere registros que já existem.
+
+Uso:
+    python populate_db.py
+    python populate_db.py --dir /caminho/seeds --lote 5000
+    python populate_db.py --limpar   # apaga os dados antes (cuidado em produção!)
 """
+import argparse
+import csv
+import json
+import os
+import time
+from datetime import date, timedelta
+from pathlib import Path
+
+# O próprio script aplica as migrations: dispensa o aviso de schema desatualizado
+os.environ.setdefault('SCHEMA_CHECK', 'false')
+
+from flask_migrate import upgrade
+from sqlalchemy import select, delete, bindparam
 from app import create_app, db
-from app.models import Projeto, Squad, Atividade
-from datetime import datetime, timedelta
-
-app = create_app('development')
-
-with app.app_context():
-    # Limpar dados existentes (cuidado em produção!)
-    print("Limpando banco de dados...")
-    db.drop_all()
-    db.create_all()
-    
-    # Criar Squads
-    print("Criando squads...")
-    squad1 = Squad(nome="Auditoria", descricao="Squad de auditoria")
-    squad2 = Squad(nome="Recodificação", descricao="Squad de Recodificação")
-    squad3 = Squad(nome="Processamento", descricao="Squad de Processamento")
-    squad4 = Squad(nome="Categorização", descricao="Squad de Categorização")
-    squad5 = Squad(nome="Medidas", descricao="Squad de Medidas")
-    squad6 = Squad(nome="Cálculo", descricao="Squad de Cálculo")
-    squad7 = Squad(nome="Validação", descricao="Squad de Validação")
-    squad8 = Squad(nome="Recursos", descricao="Squad de Recursos")
-    
-    
-    db.session.add_all([squad1, squad2, squad3, squad4, squad5, squad6, squad7, squad8])
+from app.models import Projeto, Squad, Atividade, projeto_squad
+from app.utils.dates import parse_date
+
+SEEDS_DIR = Path(__file__).parent / 'seeds'
+MIGRATIONS_DIR = Path(__file__).parent / 'migrations'
+
+CAMPOS_SQUAD = ('descricao',)
+CAMPOS_PROJETO = ('subprograma', 'ordem_producao', 'data_aplicacao', 'data_termino', 'etapas',
+                  'disciplinas', 'tipos_processamento', 'observacao')
+CAMPOS_ATIVIDADE = ('observacao', 'inicio_programado', 'inicio_realizado', 'fim_programado',
+                    'fim_realizado', 'prioridade', 'status')
+CAMPOS_DATA = ('data_aplicacao', 'data_termino', 'inicio_programado', 'inicio_realizado',
+               'fim_programado', 'fim_realizado')
+
+
+def ler_registros(diretorio, nome):
+    """Lê <nome>.json ou <nome>.csv do diretório; retorna [] se nenhum existir"""
+    caminho_json = diretorio / f'{nome}.json'
+    if caminho_json.exists():
+        with open(caminho_json, encoding='utf-8') as arquivo:
+            return json.load(arquivo)
+
+    caminho_csv = diretorio / f'{nome}.csv'
+    if caminho_csv.exists():
+        with open(caminho_csv, encoding='utf-8-sig', newline='') as arquivo:
+            return list(csv.DictReader(arquivo))
+
+    return []
+
+
+class DataRelativa(date):
+    """Data informada como deslocamento a partir de hoje ('+5')"""
+
+
+def converter_data(valor, hoje):
+    """Converte 'AAAA-MM-DD' ou '+N'/'-N' (dias a partir de hoje) em date"""
+    if valor in (None, ''):
+        return None
+    if isinstance(valor, date):
+        return valor
+    valor = str(valor).strip()
+    if valor[0] in '+-':
+        data = hoje + timedelta(days=int(valor))
+        return DataRelativa(data.year, data.month, data.day)
+    return parse_date(valor)
+
+
+def normalizar(registro, campos, hoje):
+    """Extrai os campos da tabela, convertendo datas"""
+    linha = {}
+    for campo in campos:
+        valor = registro.get(campo)
+        linha[campo] = converter_data(valor, hoje) if campo in CAMPOS_DATA else valor
+    return linha
+
+
+class Carga:
+    """Upserts em lote por chave natural, com contagem de linhas e tempo por tabela"""
+
+    def __init__(self, lote):
+        self.lote = lote
+        self.resumo = {}
+
+    def _executar_em_lotes(self, instrucao, linhas):
+        for inicio in range(0, len(linhas), self.lote):
+            db.session.execute(instrucao, linhas[inicio:inicio + self.lote])
+            # Uma transação por lote: cargas grandes não seguram o lock de escrita
+            db.session.commit()
+
+    def upsert(self, tabela, colunas_chave, campos, linhas):
+        """
+        Insere linhas novas e atualiza as que mudaram
+
+        Args:
+            tabela: Table do SQLAlchemy
+            colunas_chave: Colunas que formam a chave natural
+            campos: Demais colunas carregadas
+            linhas: Dicts com chave + campos
+
+        Returns:
+            dict: chave natural -> id, para as tabelas dependentes
+        """
+        inicio = time.perf_counter()
+        colunas = [tabela.c.id] + [tabela.c[c] for c in colunas_chave + campos]
+        existentes = {
+            tuple(row[c] for c in colunas_chave): row
+            for row in db.session.execute(select(*colunas)).mappings()
+        }
+
+        novas, alteradas, vistas = [], [], set()
+        for linha in linhas:
+            chave = tuple(linha[c] for c in colunas_chave)
+            if chave in vistas:
+                continue
+            vistas.add(chave)
+            atual = existentes.get(chave)
+            if atual is None:
+                novas.append(linha)
+                continue
+            # Datas relativas só valem para registros novos
+            valores = {c: atual[c] if isinstance(linha[c], DataRelativa) else linha[c] for c in campos}
+            if any(atual[c] != valores[c] for c in campos):
+                alteradas.append({'_id': atual['id'], **valores})
+
+        if novas:
+            self._executar_em_lotes(tabela.insert(), novas)
+        if alteradas:
+            # updated_at é preenchido pelo onupdate da coluna
+            instrucao = (
+                tabela.update()
+                .where(tabela.c.id == bindparam('_id'))
+                .values({c: bindparam(c) for c in campos})
+            )
+            self._executar_em_lotes(instrucao, alteradas)
+
+        self._registrar(tabela.name, len(novas), len(alteradas), len(vistas), inicio)
+
+        if not novas:
+            return {chave: row['id'] for chave, row in existentes.items()}
+        ids = select(tabela.c.id, *[tabela.c[c] for c in colunas_chave])
+        return {tuple(row[1:]): row[0] for row in db.session.execute(ids)}
+
+    def vincular(self, pares):
+        """Insere os pares (projeto_id, squad_id) que ainda não existem"""
+        inicio = time.perf_counter()
+        existentes = set(db.session.execute(select(projeto_squad.c.projeto_id, projeto_squad.c.squad_id)))
+        novos = [
+            {'projeto_id': projeto_id, 'squad_id': squad_id}
+            for projeto_id, squad_id in dict.fromkeys(pares) if (projeto_id, squad_id) not in existentes
+        ]
+        if novos:
+            self._executar_em_lotes(projeto_squad.insert(), novos)
+        self._registrar(projeto_squad.name, len(novos), 0, len(set(pares)), inicio)
+
+    def _registrar(self, tabela, inseridas, atualizadas, lidas, inicio):
+        self.resumo[tabela] = {
+            'lidas': lidas,
+            'inseridas': inseridas,
+            'atualizadas': atualizadas,
+            'segundos': time.perf_counter() - inicio
+        }
+
+
+def limpar():
+    """Apaga os dados das tabelas carregadas (mantém usuários e o schema)"""
+    for tabela in (Atividade.__table__, projeto_squad, Projeto.__table__, Squad.__table__):
+        db.session.execute(delete(tabela))
     db.session.commit()
-    
-    # Criar Projetos
-    print("Criando projetos (avaliações)...")
-    
-    
-    projeto1 = Projeto(
-        subprograma="2070",
-        nome="GO GOIÁS - AV. SOMATIVA EF EM 2025 (SAEGO)",
-        ordem_producao="OP09",
-        data_aplicacao=datetime(2025, 10, 1).date(),
-        data_termino=datetime(2025, 10, 1).date(),
-        etapas="9º ano EF e 3ª série EM",
-        disciplinas="Língua Portuguesa/Matemática",
-        tipos_processamento="Destaque",
-        observacao=""
-    )
-    projeto1.squads = [squad1, squad2, squad3, squad4, squad5, squad6, squad7, squad8]    
+
+
+def popular(diretorio=SEEDS_DIR, lote=5000):
+    """
+    Carrega squads, projetos (com suas squads) e atividades de `diretorio`
+
+    Returns:
+        dict: Resumo por tabela (lidas, inseridas, atualizadas, segundos)
+    """
+    hoje = date.today()
+    carga = Carga(lote)
+
+    squads = [{'nome': r['nome'], **normalizar(r, CAMPOS_SQUAD, hoje)}
+              for r in ler_registros(diretorio, 'squads')]
+    squad_ids = carga.upsert(Squad.__table__, ('nome',), CAMPOS_SQUAD, squads)
+
+    registros_projetos = ler_registros(diretorio, 'projetos')
+    projetos = [{'nome': r['nome'], **normalizar(r, CAMPOS_PROJETO, hoje)} for r in registros_projetos]
+    projeto_ids = carga.upsert(Projeto.__table__, ('nome',), CAMPOS_PROJETO, projetos)
+
+    pares = []
+    for registro in registros_projetos:
+        nomes = registro.get('squads') or []
+        if isinstance(nomes, str):
+            nomes = [n.strip() for n in nomes.split(';') if n.strip()]
+        for nome in nomes:
+            if (nome,) not in squad_ids:
+                raise ValueError(f"Projeto '{registro['nome']}': squad '{nome}' não encontrada")
+            pares.append((projeto_ids[(registro['nome'],)], squad_ids[(nome,)]))
+    carga.vincular(pares)
+
+    atividades = []
+    for numero, registro in enumerate(ler_registros(diretorio, 'atividades'), start=1):
+        projeto_id = projeto_ids.get((registro['projeto'],))
+        squad_id = squad_ids.get((registro['squad'],))
+        if projeto_id is None or squad_id is None:
+            raise ValueError(f"Atividade {numero}: projeto '{registro['projeto']}' "
+                             f"ou squad '{registro['squad']}' não encontrado")
+        linha = normalizar(registro, CAMPOS_ATIVIDADE, hoje)
+        linha['prioridade'] = linha['prioridade'] or 'media'
+        linha['status'] = linha['status'] or 'pendente'
+        atividades.append({'projeto_id': projeto_id, 'squad_id': squad_id,
+                           'titulo': registro['titulo'], **linha})
+    carga.upsert(Atividade.__table__, ('projeto_id', 'squad_id', 'titulo'), CAMPOS_ATIVIDADE, atividades)
+
+    return carga.resumo
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Carrega os dados de seeds/ no banco')
+    parser.add_argument('--dir', type=Path, default=SEEDS_DIR, help='Diretório com os arquivos de carga')
+    parser.add_argument('--lote', type=int, default=5000, help='Linhas por transação')
+    parser.add_argument('--limpar', action='store_true', help='Apaga os dados existentes antes da carga')
+    args = parser.parse_args()
+
+    app = create_app('development')
+
+    with app.app_context():
+        upgrade(directory=str(MIGRATIONS_DIR))
         
-    projeto2 = Projeto(
-        subprograma="2075",
-        nome="CE CEARÁ - AV. SOMATIVA EM 2025 (SPAECE EM)",
-        ordem_producao="OP10",
-        data_aplicacao=datetime(2025, 10, 22).date(),
-        data_termino=datetime(2025, 10, 23).date(),
-        etapas="2ª série EM, 3ª série EM e EJA EM",
-        disciplinas="Língua Portuguesa/Matemática",
-        tipos_processamento="Destaque",
-        observacao=""
-    )
-    projeto2.squads = [squad1, squad2, squad3, squad4, squad5, squad6, squad7, squad8]
-    
-    projeto3 = Projeto(
-        subprograma="2132",
-        nome="PI PIAUÍ - AV. SOMATIVA 2025 EF EM (SAEPI)",
-        ordem_producao="OP10",
-        data_aplicacao=datetime(2025, 10, 6).date(),
-        data_termino=datetime(2025, 10, 17).date(),
-        etapas="5º ano EF, 6º ano EF, 7º ano EF, 8º ano EF, 9º ano EF, 1ª série EM, 2ª série EM e 3ª série EM",
-        disciplinas="Língua Portuguesa/Matemática",
-        tipos_processamento="Destaque",
-        observacao=""
-    )
-    projeto3.squads = [squad1, squad2, squad3, squad4, squad5, squad6, squad7, squad8]
-    
-    projeto4 = Projeto(
-        subprograma="2085",
-        nome="MT MATO GROSSO - AV.SOMATIVA 2025 (AVALIAMT)",
-        ordem_producao="OP10",
-        data_aplicacao=datetime(2025, 10, 6).date(),
-        data_termino=datetime(2025, 10, 17).date(),
-        etapas="3º ano EF, 4º ano EF, 5º ano EF, 6º ano EF, 7º ano EF, 8º ano EF, 9º ano EF, 1ª série EM, 2ª série EM, 3ª série EM e 4ª série EM",
-        disciplinas="Língua Portuguesa/Matemática",
-        tipos_processamento="Destaque e Transcrição",
-        observacao=""
-    )
-    projeto4.squads = [squad1, squad2, squad3, squad4, squad5, squad6, squad7, squad8]                
-    
-    db.session.add_all([projeto1, projeto2, projeto3, projeto4])
-    db.session.commit()
-    
-    # Criar Atividades
-    print("Criando atividades...")
-    
-    # Datas base para as atividades
-    hoje = datetime.now()
-    inicio_prog = (hoje + timedelta(days=5)).date()
-    inicio_real = (hoje + timedelta(days=6)).date()
-    fim_prog = (hoje + timedelta(days=15)).date()
-    fim_real = (hoje + timedelta(days=14)).date()
-    
-    # Atividades do Projeto
-
-    atividades = [
-
-        # squad1 - Auditoria
-        Atividade(titulo="Transcrição", observacao="", 
-                inicio_programado=inicio_prog, inicio_realizado=inicio_real,
-                fim_programado=fim_prog, fim_realizado=fim_real,
-                prioridade="alta", status="concluida", projeto_id=projeto1.id, squad_id=squad1.id),
-        Atividade(titulo="Transcrição", observacao="", 
-                inicio_programado=inicio_prog, inicio_realizado=inicio_real,
-                fim_programado=fim_prog, fim_realizado=fim_real,
-                prioridade="alta", status="concluida", projeto_id=projeto2.id, squad_id=squad1.id),        
-        Atividade(titulo="Transcrição", observacao="", 
-                inicio_programado=inicio_prog, inicio_realizado=inicio_real,
-                fim_programado=fim_prog, fim_realizado=fim_real,
-                prioridade="alta", status="concluida", projeto_id=projeto3.id, squad_id=squad1.id),
-        Atividade(titulo="Transcrição", observacao="", 
-                inicio_programado=inicio_prog, inicio_realizado=inicio_real,
-                fim_programado=fim_prog, fim_realizado=fim_real,
-                prioridade="alta", status="concluida", projeto_id=projeto4.id, squad_id=squad1.id),
-                    
-        # squad2 - Recodificação
-        Atividade(titulo="CR Reserva", observacao="", 
-                inicio_programado=inicio_prog, inicio_realizado=inicio_real,
-                fim_programado=fim_prog, fim_realizado=fim_real,
-                prioridade="alta", status="concluida", projeto_id=projeto1.id, squad_id=squad2.id),
-        Atividade(titulo="CR Anulado", observacao="", 
-                inicio_programado=inicio_prog, inicio_realizado=inicio_real,
-                fim_programado=fim_prog, fim_realizado=fim_real,
-                prioridade="alta", status="concluida", projeto_id=projeto1.id, squad_id=squad2.id),
-        Atividade(titulo="CR Duplicado", observacao="", 
-                inicio_programado=inicio_prog, inicio_realizado=inicio_real,
-                fim_programado=fim_prog, fim_realizado=fim_real,
-                prioridade="alta", status="concluida", projeto_id=projeto1.id, squad_id=squad2.id),
-        Atividade(titulo="CR Genérico", observacao="", 
-                inicio_programado=inicio_prog, inicio_realizado=inicio_real,
-                fim_programado=fim_prog, fim_realizado=fim_real,
-                prioridade="alta", status="concluida", projeto_id=projeto1.id, squad_id=squad2.id),
-        Atividade(titulo="Sujeito C1", observacao="", 
-                inicio_programado=inicio_prog, inicio_realizado=inicio_real,
-                fim_programado=fim_prog, fim_realizado=fim_real,
-                prioridade="alta", status="concluida", projeto_id=projeto1.id, squad_id=squad2.id),
-        Atividade(titulo="Sujeito C2", observacao="", 
-                inicio_programado=inicio_prog, inicio_realizado=inicio_real,
-                fim_programado=fim_prog, fim_realizado=fim_real,
-                prioridade="alta", status="concluida", projeto_id=projeto1.id, squad_id=squad2.id),
-        Atividade(titulo="Público Alvo", observacao="", 
-                inicio_programado=inicio_prog, inicio_realizado=inicio_real,
-                fim_programado=fim_prog, fim_realizado=fim_real,
-                prioridade="alta", status="concluida", projeto_id=projeto1.id, squad_id=squad2.id),
-        Atividade(titulo="CR Reserva", observacao="", 
-                inicio_programado=inicio_prog, inicio_realizado=inicio_real,
-                fim_programado=fim_prog, fim_realizado=fim_real,
-                prioridade="alta", status="concluida", projeto_id=projeto2.id, squad_id=squad2.id),
-        Atividade(titulo="CR Anulado", observacao="", 
-                inicio_programado=inicio_prog, inicio_realizado=inicio_real,
-                fim_programado=fim_prog, fim_realizado=fim_real,
-                prioridade="alta", status="concluida", projeto_id=projeto2.id, squad_id=squad2.id),
-        Atividade(titulo="CR Duplicado", observacao="", 
-                inicio_programado=inicio_prog, inicio_realizado=inicio_real,
-                fim_programado=fim_prog, fim_realizado=fim_real,
-                prioridade="alta", status="concluida", projeto_id=projeto2.id, squad_id=squad2.id),
-        Atividade(titulo="CR Genérico", observacao="", 
-                inicio_programado=inicio_prog, inicio_realizado=inicio_real,
-                fim_programado=fim_prog, fim_realizado=fim_real,
-                prioridade="alta", status="concluida", projeto_id=projeto2.id, squad_id=squad2.id),
-        Atividade(titulo="Sujeito C1", observacao="", 
-                inicio_programado=inicio_prog, inicio_realizado=inicio_real,
-                fim_programado=fim_prog, fim_realizado=fim_real,
-                prioridade="alta", status="concluida", projeto_id=projeto2.id, squad_id=squad2.id),
-        Atividade(titulo="Sujeito C2", observacao="", 
-                inicio_programado=inicio_prog, inicio_realizado=inicio_real,
-                fim_programado=fim_prog, fim_realizado=fim_real,
-                prioridade="alta", status="concluida", projeto_id=projeto2.id, squad_id=squad2.id),
-        Atividade(titulo="Público Alvo", observacao="", 
-                inicio_programado=inicio_prog, inicio_realizado=inicio_real,
-                fim_programado=fim_prog, fim_realizado=fim_real,
-                prioridade="alta", status="concluida", projeto_id=projeto2.id, squad_id=squad2.id),
-        Atividade(titulo="CR Reserva", observacao="", 
-                inicio_programado=inicio_prog, inicio_realizado=inicio_real,
-                fim_programado=fim_prog, fim_realizado=fim_real,
-                prioridade="alta", status="concluida", projeto_id=projeto3.id, squad_id=squad2.id),
-        Atividade(titulo="CR Anulado", observacao="", 
-                inicio_programado=inicio_prog, inicio_realizado=inicio_real,
-                fim_programado=fim_prog, fim_realizado=fim_real,
-                prioridade="alta", status="concluida", projeto_id=projeto3.id, squad_id=squad2.id),
-        Atividade(titulo="CR Duplicado", observacao="", 
-                inicio_programado=inicio_prog, inicio_realizado=inicio_real,
-                fim_programado=fim_prog, fim_realizado=fim_real,
-                prioridade="alta", status="concluida", projeto_id=projeto3.id, squad_id=squad2.id),
-        Atividade(titulo="CR Genérico", observacao="", 
-                inicio_programado=inicio_prog, inicio_realizado=inicio_real,
-                fim_programado=fim_prog, fim_realizado=fim_real,
-                prioridade="alta", status="concluida", projeto_id=projeto3.id, squad_id=squad2.id),
-        Atividade(titulo="Sujeito C1", observacao="", 
-                inicio_programado=inicio_prog, inicio_realizado=inicio_real,
-                fim_programado=fim_prog, fim_realizado=fim_real,
-                prioridade="alta", status="concluida", projeto_id=projeto3.id, squad_id=squad2.id),
-        Atividade(titulo="Sujeito C2", observacao="", 
-                inicio_programado=inicio_prog, inicio_realizado=inicio_real,
-                fim_programado=fim_prog, fim_realizado=fim_real,
-                prioridade="alta", status="concluida", projeto_id=projeto3.id, squad_id=squad2.id),
-        Atividade(titulo="Público Alvo", observacao="", 
-                inicio_programado=inicio_prog, inicio_realizado=inicio_real,
-                fim_programado=fim_prog, fim_realizado=fim_real,
-                prioridade="alta", status="concluida", projeto_id=projeto3.id, squad_id=squad2.id),
-        Atividade(titulo="CR Reserva", observacao="", 
-                inicio_programado=inicio_prog, inicio_realizado=inicio_real,
-                fim_programado=fim_prog, fim_realizado=fim_real,
-                prioridade="alta", status="concluida", projeto_id=projeto4.id, squad_id=squad2.id),
-        Atividade(titulo="CR Anulado", observacao="", 
-                inicio_programado=inicio_prog, inicio_realizado=inicio_real,
-                fim_programado=fim_prog, fim_realizado=fim_real,
-                prioridade="alta", status="concluida", projeto_id=projeto4.id, squad_id=squad2.id),
-        Atividade(titulo="CR Duplicado", observacao="", 
-                inicio_programado=inicio_prog, inicio_realizado=inicio_real,
-                fim_programado=fim_prog, fim_realizado=fim_real,
-                prioridade="alta", status="concluida", projeto_id=projeto4.id, squad_id=squad2.id),
-        Atividade(titulo="CR Genérico", observacao="", 
-                inicio_programado=inicio_prog, inicio_realizado=inicio_real,
-                fim_programado=fim_prog, fim_realizado=fim_real,
-                prioridade="alta", status="concluida", projeto_id=projeto4.id, squad_id=squad2.id),
-        Atividade(titulo="Sujeito C1", observacao="", 
-                inicio_programado=inicio_prog, inicio_realizado=inicio_real,
-                fim_programado=fim_prog, fim_realizado=fim_real,
-                prioridade="alta", status="concluida", projeto_id=projeto4.id, squad_id=squad2.id),
-        Atividade(titulo="Sujeito C2", observacao="", 
-                inicio_programado=inicio_prog, inicio_realizado=inicio_real,
-                fim_programado=fim_prog, fim_realizado=fim_real,
-                prioridade="alta", status="concluida", projeto_id=projeto4.id, squad_id=squad2.id),
-        Atividade(titulo="Público Alvo", observacao="", 
-                inicio_programado=inicio_prog, inicio_realizado=inicio_real,
-                fim_programado=fim_prog, fim_realizado=fim_real,
-                prioridade="alta", status="concluida", projeto_id=projeto4.id, squad_id=squad2.id),                        
-
-        # squad3 - Processamento
-        Atividade(titulo="Frop Pac", observacao="", 
-                inicio_programado=inicio_prog, inicio_realizado=inicio_real,
-                fim_programado=fim_prog, fim_realizado=fim_real,
-                prioridade="alta", status="concluida", projeto_id=projeto1.id, squad_id=squad3.id),
-        Atividade(titulo="Frop Dig", observacao="", 
-                inicio_programado=inicio_prog, inicio_realizado=inicio_real,
-                fim_programado=fim_prog, fim_realizado=fim_real,
-                prioridade="alta", status="concluida", projeto_id=projeto1.id, squad_id=squad3.id),
-        Atividade(titulo="Digitalização", observacao="", 
-                inicio_programado=inicio_prog, inicio_realizado=inicio_real,
-                fim_programado=fim_prog, fim_realizado=fim_real,
-                prioridade="alta", status="concluida", projeto_id=projeto1.id, squad_id=squad3.id),
-        Atividade(titulo="Decodificação", observacao="", 
-                inicio_programado=inicio_prog, inicio_realizado=inicio_real,
-                fim_programado=fim_prog, fim_realizado=fim_real,
-                prioridade="alta", status="concluida", projeto_id=projeto1.id, squad_id=squad3.id),
-        Atividade(titulo="Verificação", observacao="", 
-                inicio_programado=inicio_prog, inicio_realizado=inicio_real,
-                fim_programado=fim_prog, fim_realizado=fim_real,
-                prioridade="alta", status="concluida", projeto_id=projeto1.id, squad_id=squad3.id),
-        Atividade(titulo="Recuperação", observacao="", 
-                inicio_programado=inicio_prog, inicio_realizado=inicio_real,
-                fim_programado=fim_prog, fim_realizado=fim_real,
-                prioridade="alta", status="concluida", projeto_id=projeto1.id, squad_id=squad3.id),
-        Atividade(titulo="Recuperação Extra", observacao="", 
-                inicio_programado=inicio_prog, inicio_realizado=inicio_real,
-                fim_programado=fim_prog, fim_realizado=fim_real,
-                prioridade="alta", status="concluida", projeto_id=projeto1.id, squad_id=squad3.id),
-        Atividade(titulo="Certificação", observacao="", 
-                inicio_programado=inicio_prog, inicio_realizado=inicio_real,
-                fim_programado=fim_prog, fim_realizado=fim_real,
-                prioridade="alta", status="concluida", projeto_id=projeto1.id, squad_id=squad3.id),
-        Atividade(titulo="Correção", observacao="", 
-                inicio_programado=inicio_prog, inicio_realizado=inicio_real,
-                fim_programado=fim_prog, fim_realizado=fim_real,
-                prioridade="alta", status="concluida", projeto_id=projeto1.id, squad_id=squad3.id),
-        Atividade(titulo="Medida", observacao="", 
-                inicio_programado=inicio_prog, inicio_realizado=inicio_real,
-                fim_programado=fim_prog, fim_realizado=fim_real,
-                prioridade="alta", status="concluida", projeto_id=projeto1.id, squad_id=squad3.id),
-        Atividade(titulo="Frop Pac", observacao="", 
-                inicio_programado=inicio_prog, inicio_realizado=inicio_real,
-                fim_programado=fim_prog, fim_realizado=fim_real,
-                prioridade="alta", status="concluida", projeto_id=projeto2.id, squad_id=squad3.id),
-        Atividade(titulo="Frop Dig", observacao="", 
-                inicio_programado=inicio_prog, inicio_realizado=inicio_real,
-                fim_programado=fim_prog, fim_realizado=fim_real,
-                prioridade="alta", status="concluida", projeto_id=projeto2.id, squad_id=squad3.id),
-        Atividade(titulo="Digitalização", observacao="", 
-                inicio_programado=inicio_prog, inicio_realizado=inicio_real,
-                fim_programado=fim_prog, fim_realizado=fim_real,
-                prioridade="alta", status="concluida", projeto_id=projeto2.id, squad_id=squad3.id),
-        Atividade(titulo="Decodificação", observacao="", 
-                inicio_programado=inicio_prog, inicio_realizado=inicio_real,
-                fim_programado=fim_prog, fim_realizado=fim_real,
-                prioridade="alta", status="concluida", projeto_id=projeto2.id, squad_id=squad3.id),
-        Atividade(titulo="Verificação", observacao="", 
-                inicio_programado=inicio_prog, inicio_realizado=inicio_real,
-                fim_programado=fim_prog, fim_realizado=fim_real,
-                prioridade="alta", status="concluida", projeto_id=projeto2.id, squad_id=squad3.id),
-        Atividade(titulo="Recuperação", observacao="", 
-                inicio_programado=inicio_prog, inicio_realizado=inicio_real,
-                fim_programado=fim_prog, fim_realizado=fim_real,
-                prioridade="alta", status="concluida", projeto_id=projeto2.id, squad_id=squad3.id),
-        Atividade(titulo="Recuperação Extra", observacao="", 
-                inicio_programado=inicio_prog, inicio_realizado=inicio_real,
-                fim_programado=fim_prog, fim_realizado=fim_real,
-                prioridade="alta", status="concluida", projeto_id=projeto2.id, squad_id=squad3.id),
-        Atividade(titulo="Certificação", observacao="", 
-                inicio_programado=inicio_prog, inicio_realizado=inicio_real,
-                fim_programado=fim_prog, fim_realizado=fim_real,
-                prioridade="alta", status="concluida", projeto_id=projeto2.id, squad_id=squad3.id),
-        Atividade(titulo="Correção", observacao="", 
-                inicio_programado=inicio_prog, inicio_realizado=inicio_real,
-                fim_programado=fim_prog, fim_realizado=fim_real,
-                prioridade="alta", status="concluida", projeto_id=projeto2.id, squad_id=squad3.id),
-        Atividade(titulo="Medida", observacao="", 
-                inicio_programado=inicio_prog, inicio_realizado=inicio_real,
-                fim_programado=fim_prog, fim_realizado=fim_real,
-                prioridade="alta", status="concluida", projeto_id=projeto2.id, squad_id=squad3.id),
-        Atividade(titulo="Frop Pac", observacao="", 
-                inicio_programado=inicio_prog, inicio_realizado=inicio_real,
-                fim_programado=fim_prog, fim_realizado=fim_real,
-                prioridade="alta", status="concluida", projeto_id=projeto3.id, squad_id=squad3.id),
-        Atividade(titulo="Frop Dig", observacao="", 
-                inicio_programado=inicio_prog, inicio_realizado=inicio_real,
-                fim_programado=fim_prog, fim_realizado=fim_real,
-                prioridade="alta", status="concluida", projeto_id=projeto3.id, squad_id=squad3.id),
-        Atividade(titulo="Digitalização", observacao="", 
-                inicio_programado=inicio_prog, inicio_realizado=inicio_real,
-                fim_programado=fim_prog, fim_realizado=fim_real,
-                prioridade="alta", status="concluida", projeto_id=projeto3.id, squad_id=squad3.id),
-        Atividade(titulo="Decodificação", observacao="", 
-                inicio_programado=inicio_prog, inicio_realizado=inicio_real,
-                fim_programado=fim_prog, fim_realizado=fim_real,
-                prioridade="alta", status="concluida", projeto_id=projeto3.id, squad_id=squad3.id),
-        Atividade(titulo="Verificação", observacao="", 
-                inicio_programado=inicio_prog, inicio_realizado=inicio_real,
-                fim_programado=fim_prog, fim_realizado=fim_real,
-                prioridade="alta", status="concluida", projeto_id=projeto3.id, squad_id=squad3.id),
-        Atividade(titulo="Recuperação", observacao="", 
-                inicio_programado=inicio_prog, inicio_realizado=inicio_real,
-                fim_programado=fim_prog, fim_realizado=fim_real,
-                prioridade="alta", status="concluida", projeto_id=projeto3.id, squad_id=squad3.id),
-        Atividade(titulo="Recuperação Extra", observacao="", 
-                inicio_programado=inicio_prog, inicio_realizado=inicio_real,
-                fim_programado=fim_prog, fim_realizado=fim_real,
-                prioridade="alta", status="concluida", projeto_id=projeto3.id, squad_id=squad3.id),
-        Atividade(titulo="Certificação", observacao="", 
-                inicio_programado=inicio_prog, inicio_realizado=inicio_real,
-                fim_programado=fim_prog, fim_realizado=fim_real,
-                prioridade="alta", status="concluida", projeto_id=projeto3.id, squad_id=squad3.id),
-        Atividade(titulo="Correção", observacao="", 
-                inicio_programado=inicio_prog, inicio_realizado=inicio_real,
-                fim_programado=fim_prog, fim_realizado=fim_real,
-                prioridade="alta", status="concluida", projeto_id=projeto3.id, squad_id=squad3.id),
-        Atividade(titulo="Medida", observacao="", 
-                inicio_programado=inicio_prog, inicio_realizado=inicio_real,
-                fim_programado=fim_prog, fim_realizado=fim_real,
-                prioridade="alta", status="concluida", projeto_id=projeto3.id, squad_id=squad3.id),
-        Atividade(titulo="Frop Pac", observacao="", 
-                inicio_programado=inicio_prog, inicio_realizado=inicio_real,
-                fim_programado=fim_prog, fim_realizado=fim_real,
-                prioridade="alta", status="concluida", projeto_id=projeto4.id, squad_id=squad3.id),
-        Atividade(titulo="Frop Dig", observacao="", 
-                inicio_programado=inicio_prog, inicio_realizado=inicio_real,
-                fim_programado=fim_prog, fim_realizado=fim_real,
-                prioridade="alta", status="concluida", projeto_id=projeto4.id, squad_id=squad3.id),
-        Atividade(titulo="Digitalização", observacao="", 
-                inicio_programado=inicio_prog, inicio_realizado=inicio_real,
-                fim_programado=fim_prog, fim_realizado=fim_real,
-                prioridade="alta", status="concluida", projeto_id=projeto4.id, squad_id=squad3.id),
-        Atividade(titulo="Decodificação", observacao="", 
-                inicio_programado=inicio_prog, inicio_realizado=inicio_real,
-                fim_programado=fim_prog, fim_realizado=fim_real,
-                prioridade="alta", status="concluida", projeto_id=projeto4.id, squad_id=squad3.id),
-        Atividade(titulo="Verificação", observacao="", 
-                inicio_programado=inicio_prog, inicio_realizado=inicio_real,
-                fim_programado=fim_prog, fim_realizado=fim_real,
-                prioridade="alta", status="concluida", projeto_id=projeto4.id, squad_id=squad3.id),
-        Atividade(titulo="Recuperação", observacao="", 
-                inicio_programado=inicio_prog, inicio_realizado=inicio_real,
-                fim_programado=fim_prog, fim_realizado=fim_real,
-                prioridade="alta", status="concluida", projeto_id=projeto4.id, squad_id=squad3.id),
-        Atividade(titulo="Recuperação Extra", observacao="", 
-                inicio_programado=inicio_prog, inicio_realizado=inicio_real,
-                fim_programado=fim_prog, fim_realizado=fim_real,
-                prioridade="alta", status="concluida", projeto_id=projeto4.id, squad_id=squad3.id),
-        Atividade(titulo="Certificação", observacao="", 
-                inicio_programado=inicio_prog, inicio_realizado=inicio_real,
-                fim_programado=fim_prog, fim_realizado=fim_real,
-                prioridade="alta", status="concluida", projeto_id=projeto4.id, squad_id=squad3.id),
-        Atividade(titulo="Correção", observacao="", 
-                inicio_programado=inicio_prog, inicio_realizado=inicio_real,
-                fim_programado=fim_prog, fim_realizado=fim_real,
-                prioridade="alta", status="concluida", projeto_id=projeto4.id, squad_id=squad3.id),
-        Atividade(titulo="Medida", observacao="", 
-                inicio_programado=inicio_prog, inicio_realizado=inicio_real,
-                fim_programado=fim_prog, fim_realizado=fim_real,
-                prioridade="alta", status="concluida", projeto_id=projeto4.id, squad_id=squad3.id),                        
-
-        # squad4 - Categorização
-        Atividade(titulo="T1", observacao="", 
-                inicio_programado=inicio_prog, inicio_realizado=inicio_real,
-                fim_programado=fim_prog, fim_realizado=fim_real,
-                prioridade="alta", status="concluida", projeto_id=projeto1.id, squad_id=squad4.id),
-        Atividade(titulo="T2", observacao="", 
-                inicio_programado=inicio_prog, inicio_realizado=inicio_real,
-                fim_programado=fim_prog, fim_realizado=fim_real,
-                prioridade="alta", status="concluida", projeto_id=projeto1.id, squad_id=squad4.id),
-        Atividade(titulo="T3", observacao="", 
-                inicio_programado=inicio_prog, inicio_realizado=inicio_real,
-                fim_programado=fim_prog, fim_realizado=fim_real,
-                prioridade="alta", status="concluida", projeto_id=projeto1.id, squad_id=squad4.id),
-        Atividade(titulo="T4 Sujeito", observacao="", 
-                inicio_programado=inicio_prog, inicio_realizado=inicio_real,
-                fim_programado=fim_prog, fim_realizado=fim_real,
-                prioridade="alta", status="concluida", projeto_id=projeto1.id, squad_id=squad4.id),
-        Atividade(titulo="T4 Dedução", observacao="", 
-                inicio_programado=inicio_prog, inicio_realizado=inicio_real,
-                fim_programado=fim_prog, fim_realizado=fim_real,
-                prioridade="alta", status="concluida", projeto_id=projeto1.id, squad_id=squad4.id),
-        Atividade(titulo="T4 Recuperação", observacao="", 
-                inicio_programado=inicio_prog, inicio_realizado=inicio_real,
-                fim_programado=fim_prog, fim_realizado=fim_real,
-                prioridade="alta", status="concluida", projeto_id=projeto1.id, squad_id=squad4.id),
-        Atividade(titulo="T5 Participação", observacao="", 
-                inicio_programado=inicio_prog, inicio_realizado=inicio_real,
-                fim_programado=fim_prog, fim_realizado=fim_real,
-                prioridade="alta", status="concluida", projeto_id=projeto1.id, squad_id=squad4.id),
-        Atividade(titulo="T1", observacao="", 
-                inicio_programado=inicio_prog, inicio_realizado=inicio_real,
-                fim_programado=fim_prog, fim_realizado=fim_real,
-                prioridade="alta", status="concluida", projeto_id=projeto2.id, squad_id=squad4.id),
-        Atividade(titulo="T2", observacao="", 
-                inicio_programado=inicio_prog, inicio_realizado=inicio_real,
-                fim_programado=fim_prog, fim_realizado=fim_real,
-                prioridade="alta", status="concluida", projeto_id=projeto2.id, squad_id=squad4.id),
-        Atividade(titulo="T3", observacao="", 
-                inicio_programado=inicio_prog, inicio_realizado=inicio_real,
-                fim_programado=fim_prog, fim_realizado=fim_real,
-                prioridade="alta", status="concluida", projeto_id=projeto2.id, squad_id=squad4.id),
-        Atividade(titulo="T4 Sujeito", observacao="", 
-                inicio_programado=inicio_prog, inicio_realizado=inicio_real,
-                fim_programado=fim_prog, fim_realizado=fim_real,
-                prioridade="alta", status="concluida", projeto_id=projeto2.id, squad_id=squad4.id),
-        Atividade(titulo="T4 Dedução", observacao="", 
-                inicio_programado=inicio_prog, inicio_realizado=inicio_real,
-                fim_programado=fim_prog, fim_realizado=fim_real,
-                prioridade="alta", status="concluida", projeto_id=projeto2.id, squad_id=squad4.id),
-        Atividade(titulo="T4 Recuperação", observacao="", 
-                inicio_programado=inicio_prog, inicio_realizado=inicio_real,
-                fim_programado=fim_prog, fim_realizado=fim_real,
-                prioridade="alta", status="concluida", projeto_id=projeto2.id, squad_id=squad4.id),
-        Atividade(titulo="T5 Participação", observacao="", 
-                inicio_programado=inicio_prog, inicio_realizado=inicio_real,
-                fim_programado=fim_prog, fim_realizado=fim_real,
-                prioridade="alta", status="concluida", projeto_id=projeto2.id, squad_id=squad4.id),
-        Atividade(titulo="T1", observacao="", 
-                inicio_programado=inicio_prog, inicio_realizado=inicio_real,
-                fim_programado=fim_prog, fim_realizado=fim_real,
-                prioridade="alta", status="concluida", projeto_id=projeto3.id, squad_id=squad4.id),
-        Atividade(titulo="T2", observacao="", 
-                inicio_programado=inicio_prog, inicio_realizado=inicio_real,
-                fim_programado=fim_prog, fim_realizado=fim_real,
-                prioridade="alta", status="concluida", projeto_id=projeto3.id, squad_id=squad4.id),
-        Atividade(titulo="T3", observacao="", 
-                inicio_programado=inicio_prog, inicio_realizado=inicio_real,
-                fim_programado=fim_prog, fim_realizado=fim_real,
-                prioridade="alta", status="concluida", projeto_id=projeto3.id, squad_id=squad4.id),
-        Atividade(titulo="T4 Sujeito", observacao="", 
-                inicio_programado=inicio_prog, inicio_realizado=inicio_real,
-                fim_programado=fim_prog, fim_realizado=fim_real,
-                prioridade="alta", status="concluida", projeto_id=projeto3.id, squad_id=squad4.id),
-        Atividade(titulo="T4 Dedução", observacao="", 
-                inicio_programado=inicio_prog, inicio_realizado=inicio_real,
-                fim_programado=fim_prog, fim_realizado=fim_real,
-                prioridade="alta", status="concluida", projeto_id=projeto3.id, squad_id=squad4.id),
-        Atividade(titulo="T4 Recuperação", observacao="", 
-                inicio_programado=inicio_prog, inicio_realizado=inicio_real,
-                fim_programado=fim_prog, fim_realizado=fim_real,
-                prioridade="alta", status="concluida", projeto_id=projeto3.id, squad_id=squad4.id),
-        Atividade(titulo="T5 Participação", observacao="", 
-                inicio_programado=inicio_prog, inicio_realizado=inicio_real,
-                fim_programado=fim_prog, fim_realizado=fim_real,
-                prioridade="alta", status="concluida", projeto_id=projeto3.id, squad_id=squad4.id),
-        Atividade(titulo="T1", observacao="", 
-                inicio_programado=inicio_prog, inicio_realizado=inicio_real,
-                fim_programado=fim_prog, fim_realizado=fim_real,
-                prioridade="alta", status="concluida", projeto_id=projeto4.id, squad_id=squad4.id),
-        Atividade(titulo="T2", observacao="", 
-                inicio_programado=inicio_prog, inicio_realizado=inicio_real,
-                fim_programado=fim_prog, fim_realizado=fim_real,
-                prioridade="alta", status="concluida", projeto_id=projeto4.id, squad_id=squad4.id),
-        Atividade(titulo="T3", observacao="", 
-                inicio_programado=inicio_prog, inicio_realizado=inicio_real,
-                fim_programado=fim_prog, fim_realizado=fim_real,
-                prioridade="alta", status="concluida", projeto_id=projeto4.id, squad_id=squad4.id),
-        Atividade(titulo="T4 Sujeito", observacao="", 
-                inicio_programado=inicio_prog, inicio_realizado=inicio_real,
-                fim_programado=fim_prog, fim_realizado=fim_real,
-                prioridade="alta", status="concluida", projeto_id=projeto4.id, squad_id=squad4.id),
-        Atividade(titulo="T4 Dedução", observacao="", 
-                inicio_programado=inicio_prog, inicio_realizado=inicio_real,
-                fim_programado=fim_prog, fim_realizado=fim_real,
-                prioridade="alta", status="concluida", projeto_id=projeto4.id, squad_id=squad4.id),
-        Atividade(titulo="T4 Recuperação", observacao="", 
-                inicio_programado=inicio_prog, inicio_realizado=inicio_real,
-                fim_programado=fim_prog, fim_realizado=fim_real,
-                prioridade="alta", status="concluida", projeto_id=projeto4.id, squad_id=squad4.id),
-        Atividade(titulo="T5 Participação", observacao="", 
-                inicio_programado=inicio_prog, inicio_realizado=inicio_real,
-                fim_programado=fim_prog, fim_realizado=fim_real,
-                prioridade="alta", status="concluida", projeto_id=projeto4.id, squad_id=squad4.id),                        
-
-        # squad5 - Medidas
-        Atividade(titulo="ADC", observacao="", 
-                inicio_programado=inicio_prog, inicio_realizado=inicio_real,
-                fim_programado=fim_prog, fim_realizado=fim_real,
-                prioridade="alta", status="concluida", projeto_id=projeto1.id, squad_id=squad5.id),
-        Atividade(titulo="NAP", observacao="", 
-                inicio_programado=inicio_prog, inicio_realizado=inicio_real,
-                fim_programado=fim_prog, fim_realizado=fim_real,
-                prioridade="alta", status="concluida", projeto_id=projeto1.id, squad_id=squad5.id),
-        Atividade(titulo="MCA", observacao="", 
-                inicio_programado=inicio_prog, inicio_realizado=inicio_real,
-                fim_programado=fim_prog, fim_realizado=fim_real,
-                prioridade="alta", status="concluida", projeto_id=projeto1.id, squad_id=squad5.id),
-        Atividade(titulo="ADC", observacao="", 
-                inicio_programado=inicio_prog, inicio_realizado=inicio_real,
-                fim_programado=fim_prog, fim_realizado=fim_real,
-                prioridade="alta", status="concluida", projeto_id=projeto2.id, squad_id=squad5.id),
-        Atividade(titulo="NAP", observacao="", 
-                inicio_programado=inicio_prog, inicio_realizado=inicio_real,
-                fim_programado=fim_prog, fim_realizado=fim_real,
-                prioridade="alta", status="concluida", projeto_id=projeto2.id, squad_id=squad5.id),
-        Atividade(titulo="MCA", observacao="", 
-                inicio_programado=inicio_prog, inicio_realizado=inicio_real,
-                fim_programado=fim_prog, fim_realizado=fim_real,
-                prioridade="alta", status="concluida", projeto_id=projeto2.id, squad_id=squad5.id),
-        Atividade(titulo="ADC", observacao="", 
-                inicio_programado=inicio_prog, inicio_realizado=inicio_real,
-                fim_programado=fim_prog, fim_realizado=fim_real,
-                prioridade="alta", status="concluida", projeto_id=projeto3.id, squad_id=squad5.id),
-        Atividade(titulo="NAP", observacao="", 
-                inicio_programado=inicio_prog, inicio_realizado=inicio_real,
-                fim_programado=fim_prog, fim_realizado=fim_real,
-                prioridade="alta", status="concluida", projeto_id=projeto3.id, squad_id=squad5.id),
-        Atividade(titulo="MCA", observacao="", 
-                inicio_programado=inicio_prog, inicio_realizado=inicio_real,
-                fim_programado=fim_prog, fim_realizado=fim_real,
-                prioridade="alta", status="concluida", projeto_id=projeto3.id, squad_id=squad5.id),
-        Atividade(titulo="ADC", observacao="", 
-                inicio_programado=inicio_prog, inicio_realizado=inicio_real,
-                fim_programado=fim_prog, fim_realizado=fim_real,
-                prioridade="alta", status="concluida", projeto_id=projeto4.id, squad_id=squad5.id),
-        Atividade(titulo="NAP", observacao="", 
-                inicio_programado=inicio_prog, inicio_realizado=inicio_real,
-                fim_programado=fim_prog, fim_realizado=fim_real,
-                prioridade="alta", status="concluida", projeto_id=projeto4.id, squad_id=squad5.id),
-        Atividade(titulo="MCA", observacao="", 
-                inicio_programado=inicio_prog, inicio_realizado=inicio_real,
-                fim_programado=fim_prog, fim_realizado=fim_real,
-                prioridade="alta", status="concluida", projeto_id=projeto4.id, squad_id=squad5.id),                        
-
-        # squad6 - Cálculo
-        Atividade(titulo="Previsto", observacao="", 
-                inicio_programado=inicio_prog, inicio_realizado=inicio_real,
-                fim_programado=fim_prog, fim_realizado=fim_real,
-                prioridade="alta", status="concluida", projeto_id=projeto1.id, squad_id=squad6.id),
-        Atividade(titulo="Participação", observacao="", 
-                inicio_programado=inicio_prog, inicio_realizado=inicio_real,
-                fim_programado=fim_prog, fim_realizado=fim_real,
-                prioridade="alta", status="concluida", projeto_id=projeto1.id, squad_id=squad6.id),
-        Atividade(titulo="Valor", observacao="", 
-                inicio_programado=inicio_prog, inicio_realizado=inicio_real,
-                fim_programado=fim_prog, fim_realizado=fim_real,
-                prioridade="alta", status="concluida", projeto_id=projeto1.id, squad_id=squad6.id),
-        Atividade(titulo="Previsto", observacao="", 
-                inicio_programado=inicio_prog, inicio_realizado=inicio_real,
-                fim_programado=fim_prog, fim_realizado=fim_real,
-                prioridade="alta", status="concluida", projeto_id=projeto2.id, squad_id=squad6.id),
-        Atividade(titulo="Participação", observacao="", 
-                inicio_programado=inicio_prog, inicio_realizado=inicio_real,
-                fim_programado=fim_prog, fim_realizado=fim_real,
-                prioridade="alta", status="concluida", projeto_id=projeto2.id, squad_id=squad6.id),
-        Atividade(titulo="Valor", observacao="", 
-                inicio_programado=inicio_prog, inicio_realizado=inicio_real,
-                fim_programado=fim_prog, fim_realizado=fim_real,
-                prioridade="alta", status="concluida", projeto_id=projeto2.id, squad_id=squad6.id),
-        Atividade(titulo="Previsto", observacao="", 
-                inicio_programado=inicio_prog, inicio_realizado=inicio_real,
-                fim_programado=fim_prog, fim_realizado=fim_real,
-                prioridade="alta", status="concluida", projeto_id=projeto3.id, squad_id=squad6.id),
-        Atividade(titulo="Participação", observacao="", 
-                inicio_programado=inicio_prog, inicio_realizado=inicio_real,
-                fim_programado=fim_prog, fim_realizado=fim_real,
-                prioridade="alta", status="concluida", projeto_id=projeto3.id, squad_id=squad6.id),
-        Atividade(titulo="Valor", observacao="", 
-                inicio_programado=inicio_prog, inicio_realizado=inicio_real,
-                fim_programado=fim_prog, fim_realizado=fim_real,
-                prioridade="alta", status="concluida", projeto_id=projeto3.id, squad_id=squad6.id),
-        Atividade(titulo="Previsto", observacao="", 
-                inicio_programado=inicio_prog, inicio_realizado=inicio_real,
-                fim_programado=fim_prog, fim_realizado=fim_real,
-                prioridade="alta", status="concluida", projeto_id=projeto4.id, squad_id=squad6.id),
-        Atividade(titulo="Participação", observacao="", 
-                inicio_programado=inicio_prog, inicio_realizado=inicio_real,
-                fim_programado=fim_prog, fim_realizado=fim_real,
-                prioridade="alta", status="concluida", projeto_id=projeto4.id, squad_id=squad6.id),
-        Atividade(titulo="Valor", observacao="", 
-                inicio_programado=inicio_prog, inicio_realizado=inicio_real,
-                fim_programado=fim_prog, fim_realizado=fim_real,
-                prioridade="alta", status="concluida", projeto_id=projeto4.id, squad_id=squad6.id),      
-
-        # squad7 - Validação (sem atividades por enquanto)
-
-        # squad8 - Recursos
-        Atividade(titulo="Monitoramento", observacao="", 
-                inicio_programado=inicio_prog, inicio_realizado=inicio_real,
-                fim_programado=fim_prog, fim_realizado=fim_real,
-                prioridade="alta", status="concluida", projeto_id=projeto1.id, squad_id=squad8.id),
-        Atividade(titulo="Monitoramento", observacao="", 
-                inicio_programado=inicio_prog, inicio_realizado=inicio_real,
-                fim_programado=fim_prog, fim_realizado=fim_real,
-                prioridade="alta", status="concluida", projeto_id=projeto2.id, squad_id=squad8.id),
-        Atividade(titulo="Monitoramento", observacao="", 
-                inicio_programado=inicio_prog, inicio_realizado=inicio_real,
-                fim_programado=fim_prog, fim_realizado=fim_real,
-                prioridade="alta", status="concluida", projeto_id=projeto3.id, squad_id=squad8.id),
-        Atividade(titulo="Monitoramento", observacao="", 
-                inicio_programado=inicio_prog, inicio_realizado=inicio_real,
-                fim_programado=fim_prog, fim_realizado=fim_real,
-                prioridade="alta", status="concluida", projeto_id=projeto4.id, squad_id=squad8.id)                        
-    ]
-    db.session.add_all(atividades)
-    db.session.commit()
-    
-    print("\n✅ Banco de dados populado com sucesso!")
-    print(f"\n📊 Resumo:")
-    print(f"   - {Squad.query.count()} squads criadas")
-    print(f"   - {Projeto.query.count()} projetos criados")
-    print(f"   - {Atividade.query.count()} atividades criadas")
-    print("\n🚀 Você pode iniciar a aplicação com: python run.py")
\ No newline at end of file
+        if args.limpar:
+            print("Limpando dados existentes...")
+            limpar()
+
+        print(f"Carregando {args.dir}...")
+        inicio = time.perf_counter()
+        resumo = popular(args.dir, args.lote)
+        total = time.perf_counter() - inicio
+
+        print("\n✅ Banco de dados populado com sucesso!")
+        print(f"\n📊 Resumo:")
+        for tabela, dados in resumo.items():
+            gravadas = dados['inseridas'] + dados['atualizadas']
+            taxa = dados['lidas'] / dados['segundos'] if dados['segundos'] else 0
+            print(f"   - {tabela}: {dados['lidas']} lidas, {dados['inseridas']} inseridas, "
+                  f"{dados['atualizadas']} atualizadas, {dados['lidas'] - gravadas} sem alteração "
+                  f"({taxa:,.0f} linhas/s)")
+        lidas = sum(d['lidas'] for d in resumo.values())
+        print(f"   Total: {lidas} linhas em {total:.2f} s ({lidas / total if total else 0:,.0f} linhas/s)")
+        print("\n🚀 Você pode iniciar a aplicação com: python run.py")
+
+
+if __name__ == '__main__':
+    main()
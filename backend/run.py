@@ -1,3 +1,8 @@
+import os
+
+# Servidor de desenvolvimento: aplica as migrations pendentes ao iniciar
+os.environ.setdefault('SCHEMA_UPGRADE', 'true')
+
 from app import create_app, db
 from app.models import Projeto, Squad, Atividade, Usuario
 
@@ -16,22 +21,6 @@ def make_shell_context():
     }
 
 
-@app.route('/')
-def index():
-    """Rota inicial para verificar se a API está funcionando"""
-    return {
-        'message': 'API de Acompanhamento de Atividades',
-        'version': '1.0',
-        'endpoints': {
-            'projetos': '/api/projetos',
-            'squads': '/api/squads',
-            'atividades': '/api/atividades',
-            'auth': '/api/auth/login',
-            'usuarios': '/api/usuarios'
-        }
-    }
-
-
 if __name__ == '__main__':
     # host='0.0.0.0' permite acesso de outros computadores na rede
     app.run(debug=True, host='0.0.0.0', port=5000)
\ No newline at end of file
@@ -0,0 +1,78 @@
+import os
+import tempfile
+from pathlib import Path
+
+import pytest
+
+# O banco e as opções vêm do ambiente, lido quando config.py é importado
+_PASTA = tempfile.mkdtemp(prefix='monitorop-testes-')
+os.environ['DATABASE_URL'] = f"sqlite:///{Path(_PASTA) / 'testes.db'}"
+os.environ['SCHEMA_CHECK'] = 'false'
+os.environ['CACHE_BACKEND'] = 'none'
+os.environ['EVENTS_BACKEND'] = 'none'
+
+MIGRATIONS_DIR = str(Path(__file__).parent.parent / 'migrations')
+
+
+@pytest.fixture(scope='session')
+def app():
+    """Aplicação com o schema criado pelas migrations (flask db upgrade)"""
+    from flask_migrate import upgrade
+    from app import create_app
+
+    app = create_app('production')
+    with app.app_context():
+        upgrade(directory=MIGRATIONS_DIR)
+    return app
+
+
+@pytest.fixture
+def client(app):
+    return app.test_client()
+
+
+@pytest.fixture
+def popular(app):
+    """
+    Função que recria a base com n atividades
+
+    Linhas pares ficam no projeto 1, cada uma com uma squad diferente;
+    linhas ímpares ficam na squad 1, cada uma com um projeto diferente.
+    Assim toda listagem de atividades traz projetos ou squads distintos, e
+    um carregamento lazy por linha apareceria como statements a mais. Status
+    e prioridades se alternam.
+    """
+    from app import db
+    from app.models import Projeto, Squad, Atividade, projeto_squad
+
+    def limpar():
+        for tabela in (Atividade.__table__, projeto_squad, Projeto.__table__, Squad.__table__):
+            db.session.execute(tabela.delete())
+        db.session.commit()
+
+    def popular(n):
+        limpar()
+        distintos = range(1, n // 2 + 2)
+        db.session.execute(db.insert(Squad), [{'id': i, 'nome': f'Squad {i}'} for i in distintos])
+        db.session.execute(db.insert(Projeto), [{'id': i, 'nome': f'Projeto {i}'} for i in distintos])
+
+        status = ('pendente', 'em_andamento', 'concluida')
+        prioridades = ('baixa', 'media', 'alta')
+        atividades = []
+        for i in range(n):
+            outro = i // 2 + 1
+            projeto_id, squad_id = (1, outro) if i % 2 == 0 else (outro, 1)
+            atividades.append({
+                'titulo': f'Atividade {i}', 'projeto_id': projeto_id, 'squad_id': squad_id,
+                'status': status[i % 3], 'prioridade': prioridades[i // 3 % 3]
+            })
+        db.session.execute(db.insert(Atividade), atividades)
+        db.session.execute(db.insert(projeto_squad), [
+            {'projeto_id': projeto_id, 'squad_id': squad_id}
+            for projeto_id, squad_id in {(a['projeto_id'], a['squad_id']) for a in atividades}
+        ])
+        db.session.commit()
+
+    with app.app_context():
+        yield popular
+        limpar()
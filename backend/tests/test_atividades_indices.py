@@ -0,0 +1,40 @@
+"""Filtros e ordenação da listagem de atividades resolvidos por índice (EXPLAIN QUERY PLAN)"""
+import pytest
+from sqlalchemy import text
+
+from app import db
+from app.models import Atividade
+from app.routes.atividades import _filtrar
+from app.utils.queries import atividades_query
+
+# Filtros da listagem -> índice esperado
+COMBINACOES = [
+    ({}, 'ix_atividades_created_at'),
+    ({'projeto_id': '1'}, 'ix_atividades_projeto_id_created_at'),
+    ({'squad_id': '1'}, 'ix_atividades_squad_id_created_at'),
+    ({'status': 'pendente', 'prioridade': 'alta'}, 'ix_atividades_status_prioridade_created_at'),
+    ({'projeto_id': '1', 'status': 'pendente'}, 'ix_atividades_projeto_id_created_at'),
+    ({'squad_id': '1', 'prioridade': 'alta'}, 'ix_atividades_squad_id_created_at'),
+]
+
+
+def _plano(app, filtros, pagina):
+    """Plano da consulta que listar_atividades monta para esses filtros"""
+    with app.test_request_context('/api/atividades', query_string=filtros):
+        query = _filtrar(atividades_query()).order_by(Atividade.created_at.desc())
+        if pagina:
+            query = query.limit(10).offset(20)
+        sql = query.statement.compile(dialect=db.engine.dialect, compile_kwargs={'literal_binds': True})
+        return [linha[-1] for linha in db.session.execute(text(f'EXPLAIN QUERY PLAN {sql}'))]
+
+
+@pytest.mark.parametrize('pagina', [False, True], ids=['completa', 'paginada'])
+@pytest.mark.parametrize('filtros,indice', COMBINACOES, ids=lambda v: (','.join(v) or 'sem_filtro') if isinstance(v, dict) else None)
+def test_listagem_usa_indice_sem_ordenacao_temporaria(app, popular, filtros, indice, pagina):
+    popular(200)
+    plano = _plano(app, filtros, pagina)
+
+    atividades = [linha for linha in plano if 'atividades' in linha]
+    assert atividades and all('USING INDEX' in linha for linha in atividades), plano
+    assert any(indice in linha for linha in atividades), plano
+    assert not any('TEMP B-TREE' in linha for linha in plano), plano
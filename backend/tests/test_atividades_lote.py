@@ -0,0 +1,51 @@
+"""Lote de atividades: validação dos ids e um único INSERT para a lista criar"""
+from sqlalchemy import event
+
+from app import db
+from app.models import Atividade
+
+
+def test_booleanos_nao_sao_ids(client, popular):
+    popular(2)
+    resposta = client.post('/api/atividades/bulk', json={
+        'criar': [
+            {'titulo': 'A', 'projeto_id': True, 'squad_id': 1},
+            {'titulo': 'B', 'projeto_id': 1, 'squad_id': True},
+        ],
+        'atualizar': [{'id': True, 'titulo': 'C'}],
+        'deletar': [True],
+    })
+    assert resposta.status_code == 200, resposta.get_data()
+    dados = resposta.get_json()
+    assert (dados['criadas'], dados['atualizadas'], dados['deletadas']) == (0, 0, 0)
+    assert [(e['operacao'], e['error']) for e in dados['erros']] == [
+        ('criar', 'Projeto não encontrado'),
+        ('criar', 'Squad não encontrada'),
+        ('atualizar', 'Atividade não encontrada'),
+        ('deletar', 'Atividade não encontrada'),
+    ]
+    assert Atividade.query.count() == 2
+
+
+def test_criar_usa_um_insert_com_datas_mistas(client, popular):
+    popular(2)
+    criar = [
+        {'titulo': f'Nova {i}', 'projeto_id': 1, 'squad_id': 1,
+         'inicio_programado': '2026-01-01' if i % 2 else None,
+         'fim_realizado': '2026-02-01' if i % 3 else None}
+        for i in range(100)
+    ]
+    inserts = []
+
+    def contar(conn, cursor, statement, *args):
+        if statement.lstrip().upper().startswith('INSERT INTO ATIVIDADES'):
+            inserts.append(statement)
+
+    event.listen(db.engine, 'after_cursor_execute', contar)
+    try:
+        resposta = client.post('/api/atividades/bulk', json={'criar': criar})
+    finally:
+        event.remove(db.engine, 'after_cursor_execute', contar)
+    assert resposta.status_code == 200, resposta.get_data()
+    assert resposta.get_json()['criadas'] == 100
+    assert len(inserts) == 1
@@ -0,0 +1,43 @@
+"""Listagens de atividades: número de statements constante (sem N+1 em projeto/squad)"""
+import pytest
+from sqlalchemy import event
+
+from app import db
+
+LISTAGENS = [
+    '/api/atividades',
+    '/api/atividades?projeto_id=1&status=pendente',
+    '/api/atividades?page=1&per_page=100',
+    '/api/atividades?cursor=&per_page=100',
+    '/api/projetos/1/atividades',
+    '/api/squads/1/atividades',
+    '/api/sync?since=0&limit=5000',
+]
+
+
+def _statements(client, url):
+    """Statements executados até o fim do corpo (inclusive respostas em streaming)"""
+    executados = []
+
+    def contar(conn, cursor, statement, *args):
+        executados.append(statement)
+
+    event.listen(db.engine, 'after_cursor_execute', contar)
+    try:
+        resposta = client.get(url)
+        corpo = resposta.get_data()
+    finally:
+        event.remove(db.engine, 'after_cursor_execute', contar)
+    assert resposta.status_code == 200, corpo
+    return len(executados), len(corpo)
+
+
+@pytest.mark.parametrize('url', LISTAGENS)
+def test_statements_nao_dependem_do_numero_de_linhas(client, popular, url):
+    popular(10)
+    poucas, tamanho_poucas = _statements(client, url)
+    popular(200)
+    muitas, tamanho_muitas = _statements(client, url)
+
+    assert tamanho_muitas > tamanho_poucas
+    assert muitas == poucas
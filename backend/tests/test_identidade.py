@@ -0,0 +1,82 @@
+"""Cache de identidades: invalidações e revogações valem em todos os processos"""
+import time
+import uuid
+
+import pytest
+
+from app import db
+from app.models import Usuario, TokenRevogado
+from app.utils.events import EventBackend, EventBroker
+from app.utils.identity import IdentityCache
+
+
+class _Canal(EventBackend):
+    """Faz o papel do Redis entre os brokers de um teste"""
+    name = 'teste'
+
+    def __init__(self):
+        self.entregas = []
+
+    def current_version(self):
+        return 0
+
+    def next_version(self):
+        return 0
+
+    def publish(self, mensagem):
+        for entregar in list(self.entregas):
+            entregar(mensagem)
+
+    def start(self, entregar):
+        self.entregas.append(entregar)
+
+
+def _processo(canal):
+    """IdentityCache de um worker, ligado aos demais pelo canal"""
+    broker = EventBroker()
+    broker.backend = canal
+    cache = IdentityCache()
+    cache.events = broker
+    return cache
+
+
+@pytest.fixture
+def usuario(app):
+    with app.app_context():
+        usuario = Usuario(nome='Teste', login=f'teste-{uuid.uuid4().hex[:8]}', senha_hash='x', ativo=True)
+        db.session.add(usuario)
+        db.session.commit()
+        yield usuario
+        db.session.query(TokenRevogado).delete()
+        db.session.delete(db.session.get(Usuario, usuario.id))
+        db.session.commit()
+
+
+def _payload(usuario, jti):
+    return {'sub': str(usuario.id), 'jti': jti, 'iat': time.time() + 5}
+
+
+def test_desativacao_vale_nos_outros_processos(usuario):
+    canal = _Canal()
+    a, b = _processo(canal), _processo(canal)
+    b._preparar()
+    assert b._token_revogado({}, _payload(usuario, 'um')) is False
+
+    usuario.ativo = False
+    db.session.commit()
+    a.invalidate(usuario.id)
+    # b não espera o TTL: o aviso chegou pelo canal
+    assert b._token_revogado({}, _payload(usuario, 'um')) is True
+
+
+def test_logout_vale_nos_outros_processos_e_apos_reinicio(usuario):
+    canal = _Canal()
+    a, b = _processo(canal), _processo(canal)
+    b._preparar()
+    a.revoke({'jti': 'revogado', 'exp': None})
+
+    assert b._token_revogado({}, _payload(usuario, 'revogado')) is True
+    assert b._token_revogado({}, _payload(usuario, 'outro')) is False
+    # Processo novo, sem as mensagens anteriores: lê tokens_revogados
+    reiniciado = _processo(_Canal())
+    assert reiniciado._token_revogado({}, _payload(usuario, 'revogado')) is True
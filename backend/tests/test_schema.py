@@ -0,0 +1,51 @@
+"""Inicialização com o banco fora da última migration"""
+import os
+import sqlite3
+import subprocess
+import sys
+from pathlib import Path
+
+BACKEND = Path(__file__).parent.parent
+
+
+def _iniciar(banco, **ambiente):
+    """Cria a aplicação em outro processo (config.py lê o ambiente ao ser importado)"""
+    env = {**os.environ, 'DATABASE_URL': f'sqlite:///{banco}', 'SCHEMA_CHECK': 'true'}
+    env.pop('SCHEMA_UPGRADE', None)
+    env.update(ambiente)
+    return subprocess.run(
+        [sys.executable, '-c', "from app import create_app; create_app('production')"],
+        cwd=BACKEND, env=env, capture_output=True, text=True
+    )
+
+
+def _banco_antigo(banco):
+    """Banco anterior às migrations: tabelas da revisão inicial, sem alembic_version"""
+    env = {**os.environ, 'DATABASE_URL': f'sqlite:///{banco}', 'SCHEMA_CHECK': 'false'}
+    subprocess.run([sys.executable, '-m', 'flask', '--app', 'wsgi', 'db', 'upgrade', '7d7b53ed9636'],
+                   cwd=BACKEND, env=env, check=True, capture_output=True)
+    with sqlite3.connect(banco) as conexao:
+        conexao.execute('DROP TABLE alembic_version')
+
+
+def _colunas(banco, tabela):
+    with sqlite3.connect(banco) as conexao:
+        return {linha[1] for linha in conexao.execute(f'PRAGMA table_info({tabela})')}
+
+
+def test_banco_desatualizado_impede_a_inicializacao(tmp_path):
+    banco = tmp_path / 'antigo.db'
+    _banco_antigo(banco)
+    resultado = _iniciar(banco)
+    assert resultado.returncode != 0
+    assert 'SchemaOutdatedError' in resultado.stderr
+    assert 'flask db upgrade' in resultado.stderr
+
+
+def test_schema_upgrade_aplica_as_migrations(tmp_path):
+    banco = tmp_path / 'antigo.db'
+    _banco_antigo(banco)
+    resultado = _iniciar(banco, SCHEMA_UPGRADE='true')
+    assert resultado.returncode == 0, resultado.stderr
+    assert 'updated_at' in _colunas(banco, 'atividades')
+    assert _iniciar(banco).returncode == 0
@@ -0,0 +1,70 @@
+"""
+Ponto de entrada de produção
+
+Windows / qualquer SO:
+    python wsgi.py
+
+Com o gevent instalado (pip install gevent, também no Windows), serve pelo
+gevent.pywsgi: cada conexão é uma greenlet, e centenas de streams ociosos em
+/api/eventos não prendem threads. Sem ele, ou com WSGI_SERVER=waitress, usa o
+waitress (multi-thread), que atende só WSGI_THREADS / 4 streams.
+
+Linux (gunicorn, multi-processo + threads, ver gunicorn.conf.py):
+    flask db upgrade
+    gunicorn -c gunicorn.conf.py wsgi:app
+
+python wsgi.py aplica as migrations pendentes ao iniciar; com o gunicorn, um
+banco desatualizado impede a inicialização (SchemaOutdatedError).
+
+Configuração via ambiente: FLASK_CONFIG (padrão 'production'), HOST, PORT,
+WSGI_SERVER ('gevent' ou 'waitress'), WSGI_THREADS, WSGI_WORKER_CONNECTIONS
+e WSGI_WORKERS.
+"""
+import os
+
+SERVIDOR = None
+
+if __name__ == '__main__':
+    # python wsgi.py (start-sistema-*.bat): aplica as migrations pendentes ao
+    # iniciar. O gunicorn tem vários workers e não migra: flask db upgrade antes
+    os.environ.setdefault('SCHEMA_UPGRADE', 'true')
+
+    SERVIDOR = os.environ.get('WSGI_SERVER', 'gevent')
+    if SERVIDOR == 'gevent':
+        try:
+            from gevent import monkey
+        except ImportError:
+            SERVIDOR = 'waitress'
+        else:
+            # Antes de qualquer outro import: socket, threading e queue
+            # passam a ceder a vez entre greenlets
+            monkey.patch_all()
+            os.environ.setdefault('WSGI_WORKER_CLASS', 'gevent')
+
+from app import create_app
+
+app = create_app(os.environ.get('FLASK_CONFIG', 'production'))
+
+
+if __name__ == '__main__':
+    host = os.environ.get('HOST', '0.0.0.0')
+    port = int(os.environ.get('PORT', 5000))
+
+    if SERVIDOR == 'gevent':
+        from gevent.pywsgi import WSGIServer
+
+        conexoes = int(os.environ.get('WSGI_WORKER_CONNECTIONS', 1000))
+        print(f'Servindo em http://{host}:{port} (gevent, até {conexoes} conexões)')
+        print(f"/api/eventos: até {app.config['EVENTS_MAX_CLIENTS']} streams")
+        # log=None: sem uma linha por requisição (o waitress também não registra)
+        WSGIServer((host, port), app, spawn=conexoes, log=None).serve_forever()
+    else:
+        from waitress import serve
+
+        threads = app.config['WSGI_THREADS']
+        print(f'Servindo em http://{host}:{port} (waitress, {threads} threads)')
+        print(f"/api/eventos: até {app.config['EVENTS_MAX_CLIENTS']} streams; os demais clientes "
+              'consultam /api/sync a cada 30 s (pip install gevent para atender centenas)')
+        # channel_request_lookahead: continua lendo o socket durante a resposta,
+        # para notar na hora o cliente que fechou um stream de /api/eventos
+        serve(app, host=host, port=port, threads=threads, channel_request_lookahead=1)
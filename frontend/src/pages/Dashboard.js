@@ -1,4 +1,4 @@
-import React, { useState, useEffect } from 'react';
+import React, { useState, useEffect, useRef } from 'react';
 import { useAuth } from '../contexts/AuthContext';
 import { FontAwesomeIcon } from '@fortawesome/react-fontawesome';
 import { 
@@ -9,7 +9,7 @@ import {
   faSpinner,
   faChartBar
 } from '@fortawesome/free-solid-svg-icons';
-import { atividadeService, projetoService, squadService } from '../services/api';
+import { atividadeService, projetoService, squadService, eventoService, sincronizacaoService } from '../services/api';
 import '../styles/Dashboard.css';
 
 function Dashboard() {
@@ -47,6 +47,72 @@ function Dashboard() {
     carregarDados();
   }, []);
 
+  // Cursor de /api/sync correspondente aos dados carregados
+  const cursor = useRef(null);
+
+  // Alterações feitas por outros usuários: busca só os registros alterados
+  // desde o cursor, agrupando rajadas de eventos (lotes, importações) em uma
+  // única requisição. Cursor recusado (410): recarrega tudo
+  useEffect(() => {
+    const mesclar = (lista, alterados, removidos) => {
+      if (!alterados.length && !removidos.length) return lista;
+      const fora = new Set([...removidos, ...alterados.map(item => item.id)]);
+      return [...lista.filter(item => !fora.has(item.id)), ...alterados];
+    };
+
+    let espera = null;
+    let sincronizando = false;
+    let repetir = false;
+
+    const sincronizar = async () => {
+      if (sincronizando) {
+        repetir = true;
+        return;
+      }
+      sincronizando = true;
+      try {
+        let dados;
+        do {
+          if (cursor.current === null) return;
+          dados = (await sincronizacaoService.alteracoes(cursor.current)).data;
+          const { alterados, removidos } = dados;
+          setProjetos(lista => mesclar(lista, alterados.projetos, removidos.projetos));
+          setSquads(lista => mesclar(lista, alterados.squads, removidos.squads));
+          setAtividades(lista => mesclar(lista, alterados.atividades, removidos.atividades));
+          cursor.current = dados.cursor;
+        } while (dados.has_more);
+      } catch (error) {
+        if (error.response && error.response.status === 410) {
+          carregarDados();
+        } else {
+          console.error('Erro ao atualizar dados:', error);
+        }
+      } finally {
+        sincronizando = false;
+        if (repetir) {
+          repetir = false;
+          agendar();
+        }
+      }
+    };
+
+    const agendar = () => {
+      if (espera) return;
+      espera = setTimeout(() => {
+        espera = null;
+        sincronizar();
+      }, 500);
+    };
+
+    // Eventos perdidos também saem do sync, desde o cursor. Sem o stream
+    // (limite de conexões do servidor), o sync é consultado a cada 30 s
+    const fechar = eventoService.assinar(agendar, agendar, agendar);
+    return () => {
+      fechar();
+      clearTimeout(espera);
+    };
+  }, []);
+
   useEffect(() => {
     if (projetos.length > 0 && squads.length > 0 && atividades.length > 0) {
       atualizarOpcoesFiltros();
@@ -57,7 +123,10 @@ function Dashboard() {
   const carregarDados = async () => {
     try {
       setLoading(true);
-      
+
+      // O cursor vem antes das listas: o que mudar entre as duas leituras
+      // chega na próxima sincronização (mesclar é idempotente)
+      const cursorRes = await sincronizacaoService.cursor();
       const [projetosRes, squadsRes, atividadesRes] = await Promise.all([
         projetoService.listar(),
         squadService.listar(),
@@ -67,6 +136,7 @@ function Dashboard() {
       setProjetos(projetosRes.data.items || projetosRes.data);
       setSquads(squadsRes.data.items || squadsRes.data);
       setAtividades(atividadesRes.data.items || atividadesRes.data);
+      cursor.current = cursorRes.data.cursor;
       
     } catch (error) {
       console.error('Erro ao carregar dados:', error);
@@ -61,7 +61,91 @@ export const atividadeService = {
   criar: (data) => api.post('/atividades', data),
   atualizar: (id, data) => api.put(`/atividades/${id}`, data),
   deletar: (id) => api.delete(`/atividades/${id}`),
-  estatisticas: () => api.get('/atividades/estatisticas'),
+  estatisticas: (filtros = {}) => {
+    const params = new URLSearchParams();
+    
+    if (filtros.projeto_id) params.append('projeto_id', filtros.projeto_id);
+    if (filtros.squad_id) params.append('squad_id', filtros.squad_id);
+    
+    return api.get(`/atividades/estatisticas${params.toString() ? '?' + params.toString() : ''}`);
+  },
+  // URL de download (use em <a href> ou window.location): o navegador grava
+  // o arquivo direto em disco, sem carregar as linhas no JavaScript
+  exportarUrl: (filtros = {}, formato = 'csv') => {
+    const params = new URLSearchParams({ format: formato });
+    
+    if (filtros.projeto_id) params.append('projeto_id', filtros.projeto_id);
+    if (filtros.squad_id) params.append('squad_id', filtros.squad_id);
+    if (filtros.status) params.append('status', filtros.status);
+    if (filtros.prioridade) params.append('prioridade', filtros.prioridade);
+    
+    return `${API_URL}/atividades/export?${params.toString()}`;
+  },
+};
+
+// Timeline (Gantt): resposta colunar, um array por campo
+export const timelineService = {
+  carregar: (filtros = {}) => {
+    const params = new URLSearchParams();
+    
+    if (filtros.from) params.append('from', filtros.from);
+    if (filtros.to) params.append('to', filtros.to);
+    if (filtros.projeto_id) params.append('projeto_id', filtros.projeto_id);
+    if (filtros.squad_id) params.append('squad_id', filtros.squad_id);
+    
+    return api.get(`/timeline${params.toString() ? '?' + params.toString() : ''}`);
+  },
+};
+
+// Eventos de alteração (SSE): chama aoAlterar({entity, id, op, version}) a cada
+// alteração e aoResetar() quando eventos foram perdidos. Sem o stream (503: o
+// servidor atingiu o limite de conexões), chama aoConsultar() a cada 30 s até
+// conseguir reconectar. Retorna a função que fecha o stream
+export const eventoService = {
+  assinar: (aoAlterar, aoResetar, aoConsultar) => {
+    let fonte = null;
+    let espera = null;
+    let consulta = null;
+    let fechado = false;
+
+    const pararConsulta = () => {
+      clearInterval(consulta);
+      consulta = null;
+    };
+
+    const conectar = (reconexao) => {
+      fonte = new EventSource(`${API_URL}/eventos`);
+      fonte.addEventListener('alteracao', (e) => aoAlterar(JSON.parse(e.data)));
+      fonte.addEventListener('reset', () => aoResetar && aoResetar());
+      // Um EventSource novo não envia Last-Event-ID: o que mudou no intervalo se perdeu
+      fonte.onopen = () => {
+        pararConsulta();
+        if (reconexao && aoResetar) aoResetar();
+      };
+      fonte.onerror = () => {
+        // Erros de rede reconectam sozinhos; 503 (limite de conexões) fecha o EventSource
+        if (fonte.readyState === EventSource.CLOSED && !fechado) {
+          if (aoConsultar && !consulta) consulta = setInterval(aoConsultar, 30000);
+          espera = setTimeout(() => conectar(true), 30000);
+        }
+      };
+    };
+
+    conectar(false);
+    return () => {
+      fechado = true;
+      clearTimeout(espera);
+      pararConsulta();
+      if (fonte) fonte.close();
+    };
+  },
+};
+
+// Sincronização incremental: cursor() antes de carregar as listas e, depois,
+// alteracoes(cursor) traz só o que mudou ({cursor, alterados, removidos, has_more})
+export const sincronizacaoService = {
+  cursor: () => api.get('/sync'),
+  alteracoes: (since) => api.get(`/sync?since=${since}`),
 };
 
 export const usuarioService = {
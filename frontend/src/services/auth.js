@@ -39,14 +39,34 @@ axios.interceptors.response.use(
   }
 );
 
+// Login recusado com 503 (pool de hash de senhas cheio em um pico de logins):
+// repete após o Retry-After, com um atraso aleatório para não voltarem todos
+// juntos, até LOGIN_ESPERA_MAXIMA_MS
+const LOGIN_ESPERA_MAXIMA_MS = 60000;
+
+const esperar = (ms) => new Promise((resolve) => setTimeout(resolve, ms));
+
 export const authService = {
   // Login
   login: async (login, senha, lembrar = false) => {
-    const response = await axios.post(`${API_URL}/auth/login`, {
-      login,
-      senha,
-      lembrar
-    });
+    const limite = Date.now() + LOGIN_ESPERA_MAXIMA_MS;
+    let response;
+    for (;;) {
+      try {
+        response = await axios.post(`${API_URL}/auth/login`, {
+          login,
+          senha,
+          lembrar
+        });
+        break;
+      } catch (error) {
+        if (!error.response || error.response.status !== 503) throw error;
+        const retryAfter = parseInt(error.response.headers['retry-after'], 10);
+        const espera = (Number.isNaN(retryAfter) ? 1 : retryAfter) * 1000 + Math.random() * 1000;
+        if (Date.now() + espera > limite) throw error;
+        await esperar(espera);
+      }
+    }
     
     if (response.data.token) {
       localStorage.setItem('token', response.data.token);
@@ -56,8 +76,14 @@ export const authService = {
     return response.data;
   },
 
-  // Logout
+  // Logout: revoga o token na API (sem esperar a resposta) e limpa a sessão
   logout: () => {
+    const token = localStorage.getItem('token');
+    if (token) {
+      axios.post(`${API_URL}/auth/logout`, null, {
+        headers: { Authorization: `Bearer ${token}` }
+      }).catch(() => {});
+    }
     localStorage.removeItem('token');
     localStorage.removeItem('usuario');
   },
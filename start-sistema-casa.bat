@@ -6,7 +6,7 @@ echo ====================================
 echo.
 
 echo [1/2] Iniciando Backend...
-start "Backend - Flask" cmd /k "cd backend && python run.py"
+start "Backend - Flask" cmd /k "cd backend && python wsgi.py"
 
 echo [2/2] Aguardando 3 segundos...
 timeout /t 3 /nobreak >nul